@@ -4,12 +4,15 @@ Enhanced Batch Executive Extractor
 Processes companies from JSON (chat agent) or CSV files and extracts executive information.
 """
 
+import os
 import sys
 import json
 import time
+import threading
 import argparse
 import logging
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 import pandas as pd
 
@@ -18,7 +21,12 @@ from content_scraper import ContentScraper
 from executive_extractor import ExecutiveExtractor
 from data_exporter import DataExporter
 from data_loader import DataLoader
-from config import BATCH_CONFIG, CXO_POSITIONS
+from config import BATCH_CONFIG, CACHE_CONFIG, CXO_POSITIONS
+from cache_store import get_all_cache_stats
+from llm_client import chat_completion
+from company_matcher import CompanyMatcher
+from metrics import metrics, timed, count, diff_snapshots, write_report
+import cassette
 
 class BatchExtractor:
     def __init__(self):
@@ -27,11 +35,13 @@ class BatchExtractor:
         self.executive_extractor = ExecutiveExtractor()
         self.data_exporter = DataExporter()
         self.data_loader = DataLoader()
+        self.company_matcher = CompanyMatcher(getattr(self.executive_extractor, 'client', None))
         
         # Setup logging
         self.setup_logging()
         
         # Load progress tracking
+        self._progress_lock = threading.RLock()
         self.progress_file = BATCH_CONFIG['progress_file']
         self.progress_data = self.load_progress()
     
@@ -65,9 +75,24 @@ class BatchExtractor:
             }
     
     def save_progress(self):
-        """Save progress tracking data"""
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(self.progress_data, f, indent=2, ensure_ascii=False)
+        """Save progress tracking data (atomically, so readers never see a partial file)"""
+        with self._progress_lock:
+            temp_file = f"{self.progress_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.progress_data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, self.progress_file)
+    
+    def update_progress(self, company_name: str, executives_found: int, last_processed_company: Optional[str]):
+        """Record a finished company and persist progress (safe to call from worker threads)"""
+        with self._progress_lock:
+            if last_processed_company:
+                self.progress_data['last_processed_company'] = last_processed_company
+            self.progress_data['processed_companies'].append(company_name)
+            self.progress_data['last_processing_date'] = datetime.now().strftime('%Y-%m-%d')
+            self.progress_data['total_companies_processed'] += 1
+            self.progress_data['total_executives_found'] += executives_found
+            
+            self.save_progress()
     
     def load_companies_from_csv(self) -> List[Dict[str, Any]]:
         """Load companies from CSV file (legacy method for backward compatibility)"""
@@ -130,6 +155,7 @@ class BatchExtractor:
         self.logger.info(f"Filtered to {len(filtered)} specific companies")
         return filtered
     
+    @timed('company.queries')
     def generate_company_queries(self, company: Dict[str, Any]) -> List[str]:
         """Generate optimized search queries for a company using LLM"""
         company_name = company['name']
@@ -165,14 +191,14 @@ class BatchExtractor:
                 {company_name} board of directors current members linkedin
                 """
                 
-                response = self.executive_extractor.client.chat.completions.create(
+                content = chat_completion(
+                    self.executive_extractor.client,
+                    'generate_queries',
                     model="gpt-3.5-turbo",
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=200,
                     temperature=0.3
-                )
-                
-                content = response.choices[0].message.content.strip()
+                ).strip()
                 
                 # Parse the queries
                 queries = [line.strip() for line in content.split('\n') if line.strip()]
@@ -212,6 +238,7 @@ class BatchExtractor:
         self.logger.info(f"Generated {len(queries)} fallback queries for {company_name}")
         return queries
     
+    @timed('company.process')
     def process_single_company(self, company: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process a single company and extract executives with smart optimization"""
         company_name = company['name']
@@ -241,7 +268,8 @@ class BatchExtractor:
                 # Search for content with this query
                 search_results = self.serpapi_searcher.search_google(
                     query, 
-                    max_results=BATCH_CONFIG.get('max_results_per_query', 5)
+                    max_results=BATCH_CONFIG.get('max_results_per_query', 5),
+                    query_class='executive_team'
                 )
                 
                 if not search_results:
@@ -249,30 +277,21 @@ class BatchExtractor:
                 
                 self.logger.info(f"Found {len(search_results)} search results for query: {query}")
                 
-                # Process search results with early termination
-                for result_idx, result in enumerate(search_results):
-                    if len(all_executives) >= target_executive_count:
-                        self.logger.info(f"✅ Reached target executive count, stopping at result {result_idx + 1}")
-                        break
-                    
-                    try:
-                        # Scrape single article
-                        article = self.content_scraper.process_single_article(result['url'])
-                        if not article:
-                            continue
-                        
-                        # Add search metadata
-                        article.update({
-                            'search_title': result['title'],
-                            'search_snippet': result['snippet'],
-                            'search_query': query
-                        })
-                        
-                        all_articles.append(article)
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Error processing result {result_idx + 1}: {e}")
+                # Fetch all result pages for this query concurrently
+                articles = self.content_scraper.fetch_many([result['url'] for result in search_results])
+                
+                for result, article in zip(search_results, articles):
+                    if not article:
                         continue
+                    
+                    # Add search metadata
+                    article.update({
+                        'search_title': result['title'],
+                        'search_snippet': result['snippet'],
+                        'search_query': query
+                    })
+                    
+                    all_articles.append(article)
                 
                 # Delay between queries
                 if query_idx < len(queries) - 1:
@@ -284,64 +303,149 @@ class BatchExtractor:
                 self.logger.info(f"Processing {len(all_articles)} articles for executive extraction and enrichment...")
                 all_executives = self.executive_extractor.extract_executives_from_articles(all_articles)
                 
+                # Use LLM-based company name matching if enabled (one batched request per company)
+                if BATCH_CONFIG['llm_company_matching']:
+                    matched_names = self.match_company_names(
+                        [executive.get('bank', '') for executive in all_executives], company_name
+                    )
+                else:
+                    matched_names = [company_name] * len(all_executives)
+                
                 # Add company metadata to all executives
-                for executive in all_executives:
+                for executive, matched_name in zip(all_executives, matched_names):
                     executive['company_industry'] = company['industry']
-                    # Use LLM-based company name matching if enabled
-                    if BATCH_CONFIG['llm_company_matching']:
-                        executive['bank'] = self.match_company_name(executive.get('bank', ''), company_name)
-                    else:
-                        executive['bank'] = company_name
+                    executive['bank'] = matched_name
             
             self.logger.info(f"Extracted {len(all_executives)} unique executives for {company_name}")
+            count('company.process', 'executives', len(all_executives))
             return all_executives
             
         except Exception as e:
             self.logger.error(f"Error processing company {company_name}: {e}")
+            count('company.process', 'failed')
             return []
     
     def match_company_name(self, extracted_name: str, actual_name: str) -> str:
-        """Use LLM to match extracted company name with actual company name"""
-        if not extracted_name or extracted_name.lower() == actual_name.lower():
-            return actual_name
+        """Match a single extracted company name with the actual company name"""
+        return self.company_matcher.match(extracted_name or '', actual_name)
+    
+    @timed('company.match')
+    def match_company_names(self, extracted_names: List[str], actual_name: str) -> List[str]:
+        """
+        Match all extracted company names for one company
         
-        try:
-            # Use OpenAI to determine if the extracted name matches the actual company
-            if hasattr(self.executive_extractor, 'client') and self.executive_extractor.client:
-                prompt = f"""
-                Determine if these two company names refer to the same company:
+        Aliases and suffix variants are resolved locally; the remaining names
+        go to the LLM in a single request.
+        """
+        return self.company_matcher.match_many([name or '' for name in extracted_names], actual_name)
+    
+    def _process_companies_sequential(self, companies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process companies one at a time with a delay between them"""
+        all_executives = []
+        
+        for i, company in enumerate(companies):
+            try:
+                self.logger.info(f"\n📊 Progress: {i+1}/{len(companies)} - {company['name']}")
                 
-                Extracted name: "{extracted_name}"
-                Actual company name: "{actual_name}"
+                # Process company
+                company_executives = self.process_single_company(company)
+                all_executives.extend(company_executives)
                 
-                Return only "YES" if they are the same company, or "NO" if they are different.
-                Consider abbreviations, common variations, and parent/subsidiary relationships.
-                """
+                # Update and save progress after each company
+                self.update_progress(company['name'], len(company_executives), company['name'])
                 
-                response = self.executive_extractor.client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=10,
-                    temperature=0.1
-                )
+                # Delay between companies
+                if i < len(companies) - 1:
+                    delay = BATCH_CONFIG['delay_between_companies']
+                    self.logger.info(f"Waiting {delay} seconds before next company...")
+                    time.sleep(delay)
                 
-                result = response.choices[0].message.content.strip().upper()
-                if result == "YES":
-                    return actual_name
-                else:
-                    return extracted_name
-            else:
-                # Fallback to simple matching
-                if extracted_name.lower() in actual_name.lower() or actual_name.lower() in extracted_name.lower():
-                    return actual_name
-                return extracted_name
+            except KeyboardInterrupt:
+                self.logger.info("\n⏹️ Batch processing interrupted by user")
+                break
+            except Exception as e:
+                self.logger.error(f"Error processing company {company['name']}: {e}")
+                continue
+        
+        return all_executives
+    
+    def _process_companies_parallel(self, companies: List[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+        """
+        Process companies concurrently on a bounded worker pool
+        
+        External calls are throttled by the per-service caps in
+        BATCH_CONFIG['service_concurrency'], so no fixed delay is needed between
+        companies. Output keeps the input order regardless of completion order.
+        """
+        self.logger.info(f"⚡ Processing with {workers} parallel workers")
+        
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(companies)
+        completed = [False] * len(companies)
+        next_pending = 0
+        done_count = 0
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='company')
+        futures = {executor.submit(self.process_single_company, company): i for i, company in enumerate(companies)}
+        
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                company = companies[i]
+                
+                try:
+                    company_executives = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error processing company {company['name']}: {e}")
+                    company_executives = []
                 
+                results[i] = company_executives
+                completed[i] = True
+                done_count += 1
+                
+                # Resume point is the end of the contiguous completed prefix
+                while next_pending < len(companies) and completed[next_pending]:
+                    next_pending += 1
+                last_contiguous = companies[next_pending - 1]['name'] if next_pending else None
+                
+                self.update_progress(company['name'], len(company_executives), last_contiguous)
+                self.logger.info(f"📊 Progress: {done_count}/{len(companies)} - {company['name']} "
+                                 f"({len(company_executives)} executives)")
+        
+        except KeyboardInterrupt:
+            self.logger.info("\n⏹️ Batch processing interrupted by user")
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            executor.shutdown(wait=True)
+        
+        return [executive for company_executives in results if company_executives for executive in company_executives]
+    
+    def write_metrics_report(self, metrics_before: Dict[str, Any], run_started: datetime,
+                             companies: int, executives: int, workers: int):
+        """Log per-stage timings of this run and write them as JSON next to the progress file"""
+        stages = diff_snapshots(metrics.snapshot(), metrics_before)
+        wall_seconds = (datetime.now() - run_started).total_seconds()
+        
+        self.logger.info("⏱️ Stage timings (calls, total, mean, p95, errors):")
+        for stage, stats in stages.items():
+            if stats['count']:
+                self.logger.info(f"    {stage:<28} {stats['count']:>5} {stats['total_seconds']:>9.1f}s "
+                                 f"{stats['mean_seconds']:>7.2f}s {stats['p95_seconds']:>7.2f}s {stats['errors']:>4}")
+        
+        report_file = os.path.join(os.path.dirname(self.progress_file),
+                                   BATCH_CONFIG.get('metrics_report_file', 'batch_metrics.json'))
+        try:
+            write_report(report_file, stages,
+                         run_started=run_started.isoformat(),
+                         wall_seconds=round(wall_seconds, 2),
+                         companies=companies,
+                         executives=executives,
+                         workers=workers)
+            self.logger.info(f"📈 Metrics report written to {report_file}")
         except Exception as e:
-            self.logger.warning(f"LLM company matching failed: {e}")
-            return actual_name
+            self.logger.warning(f"Could not write metrics report: {e}")
     
     def run(self, recent_days: Optional[int] = None, specific_companies: Optional[List[str]] = None, resume: bool = False, 
-            source: str = 'csv', json_data: str = None):
+            source: str = 'csv', json_data: str = None, workers: Optional[int] = None):
         """Main batch processing function"""
         self.logger.info("🚀 Starting Enhanced Batch Executive Extractor")
         self.logger.info("="*60)
@@ -380,41 +484,54 @@ class BatchExtractor:
         self.logger.info(f"Processing {len(companies_to_process)} companies")
         
         # Process companies
-        all_executives = []
-        processed_count = 0
+        if workers is None:
+            workers = BATCH_CONFIG.get('max_workers', 1)
         
-        for i, company in enumerate(companies_to_process):
-            try:
-                self.logger.info(f"\n📊 Progress: {i+1}/{len(companies_to_process)} - {company['name']}")
-                
-                # Process company
-                company_executives = self.process_single_company(company)
-                all_executives.extend(company_executives)
-                
-                # Update progress
-                self.progress_data['last_processed_company'] = company['name']
-                self.progress_data['processed_companies'].append(company['name'])
-                self.progress_data['last_processing_date'] = datetime.now().strftime('%Y-%m-%d')
-                self.progress_data['total_companies_processed'] += 1
-                self.progress_data['total_executives_found'] += len(company_executives)
-                
-                processed_count += 1
-                
-                # Save progress after each company
-                self.save_progress()
-                
-                # Delay between companies
-                if i < len(companies_to_process) - 1:
-                    delay = BATCH_CONFIG['delay_between_companies']
-                    self.logger.info(f"Waiting {delay} seconds before next company...")
-                    time.sleep(delay)
-                
-            except KeyboardInterrupt:
-                self.logger.info("\n⏹️ Batch processing interrupted by user")
-                break
-            except Exception as e:
-                self.logger.error(f"Error processing company {company['name']}: {e}")
-                continue
+        run_started = datetime.now()
+        metrics_before = metrics.snapshot()
+        # The gateway is shared process-wide, so report this run's share only
+        gateway = self.executive_extractor.client
+        gateway_before = gateway.get_stats() if gateway else {}
+        
+        if workers > 1:
+            all_executives = self._process_companies_parallel(companies_to_process, workers)
+        else:
+            all_executives = self._process_companies_sequential(companies_to_process)
+        
+        self.write_metrics_report(metrics_before, run_started, len(companies_to_process), len(all_executives), workers)
+        
+        # Report cache effectiveness (search results, pages)
+        for namespace, cache_stats in get_all_cache_stats().items():
+            self.logger.info(f"💾 {namespace.capitalize()} cache: {cache_stats['hits']} hits, "
+                             f"{cache_stats['misses']} misses (hit rate {cache_stats['hit_rate']:.0%}, "
+                             f"{cache_stats['entries']} entries)")
+            for label, counts in cache_stats['by_label'].items():
+                self.logger.info(f"    {label}: {counts['hits']} hits, {counts['misses']} misses")
+        
+        # Report page download savings
+        download_stats = self.content_scraper.get_download_stats()
+        aborted = (download_stats['aborted_content_type'] + download_stats['aborted_content_length'] +
+                   download_stats['aborted_stream'])
+        self.logger.info(f"📄 Pages downloaded: {download_stats['pages_downloaded']} "
+                         f"({download_stats['bytes_downloaded'] / 1024:.0f} KB), aborted early: {aborted} "
+                         f"({download_stats['bytes_saved'] / 1024:.0f} KB saved, not counting "
+                         f"{download_stats['aborted_unknown_size']} of unknown size)")
+
+        # Report how much page text the LLM extraction prompts left out
+        input_stats = self.executive_extractor.get_llm_input_stats()
+        if input_stats['articles']:
+            self.logger.info(f"🧠 LLM extraction input: {input_stats['articles']} articles "
+                             f"({input_stats['windowed']} trimmed to mention windows), "
+                             f"~{input_stats['tokens_sent']:,} tokens sent vs ~{input_stats['tokens_legacy']:,} "
+                             f"for the page heads ({input_stats['tokens_saved']:,} saved)")
+        
+        # Report this run's OpenAI traffic through the shared gateway
+        if gateway:
+            gateway_stats = {key: value - gateway_before.get(key, 0) for key, value in gateway.get_stats().items()}
+            self.logger.info(f"🤖 OpenAI requests: {gateway_stats['requests']} "
+                             f"({gateway_stats['retries']} retries: {gateway_stats['rate_limited']} rate limited, "
+                             f"{gateway_stats['server_errors']} server errors, {gateway_stats['timeouts']} timeouts; "
+                             f"{gateway_stats['failed']} failed)")
         
         # Export results
         if all_executives:
@@ -443,6 +560,9 @@ def main():
     parser.add_argument('--resume', action='store_true', help='Resume from last processed company')
     parser.add_argument('--source', choices=['csv', 'json'], default='csv', help='Data source type (csv or json)')
     parser.add_argument('--json-data', type=str, help='JSON data string (required when source=json)')
+    parser.add_argument('--workers', type=int, help='Number of companies to process concurrently (default from config)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the search, page and LLM caches for this run')
+    cassette.add_arguments(parser)
     
     args = parser.parse_args()
     
@@ -451,13 +571,18 @@ def main():
         print("Error: --json-data is required when --source=json")
         return
     
+    if args.no_cache:
+        CACHE_CONFIG['enabled'] = False
+    cassette.configure_from_args(args)
+    
     extractor = BatchExtractor()
     extractor.run(
         recent_days=args.recent,
         specific_companies=args.companies,
         resume=args.resume,
         source=args.source,
-        json_data=args.json_data
+        json_data=args.json_data,
+        workers=args.workers
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+WebSocket Broadcast Benchmark
+Broadcasts log lines to many clients with the old sequential loop and with
+ws_broadcaster.Broadcaster, first over in-memory sockets (optionally with one
+slow client) and then end to end over real WebSockets served by uvicorn
+(the receiving clients share the process and GIL, so that figure is a lower bound)
+
+Usage:
+    python benchmarks/bench_broadcast.py --messages 10000 --clients 50
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+import contextlib
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ws_broadcaster import Broadcaster
+
+
+class MemorySocket:
+    """Counts received messages; send_delay simulates a slow network/browser"""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = send_delay
+        self.received = 0
+
+    async def send_text(self, text: str):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        else:
+            await asyncio.sleep(0)
+        self.received += 1
+
+
+async def legacy_broadcast_log(connections, message: str, log_type: str = "info"):
+    """The previous broadcast_log: debug prints and a sequential await per client"""
+    print(f"[WebSocket Debug] Broadcasting: {message} (type: {log_type})")
+    print(f"[WebSocket Debug] Active connections: {len(connections)}")
+    message_data = {"type": "log", "log_type": log_type, "message": message,
+                    "timestamp": datetime.now().isoformat()}
+    for connection in connections:
+        try:
+            await connection.send_text(json.dumps(message_data))
+            print(f"[WebSocket Debug] Message sent successfully")
+        except Exception as e:
+            print(f"[WebSocket Debug] Failed to send message: {e}")
+            continue
+
+
+async def run_legacy(messages: int, clients: int, slow_delay: float):
+    sockets = [MemorySocket() for _ in range(clients)]
+    if slow_delay:
+        sockets[0].send_delay = slow_delay
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for i in range(messages):
+            await legacy_broadcast_log(sockets, f"Processing company {i}: Example Bank PJSC")
+        elapsed = time.perf_counter() - start
+    return elapsed, elapsed, min(s.received for s in sockets[1 if slow_delay else 0:])
+
+
+async def run_broadcaster(messages: int, clients: int, slow_delay: float, max_queue: int):
+    """
+    Publish like the pipeline does (yielding between log lines) and wait until
+    every fast client has received every line
+    """
+    broadcaster = Broadcaster(max_queue=max_queue, send_timeout=60)
+    sockets = [MemorySocket() for _ in range(clients)]
+    if slow_delay:
+        sockets[0].send_delay = slow_delay
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for socket in sockets:
+            broadcaster.connect(socket)
+
+        start = time.perf_counter()
+        for i in range(messages):
+            broadcaster.publish_log(f"Processing company {i}: Example Bank PJSC")
+            await asyncio.sleep(0)  # the pipeline awaits between log lines
+        publish_time = time.perf_counter() - start
+
+        fast = sockets[1:] if slow_delay else sockets
+        while min(s.received for s in fast) < messages:
+            await asyncio.sleep(0.001)
+        delivered_time = time.perf_counter() - start
+
+        for client in list(broadcaster.clients):
+            broadcaster.disconnect(client)
+    return publish_time, delivered_time, broadcaster.dropped
+
+
+def run_network(messages: int, clients: int, port: int):
+    """Publish through a Broadcaster inside uvicorn and count messages at real WebSocket clients"""
+    import uvicorn
+    import websockets
+    from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+    app = FastAPI()
+    broadcaster = Broadcaster(max_queue=messages + 10, send_timeout=60)
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept()
+        client = broadcaster.connect(websocket)
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            broadcaster.disconnect(client)
+
+    @app.post("/flood")
+    async def flood():
+        start = time.perf_counter()
+        for i in range(messages):
+            broadcaster.publish_log(f"Processing company {i}: Example Bank PJSC")
+            await asyncio.sleep(0)
+        return {"publish_seconds": time.perf_counter() - start}
+
+    server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning', ws='websockets'))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    async def main():
+        url = f"ws://127.0.0.1:{port}/ws"
+        connections = [await websockets.connect(url, max_queue=None) for _ in range(clients)]
+        while broadcaster.client_count < clients:
+            await asyncio.sleep(0.01)
+
+        async def drain(connection):
+            for _ in range(messages):
+                await connection.recv()
+
+        import httpx
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            flood_task = asyncio.create_task(client.post(f"http://127.0.0.1:{port}/flood", timeout=300))
+            await asyncio.gather(*(drain(c) for c in connections))
+            publish_seconds = (await flood_task).json()['publish_seconds']
+        elapsed = time.perf_counter() - start
+        for connection in connections:
+            await connection.close()
+        return publish_seconds, elapsed
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        result = asyncio.run(main())
+        server.should_exit = True
+        thread.join(timeout=10)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WebSocket broadcast throughput benchmark')
+    parser.add_argument('--messages', type=int, default=10000, help='Log lines broadcast')
+    parser.add_argument('--clients', type=int, default=50, help='Connected clients')
+    parser.add_argument('--slow-delay', type=float, default=0.005, help='Per-send delay of the one slow client')
+    parser.add_argument('--max-queue', type=int, default=1000, help='Broadcaster per-client queue bound')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--skip-network', action='store_true', help='Only run the in-memory comparison')
+    args = parser.parse_args()
+
+    total = args.messages * args.clients
+    print("\n" + "="*50)
+    print("📊 WEBSOCKET BROADCAST BENCHMARK")
+    print("="*50)
+    print(f"{args.messages:,} log lines x {args.clients} clients = {total:,} deliveries")
+
+    elapsed, _, _ = asyncio.run(run_legacy(args.messages, args.clients, 0))
+    print(f"Legacy loop, in-memory:           {elapsed:6.2f}s  ({total / elapsed:,.0f} deliveries/s)")
+
+    publish, delivered, _ = asyncio.run(run_broadcaster(args.messages, args.clients, 0, args.max_queue))
+    print(f"Broadcaster, in-memory:           {delivered:6.2f}s  ({total / delivered:,.0f} deliveries/s, "
+          f"publish {publish:.2f}s)")
+
+    if args.slow_delay:
+        legacy_messages = min(args.messages, 1000)
+        elapsed, _, _ = asyncio.run(run_legacy(legacy_messages, args.clients, args.slow_delay))
+        print(f"Legacy loop, 1 slow client:       {elapsed * args.messages / legacy_messages:6.2f}s  "
+              f"(extrapolated from {legacy_messages:,} lines; the pipeline waits this long)")
+        publish, delivered, dropped = asyncio.run(
+            run_broadcaster(args.messages, args.clients, args.slow_delay, args.max_queue))
+        print(f"Broadcaster, 1 slow client:       {delivered:6.2f}s  (publish {publish:.2f}s, "
+              f"{dropped:,} log lines dropped for the slow client)")
+
+    if not args.skip_network:
+        publish, elapsed = run_network(args.messages, args.clients, args.port)
+        print(f"Broadcaster, real WebSockets:     {elapsed:6.2f}s  ({total / elapsed:,.0f} deliveries/s, "
+              f"publish {publish:.2f}s)")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+CSV Export Benchmark
+Measures append latency of DataExporter against the old read-concat-rewrite path
+for executives.csv files of increasing size
+
+Usage:
+    python benchmarks/bench_export.py --sizes 10000 100000 1000000 --new-rows 5
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_exporter import DataExporter
+
+HEADER = ['Name', 'Title', 'Company', 'LinkedIn', 'Email', 'Source URL', 'Extraction Date',
+          'Batch_Mode', 'Processing_Date', 'Company_Industry']
+
+
+def write_history(path: str, rows: int):
+    """Write an executives.csv with the given number of synthetic rows"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(','.join(HEADER) + '\n')
+        for i in range(rows):
+            f.write(f"Executive {i},Chief Executive Officer,Company {i % 5000},linkedin.com/in/exec-{i},"
+                    f"exec{i}@company{i % 5000}.com,https://example.com/{i},2025-01-01,"
+                    f"Yes,2025-01-01 00:00:00,Banking\n")
+
+
+def legacy_append(df: pd.DataFrame, path: str):
+    """The previous append path: read everything, concat, rewrite"""
+    existing_df = pd.read_csv(path)
+    combined_df = pd.concat([existing_df, df], ignore_index=True)
+    combined_df.to_csv(path, index=False, encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DataExporter append latency benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Existing row counts to benchmark')
+    parser.add_argument('--new-rows', type=int, default=5, help='Executives appended per export')
+    parser.add_argument('--repeats', type=int, default=3, help='Appends timed per size (best is reported)')
+    args = parser.parse_args()
+
+    exporter = DataExporter()
+    executives = [{
+        'name': f'New Executive {i}', 'title': 'Chief Financial Officer', 'bank': 'Gulf Horizon Bank',
+        'linkedin': '', 'email': '', 'source_url': 'https://example.com/new', 'company_industry': 'Banking'
+    } for i in range(args.new_rows)]
+
+    workdir = tempfile.mkdtemp(prefix='bench_export_')
+    template = os.path.join(workdir, 'template.csv')
+    target = os.path.join(workdir, 'executives.csv')
+
+    print("\n" + "="*50)
+    print("📊 CSV EXPORT BENCHMARK")
+    print("="*50)
+    print(f"{'Existing rows':>14} {'append (ms)':>12} {'rewrite (ms)':>13} {'speedup':>8}")
+
+    try:
+        for size in args.sizes:
+            write_history(template, size)
+
+            append_times = []
+            rewrite_times = []
+            for _ in range(args.repeats):
+                shutil.copyfile(template, target)
+                start = time.perf_counter()
+                exporter.export_to_csv(executives, filename=target, append_mode=True, batch_mode=True)
+                append_times.append(time.perf_counter() - start)
+
+                shutil.copyfile(template, target)
+                df = pd.DataFrame([{column: 'x' for column in HEADER} for _ in executives])
+                start = time.perf_counter()
+                legacy_append(df, target)
+                rewrite_times.append(time.perf_counter() - start)
+
+            append_ms = min(append_times) * 1000
+            rewrite_ms = min(rewrite_times) * 1000
+            print(f"{size:>14,} {append_ms:>12.1f} {rewrite_ms:>13.1f} {rewrite_ms / append_ms:>7.0f}x")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
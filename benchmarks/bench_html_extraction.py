@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+HTML Extraction Benchmark
+Measures pages/sec for each extraction backend over a corpus of saved pages
+
+Usage:
+    python benchmarks/bench_html_extraction.py --corpus benchmarks/fixtures/pages --rounds 50
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_extractor import available_backends, get_extractor
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML extraction backend benchmark')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='Directory of saved .html pages')
+    parser.add_argument('--rounds', type=int, default=50, help='Passes over the corpus per backend')
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(args.corpus, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+
+    if not pages:
+        print(f"❌ No .html pages found in {args.corpus}")
+        return
+
+    print("\n" + "="*50)
+    print("📊 HTML EXTRACTION BENCHMARK")
+    print("="*50)
+    print(f"Corpus: {len(pages)} pages ({sum(len(p) for p in pages) / 1024:.0f} KB), {args.rounds} rounds")
+
+    outputs = {}
+    for backend in available_backends():
+        extractor = get_extractor(backend)
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            results = [extractor.extract(page) for page in pages]
+        elapsed = time.perf_counter() - start
+        outputs[backend] = [(r['title'], ' '.join(r['text'].split())) for r in results]
+        print(f"{backend:>5}: {len(pages) * args.rounds / elapsed:8.1f} pages/sec")
+
+    if len(outputs) > 1:
+        reference = outputs['bs4']
+        for backend, output in outputs.items():
+            if backend != 'bs4':
+                print(f"{backend} output identical to bs4: {output == reference}")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
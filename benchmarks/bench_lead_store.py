@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Lead Store Benchmark
+Builds a synthetic LeadStore and times the /api/records filter, paging and search queries
+
+Usage:
+    python benchmarks/bench_lead_store.py --rows 1000000 --companies 20000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lead_store import LeadStore
+
+FIRST_NAMES = ['Ahmed', 'Mohammed', 'Fatima', 'Sara', 'Omar', 'Khalid', 'Layla', 'Yousef', 'Hessa', 'Rashid',
+               'John', 'Priya', 'David', 'Elena', 'Rahul', 'Aisha', 'Tariq', 'Noura', 'James', 'Mei']
+LAST_NAMES = ['Al Mansoori', 'Al Hashimi', 'Haddad', 'Khoury', 'Nasser', 'Saleh', 'Farouk', 'Smith', 'Patel',
+              'Chen', 'Rossi', 'Kapoor', 'Al Suwaidi', 'Al Falasi', 'Ibrahim', 'Aziz', 'Mahmoud', 'Yilmaz',
+              'Fernandes', 'Okafor']
+COMPANY_PREFIXES = ['Emirates', 'Gulf', 'Desert', 'Falcon', 'Pearl', 'Oasis', 'Horizon', 'Crescent', 'Dune',
+                    'Marina', 'Palm', 'Arabian', 'Union', 'Sahara', 'Najm', 'Noor', 'Jumeirah', 'Creek', 'Harbor',
+                    'Golden', 'Blue', 'Green', 'Summit', 'Atlas', 'Meridian', 'Sapphire', 'Emerald', 'Coral',
+                    'Mirage', 'Saffron', 'Cedar', 'Lotus', 'Orbit', 'Beacon', 'Zenith', 'Aurora', 'Vertex',
+                    'Solace', 'Tamarind', 'Wadi']
+COMPANY_MIDDLES = ['Islamic', 'Investment', 'Commercial', 'Development', 'Global', 'International', 'Regional',
+                   'Strategic', 'Heritage', 'Future', 'Prime', 'United', 'Royal', 'Modern', 'Sovereign', 'Metro',
+                   'Pioneer', 'Alliance', 'Frontier', 'Vision', 'Legacy', 'Pinnacle', 'Keystone', 'Harmony',
+                   'Unity']
+COMPANY_KINDS = ['Bank', 'Capital', 'Investments', 'Partners', 'Ventures', 'Finance', 'Insurance', 'Securities',
+                 'Properties', 'Energy', 'Logistics', 'Trading', 'Advisors', 'Brokerage', 'Exchange', 'Leasing',
+                 'Asset Management', 'Takaful', 'Payments', 'Fund']
+
+TITLES = ['Chief Executive Officer', 'Chief Financial Officer', 'Chief Operating Officer',
+          'Chief Technology Officer', 'Chief Risk Officer', 'Chairman', 'Managing Director',
+          'Head of Investor Relations', 'General Counsel', 'Chief Investment Officer']
+
+
+def build_store(path: str, rows: int, companies: int, batch_size: int = 20000) -> LeadStore:
+    """Fill a fresh store with synthetic executives through the normal upsert path"""
+    store = LeadStore(path)
+    run_id = store.start_run('benchmark')
+    rng = random.Random(42)
+
+    batch = []
+    for i in range(rows):
+        c = i % companies
+        company = (f"{COMPANY_PREFIXES[c % 40]} {COMPANY_MIDDLES[(c // 40) % 25]} "
+                   f"{COMPANY_KINDS[(c // 1000) % 20]}")
+        name = (f"{FIRST_NAMES[rng.randrange(20)]} {FIRST_NAMES[rng.randrange(20)]} "
+                f"{LAST_NAMES[rng.randrange(20)]}")
+        batch.append({
+            'name': name,
+            'title': TITLES[rng.randrange(len(TITLES))],
+            'company': company,
+            'linkedin': f"linkedin.com/in/exec-{i}" if rng.random() < 0.4 else '',
+            'email': f"exec{i}@company{c}.com" if rng.random() < 0.2 else '',
+            'confidence': 0.8,
+            'extraction_method': 'openai',
+            'company_industry': 'Banking',
+            'source_url': f"https://news.example.com/{c}/leadership",
+            'source_title': f"{company} announces leadership team",
+            'extraction_date': '2025-01-01',
+            'processing_date': '2025-01-01 00:00:00',
+            'batch_mode': 'Yes'
+        })
+        if len(batch) >= batch_size:
+            store._write_rows(batch, run_id)
+            batch = []
+    if batch:
+        store._write_rows(batch, run_id)
+
+    store.finish_run(run_id, rows)
+    store.analyze()
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LeadStore filter/paging benchmark')
+    parser.add_argument('--rows', type=int, default=1000000, help='Executives written to the synthetic store')
+    parser.add_argument('--companies', type=int, default=20000, help='Distinct companies')
+    parser.add_argument('--db', help='Reuse an existing benchmark database instead of building one')
+    parser.add_argument('--repeats', type=int, default=20, help='Timed runs per query (median reported)')
+    args = parser.parse_args()
+
+    if args.db and os.path.exists(args.db):
+        store = LeadStore(args.db)
+    else:
+        path = args.db or os.path.join(tempfile.mkdtemp(prefix='bench_store_'), 'leads.sqlite3')
+        start = time.perf_counter()
+        store = build_store(path, args.rows, args.companies)
+        print(f"Built {store.count():,} executives in {time.perf_counter() - start:.1f}s ({path})")
+
+    queries = {
+        'first page': {},
+        'deep page (offset 500k)': {'offset': min(500000, args.rows // 2)},
+        'company filter': {'company': 'Falcon Islamic'},
+        'position filter': {'position': 'financial'},
+        'has email': {'has_email': True},
+        'no linkedin': {'has_linkedin': False},
+        'company + email': {'company': 'Emirates', 'has_email': True},
+        'rare position': {'position': 'nonexistent title'},
+    }
+
+    print("\n" + "="*50)
+    print("📊 LEAD STORE QUERY BENCHMARK")
+    print("="*50)
+    for label, params in queries.items():
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            result = store.query_records(limit=100, **params)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"{label:>24}: {timings[len(timings) // 2] * 1000:7.2f} ms  "
+              f"({len(result['records'])} rows, total {result['total']:,})")
+
+    searches = ['ceo', 'chief financial officer falcon', 'fatima al hashimi', 'investor rel',
+                'emirates islamic bank', 'sapphire unity takaful cfo']
+    for text in searches:
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            result = store.search(text, limit=50)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"{'search ' + repr(text):>24}: {timings[len(timings) // 2] * 1000:7.2f} ms  "
+              f"({len(result['records'])} rows, total {result['total']:,})")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
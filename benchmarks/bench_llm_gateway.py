@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+LLM Gateway Benchmark
+Sends chat completions to the local fake OpenAI server (fake_services) with
+simulated latency and injected 429/5xx errors:
+
+    legacy    the previous path: a synchronous openai.OpenAI client, one call at a time
+    gateway   LLMGateway, all requests submitted at once from --threads workers
+
+Reports wall time, requests/sec, retries and how many requests the server
+saw at once (never more than --concurrency through the gateway).
+
+Usage:
+    python benchmarks/bench_llm_gateway.py --requests 200 --latency 0.2 --fail-every 10
+    python benchmarks/bench_llm_gateway.py --rpm 600 --error-status 503
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['OPENAI_API_KEY'] = 'benchmark-key'
+os.environ.setdefault('SERPAPI_KEY', 'benchmark-key')
+
+from fake_services import FakeOpenAIHandler, start_server
+
+
+def request_params(i: int):
+    return {
+        'model': 'gpt-3.5-turbo',
+        'messages': [{'role': 'user', 'content': f"Extract email address from this search result #{i}"}],
+        'max_tokens': 50,
+        'temperature': 0.1
+    }
+
+
+def reset_server():
+    FakeOpenAIHandler.requests_received = 0
+    FakeOpenAIHandler.requests_served = 0
+    FakeOpenAIHandler.max_in_flight = 0
+
+
+def run_legacy(base_url: str, requests: int):
+    """Sequential calls through the synchronous client (with its default retries)"""
+    import openai
+    client = openai.OpenAI(api_key='benchmark-key', base_url=base_url)
+    failed = 0
+    start = time.perf_counter()
+    for i in range(requests):
+        try:
+            client.chat.completions.create(**request_params(i))
+        except openai.APIError:
+            failed += 1
+    return time.perf_counter() - start, failed
+
+
+def run_gateway(base_url: str, requests: int, threads: int, concurrency: int, config: dict):
+    """Workers submit through one shared LLMGateway and wait for their results"""
+    from llm_gateway import LLMGateway
+    gateway = LLMGateway(base_url=base_url, max_concurrency=concurrency, config=config)
+
+    def work(i):
+        try:
+            gateway.complete(**request_params(i))
+            return 0
+        except Exception:
+            return 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        failed = sum(pool.map(work, range(requests)))
+    elapsed = time.perf_counter() - start
+    stats = gateway.get_stats()
+    gateway.close()
+    return elapsed, failed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI gateway throughput benchmark')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.2, help='Fake server seconds per request')
+    parser.add_argument('--fail-every', type=int, default=10, help='Every Nth request fails (0: never)')
+    parser.add_argument('--error-status', type=int, default=429, help='Status of injected failures')
+    parser.add_argument('--retry-after', type=float, default=None, help='Retry-After seconds sent with failures')
+    parser.add_argument('--threads', type=int, default=32, help='Worker threads calling the gateway')
+    parser.add_argument('--concurrency', type=int, default=8, help='Gateway requests in flight at once')
+    parser.add_argument('--rpm', type=int, default=None, help='Gateway requests per minute (default: unlimited)')
+    parser.add_argument('--burst-seconds', type=float, default=1, help='Limiter capacity in seconds of rate')
+    parser.add_argument('--backoff', type=float, default=0.1, help='Gateway backoff base seconds')
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    FakeOpenAIHandler.load()
+    FakeOpenAIHandler.latency = args.latency
+    FakeOpenAIHandler.fail_every = args.fail_every
+    FakeOpenAIHandler.error_status = args.error_status
+    FakeOpenAIHandler.retry_after = args.retry_after
+    _, server_url = start_server(FakeOpenAIHandler)
+    base_url = f"{server_url}/v1"
+
+    print("\n" + "="*50)
+    print("📊 LLM GATEWAY BENCHMARK")
+    print("="*50)
+    print(f"{args.requests} requests, {args.latency * 1000:.0f} ms latency, "
+          f"every {args.fail_every or '∞'}th request fails with {args.error_status}")
+
+    if not args.skip_legacy:
+        reset_server()
+        elapsed, failed = run_legacy(base_url, args.requests)
+        print(f"Legacy sync client:   {elapsed:6.2f}s  {args.requests / elapsed:7.1f} req/s  "
+              f"{failed} failed, {FakeOpenAIHandler.requests_received - args.requests + failed} retried, "
+              f"max {FakeOpenAIHandler.max_in_flight} in flight")
+
+    reset_server()
+    config = {'requests_per_minute': args.rpm, 'tokens_per_minute': None, 'burst_seconds': args.burst_seconds,
+              'backoff_base_seconds': args.backoff, 'backoff_max_seconds': 5}
+    elapsed, failed, stats = run_gateway(base_url, args.requests, args.threads, args.concurrency, config)
+    print(f"LLMGateway:           {elapsed:6.2f}s  {args.requests / elapsed:7.1f} req/s  "
+          f"{failed} failed, {stats['retries']} retried "
+          f"({stats['rate_limited']} rate limited, {stats['server_errors']} server errors), "
+          f"max {FakeOpenAIHandler.max_in_flight} in flight")
+    if args.rpm:
+        print(f"Achieved rate: {args.requests / elapsed * 60:,.0f} requests/min "
+              f"(limit {args.rpm:,} after a burst of {args.rpm / 60 * args.burst_seconds:.0f})")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
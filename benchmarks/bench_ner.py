@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+spaCy NER Benchmark
+Runs the rule-based executive extraction of ExecutiveExtractor over a saved
+corpus of pages three ways and reports pages/sec for each:
+
+    legacy    full pipeline, one nlp() call per article on its whole text
+    batched   NER-only pipeline, articles batched through nlp.pipe
+    windowed  batched, and only the text around CXO title mentions analysed
+
+The corpus is benchmarks/fixtures/pages or a directory of saved .html pages,
+parsed once with html_extractor. Extracted (name, title) pairs are compared
+with the legacy run. Needs the spaCy model named in NER_CONFIG.
+
+Usage:
+    python benchmarks/bench_ner.py --rounds 50
+    python benchmarks/bench_ner.py --corpus saved_pages/ --batch-size 32 --n-process 2
+"""
+
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+# The OpenAI path is not measured; keep the extractor from creating a client
+os.environ['OPENAI_API_KEY'] = ''
+os.environ.setdefault('SERPAPI_KEY', 'benchmark-key')
+
+from config import NER_CONFIG
+from fake_services import FIXTURES_DIR
+
+
+def load_corpus(directory: str):
+    """Parse every .html page in directory into an article dict"""
+    from html_extractor import get_extractor
+    extractor = get_extractor()
+    articles = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(('.html', '.htm')):
+            continue
+        with open(os.path.join(directory, name), 'rb') as f:
+            parsed = extractor.extract(f.read())
+        if parsed['text']:
+            articles.append({'url': f"file://{name}", 'title': parsed['title'], 'text': parsed['text']})
+    return articles
+
+
+def run_legacy(extractor, full_nlp, articles):
+    """The previous _extract_with_spacy: one full-pipeline nlp() call per article"""
+    NER_CONFIG['window_chars'] = 0
+    trimmed_nlp, extractor.nlp = extractor.nlp, full_nlp
+    try:
+        return [extractor._extract_with_spacy(extractor._article_text(article), article) for article in articles]
+    finally:
+        extractor.nlp = trimmed_nlp
+
+
+def run_batched(extractor, articles, window_chars: int):
+    NER_CONFIG['window_chars'] = window_chars
+    return [extractor._extract_with_spacy(extractor._article_text(article), article, entities)
+            for _, article, entities in extractor._articles_with_entities(articles)]
+
+
+def pairs(found):
+    return {(executive['name'], executive['title']) for executives in found for executive in executives}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='spaCy NER extraction throughput benchmark')
+    parser.add_argument('--corpus', default=os.path.join(FIXTURES_DIR, 'pages'),
+                        help='Directory of saved .html pages')
+    parser.add_argument('--rounds', type=int, default=50, help='Times the corpus is repeated')
+    parser.add_argument('--batch-size', type=int, default=NER_CONFIG['batch_size'])
+    parser.add_argument('--n-process', type=int, default=NER_CONFIG['n_process'])
+    parser.add_argument('--window-chars', type=int, default=NER_CONFIG['window_chars'])
+    args = parser.parse_args()
+
+    import spacy
+    if not spacy.util.is_package(NER_CONFIG['model']):
+        sys.exit(f"spaCy model {NER_CONFIG['model']} is not installed "
+                 f"(python -m spacy download {NER_CONFIG['model']})")
+
+    from executive_extractor import ExecutiveExtractor
+    NER_CONFIG['batch_size'] = args.batch_size
+    NER_CONFIG['n_process'] = args.n_process
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        extractor = ExecutiveExtractor()
+    full_nlp = spacy.load(NER_CONFIG['model'])
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        sys.exit(f"No pages with text in {args.corpus}")
+    articles = corpus * args.rounds
+
+    print("\n" + "="*50)
+    print("📊 SPACY NER BENCHMARK")
+    print("="*50)
+    print(f"{len(corpus)} pages x {args.rounds} rounds = {len(articles):,} articles, "
+          f"{sum(len(a['title']) + len(a['text']) for a in articles):,} characters")
+    print(f"Pipeline: {', '.join(full_nlp.pipe_names)} -> {', '.join(extractor.nlp.pipe_names)}")
+    print(f"batch_size={args.batch_size}  n_process={args.n_process}  window_chars={args.window_chars}")
+
+    variants = [
+        ('Legacy (full pipeline, nlp())', lambda: run_legacy(extractor, full_nlp, articles)),
+        ('Batched (NER only, nlp.pipe)', lambda: run_batched(extractor, articles, 0)),
+        ('Windowed (batched + windows)', lambda: run_batched(extractor, articles, args.window_chars)),
+    ]
+    reference = None
+    for label, run in variants:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            run()  # warm-up
+            start = time.perf_counter()
+            found = run()
+            elapsed = time.perf_counter() - start
+        found = pairs(found)
+        if reference is None:
+            reference = found
+            match = f"{len(found)} executives"
+        else:
+            match = "same executives" if found == reference else \
+                f"{len(reference - found)} missing, {len(found - reference)} extra"
+        print(f"{label:32s} {elapsed:6.2f}s  {len(articles) / elapsed:8.1f} pages/s  ({match})")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
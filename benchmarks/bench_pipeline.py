@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Offline Pipeline Benchmark
+Runs the extraction pipeline end to end against recorded fixtures and fake
+local services (SerpAPI, web pages, OpenAI), reports throughput and peak
+memory per stage and compares them with a stored baseline
+
+Stages:
+    scrape   ContentScraper._fallback_processing over the saved pages (pages/sec)
+    extract  ExecutiveExtractor.extract_from_single_article on the parsed pages (articles/sec)
+    company  BatchExtractor.process_single_company for fixtures/companies.json (companies/min)
+    export   DataExporter.export_to_csv into a fresh CSV and lead store (rows/sec)
+    records  /api/records served by web_app over the exported rows (requests/sec, rows/sec)
+
+extract and company use the spaCy model en_core_web_sm when it is
+installed and otherwise a rule-based stand-in (--ner stub) that tags the
+fixture executives and companies, so they always run offline; the NER used
+is part of the workload a baseline applies to. Delays and caches are
+disabled so the figures measure the code, not sleeps.
+
+Each stage runs once to warm up, once under tracemalloc for its peak Python
+allocations and then --repeats times untraced; the median untraced time
+counts. A fixed pure-Python calibration workload is timed before every
+pass, and throughput is compared with the baseline after scaling by the
+calibration speed of the same stage, so a host that is busier or faster
+than when the baseline was recorded does not read as a code change. The run
+fails (exit 1) when a throughput drops or a memory peak grows by more than
+--tolerance against the baseline, or when a result count (pages parsed,
+executives found, API calls made, rows served) differs.
+
+Usage:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --update-baseline
+    python benchmarks/bench_pipeline.py --stages scrape export records --tolerance 0.5
+"""
+
+import os
+import gc
+import sys
+import json
+import re
+import time
+import random
+import argparse
+import platform
+import statistics
+import resource
+import tempfile
+import threading
+import contextlib
+import tracemalloc
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # templates/ and static/ for web_app
+
+# Never reach the real APIs, whatever .env contains
+os.environ['SERPAPI_KEY'] = 'benchmark-key'
+os.environ['OPENAI_API_KEY'] = 'benchmark-key'
+
+from fake_services import (FIXTURES_DIR, FakeOpenAIHandler, FixturePageHandler, RecordedSerpAPIHandler,
+                           start_server)
+from bench_lead_store import FIRST_NAMES, LAST_NAMES, TITLES
+
+STAGES = ['scrape', 'extract', 'company', 'export', 'records']
+SPACY_MODEL = 'en_core_web_sm'
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'pipeline_baseline.json')
+
+# Arguments that change the work done; a baseline only applies to the same values
+WORKLOAD_ARGS = ('page_rounds', 'extract_rounds', 'export_rows', 'export_chunk', 'record_requests',
+                 'page_latency', 'serpapi_latency', 'openai_latency', 'ner')
+
+# Fewer timing passes than this give a median too noisy to gate on
+MIN_REPEATS = 3
+
+# Fixed input for the calibration workload
+_CALIBRATION_RECORDS = [{'name': f"Executive {i}", 'title': 'Chief Financial Officer', 'score': i * 0.5}
+                        for i in range(400)]
+
+# Memory growth below this is treated as noise whatever the tolerance
+MEMORY_SLACK_MB = 1.0
+
+
+def configure(workdir: str, page_latency: float, serpapi_latency: float, openai_latency: float) -> str:
+    """Start the fake services and point every client and output path at them"""
+    FixturePageHandler.latency = page_latency
+    RecordedSerpAPIHandler.latency = serpapi_latency
+    RecordedSerpAPIHandler.load()
+    FakeOpenAIHandler.latency = openai_latency
+    FakeOpenAIHandler.load()
+
+    _, pages_url = start_server(FixturePageHandler)
+    _, serpapi_url = start_server(RecordedSerpAPIHandler)
+    _, openai_url = start_server(FakeOpenAIHandler)
+    RecordedSerpAPIHandler.pages_url = pages_url
+    os.environ['OPENAI_BASE_URL'] = f"{openai_url}/v1"
+
+    import config
+    config.CACHE_CONFIG['enabled'] = False
+    config.SEARCH_CONFIG['backend_url'] = serpapi_url
+    config.SEARCH_CONFIG['requests_per_minute'] = 60000
+    config.SEARCH_CONFIG['burst'] = 1000
+    # The OpenAI rate limits would otherwise pace the extract and company stages
+    config.LLM_GATEWAY_CONFIG['requests_per_minute'] = None
+    config.LLM_GATEWAY_CONFIG['tokens_per_minute'] = None
+    # Every fixture page lives on one host; real result pages are spread over many
+    config.SCRAPING_CONFIG['per_domain_delay'] = 0
+    config.BATCH_CONFIG.update({
+        'delay_between_companies': 0,
+        'delay_between_queries': 0,
+        'delay_between_executives': 0,
+        'log_file': os.path.join(workdir, 'batch_logs.txt'),
+        'progress_file': os.path.join(workdir, 'batch_progress.json'),
+        'metrics_report_file': os.path.join(workdir, 'batch_metrics.json')
+    })
+    config.OUTPUT_CONFIG['csv_filename'] = os.path.join(workdir, 'executives.csv')
+    config.STORE_CONFIG['db_path'] = os.path.join(workdir, 'leads.sqlite3')
+    config.STORE_CONFIG['import_csv_on_first_use'] = False
+    return pages_url
+
+
+def spacy_model_available() -> bool:
+    try:
+        import spacy
+        return spacy.util.is_package(SPACY_MODEL)
+    except ImportError:
+        return False
+
+
+def fixture_entities():
+    """Executive names from the canned LLM replies and the fixture company names"""
+    with open(os.path.join(FIXTURES_DIR, 'llm_replies.json'), encoding='utf-8') as f:
+        rules = json.load(f)['rules']
+    with open(os.path.join(FIXTURES_DIR, 'companies.json'), encoding='utf-8') as f:
+        companies = [company['name'] for company in json.load(f)['companies']]
+
+    persons = set()
+    for rule in rules:
+        try:
+            reply = json.loads(rule.get('reply', ''))
+        except ValueError:
+            continue
+        if isinstance(reply, list):
+            for executive in reply:
+                name = executive.get('name', '')
+                persons.add(name)
+                persons.add(name.split('. ', 1)[-1])  # without "Dr."
+    return sorted(name for name in persons if name), companies
+
+
+def build_stub_ner(workdir: str) -> str:
+    """
+    Save a rule-based stand-in for the spaCy model and return its path
+
+    A blank English pipeline with an entity_ruler, named 'ner' so the
+    extractor's pipeline trimming keeps it, tagging the fixture executives
+    as PERSON and the fixture companies as ORG.
+    """
+    import spacy
+    persons, companies = fixture_entities()
+    nlp = spacy.blank('en')
+    ruler = nlp.add_pipe('entity_ruler', name='ner')
+    ruler.add_patterns([{'label': 'PERSON', 'pattern': name} for name in persons] +
+                       [{'label': 'ORG', 'pattern': name} for name in companies])
+    path = os.path.join(workdir, 'stub_ner')
+    nlp.to_disk(path)
+    return path
+
+
+def calibration_pass() -> float:
+    """
+    Seconds taken by a fixed pure-Python workload (JSON, regex, sorting)
+
+    It does the same work on every machine and in every run, so the ratio of
+    two calibration times measures how fast the host was running.
+    """
+    start = time.perf_counter()
+    for _ in range(5):
+        text = json.dumps(_CALIBRATION_RECORDS)
+        records = json.loads(text)
+        words = re.findall(r'[A-Za-z]+', text)
+        sorted(records, key=lambda record: (record['title'], -record['score']))
+        {word.lower(): len(word) for word in words}
+    return time.perf_counter() - start
+
+
+def measure(func, quiet, repeats: int, prepare=None):
+    """
+    Run func once to warm up, once under tracemalloc for its peak memory,
+    then repeats times untraced for timing
+
+    The warm-up pass takes first-call costs (imports, client and connection
+    setup, caches) out of both the memory peak and the timings. prepare(i),
+    when given, resets state before pass i. Returns (result of the traced
+    pass, median untraced seconds, peak MB above the starting level, median
+    calibration seconds next to the timed passes).
+    """
+    timings = []
+    calibrations = []
+    with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+        for i in range(repeats + 2):
+            if prepare:
+                prepare(i)
+            gc.collect()
+            if i == 0:
+                func()
+                continue
+            if i == 1:
+                tracemalloc.start()
+                result = func()
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                continue
+            calibrations.append(calibration_pass())
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings), peak_bytes / (1024 * 1024), statistics.median(calibrations)
+
+
+def synthetic_executives(rows: int):
+    rng = random.Random(7)
+    return [{
+        'name': f"{FIRST_NAMES[rng.randrange(20)]} {LAST_NAMES[rng.randrange(20)]} {i}",
+        'title': TITLES[rng.randrange(len(TITLES))],
+        'bank': f"Benchmark Company {i % 500}",
+        'linkedin': f"linkedin.com/in/bench-{i}" if rng.random() < 0.4 else '',
+        'email': f"exec{i}@company{i % 500}.com" if rng.random() < 0.2 else '',
+        'source_url': f"https://news.example.com/{i % 500}/leadership",
+        'company_industry': 'Banking'
+    } for i in range(rows)]
+
+
+def run_stages(args, pages_url: str, quiet):
+    """Run the selected stages; returns (throughput, memory_mb, results, calibration, skipped)"""
+    throughput, memory_mb, results, calibration, skipped = {}, {}, {}, {}, {}
+    articles = []
+
+    if 'scrape' in args.stages:
+        from content_scraper import ContentScraper
+        scraper = ContentScraper()
+        page_names = sorted(name for name in os.listdir(os.path.join(FIXTURES_DIR, 'pages')) if name.endswith('.html'))
+        urls = [f"{pages_url}/{name}" for name in page_names] * args.page_rounds
+
+        parsed, elapsed, peak, calibration['scrape'] = measure(lambda: [scraper._fallback_processing(url) for url in urls], quiet,
+                                        args.repeats)
+        articles = [article for article in parsed[:len(page_names)] if article]
+        throughput['scrape.pages_per_sec'] = len(urls) / elapsed
+        memory_mb['scrape.peak_mb'] = peak
+        results['scrape.pages_parsed'] = sum(1 for article in parsed if article)
+
+    if 'extract' in args.stages:
+        if not articles:
+            skipped['extract'] = 'needs the parsed pages of the scrape stage'
+        else:
+            from executive_extractor import ExecutiveExtractor
+            with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+                extractor = ExecutiveExtractor()
+            batch = articles * args.extract_rounds
+
+            found, elapsed, peak, calibration['extract'] = measure(lambda: [extractor.extract_from_single_article(dict(a)) for a in batch],
+                                           quiet, args.repeats)
+            throughput['extract.articles_per_sec'] = len(batch) / elapsed
+            memory_mb['extract.peak_mb'] = peak
+            results['extract.executives'] = sum(len(executives) for executives in found[:len(articles)])
+
+    if 'company' in args.stages:
+        from batch_extractor import BatchExtractor
+        with open(os.path.join(FIXTURES_DIR, 'companies.json'), encoding='utf-8') as f:
+            companies = json.load(f)['companies']
+        with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+            batch_extractor = BatchExtractor()
+
+        def process_all():
+            serpapi_before = RecordedSerpAPIHandler.requests_served
+            openai_before = FakeOpenAIHandler.requests_served
+            found = [batch_extractor.process_single_company(company) for company in companies]
+            return {
+                'company.executives': sum(len(executives) for executives in found),
+                'company.serpapi_requests': RecordedSerpAPIHandler.requests_served - serpapi_before,
+                'company.openai_requests': FakeOpenAIHandler.requests_served - openai_before
+            }
+
+        counts, elapsed, peak, calibration['company'] = measure(process_all, quiet, args.repeats)
+        throughput['company.companies_per_min'] = len(companies) / elapsed * 60
+        memory_mb['company.peak_mb'] = peak
+        results.update(counts)
+
+    if 'export' in args.stages or 'records' in args.stages:
+        import config
+        from data_exporter import DataExporter
+        from lead_store import get_lead_store
+        exporter = DataExporter()
+        executives = synthetic_executives(args.export_rows)
+        chunks = [executives[i:i + args.export_chunk] for i in range(0, len(executives), args.export_chunk)]
+        export_dir = os.path.dirname(config.OUTPUT_CONFIG['csv_filename'])
+
+        def fresh_outputs(i: int):
+            # Every pass exports into a new CSV and lead store, as a first run would
+            config.OUTPUT_CONFIG['csv_filename'] = os.path.join(export_dir, f"executives_{i}.csv")
+            config.STORE_CONFIG['db_path'] = os.path.join(export_dir, f"leads_{i}.sqlite3")
+
+        def export_all():
+            for chunk in chunks:
+                exporter.export_to_csv(chunk, filename=config.OUTPUT_CONFIG['csv_filename'],
+                                       append_mode=True, batch_mode=True)
+            return get_lead_store().count()
+
+        stored, elapsed, peak, calibration['export'] = measure(export_all, quiet, args.repeats,
+                                                               prepare=fresh_outputs)
+        if 'export' in args.stages:
+            throughput['export.rows_per_sec'] = len(executives) / elapsed
+            memory_mb['export.peak_mb'] = peak
+            results['export.rows_stored'] = stored
+
+    if 'records' in args.stages:
+        import httpx
+        import uvicorn
+        with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+            import web_app
+        server = uvicorn.Server(uvicorn.Config(web_app.app, host='127.0.0.1', port=args.port, log_level='warning'))
+        server_thread = threading.Thread(target=server.run, daemon=True)
+        server_thread.start()
+        while not server.started:
+            time.sleep(0.05)
+
+        rng = random.Random(11)
+        requests = [rng.choice([{}, {'has_email': 'true'}, {'has_linkedin': 'true'}, {'company': 'Company 42'},
+                                {'position': 'Chief Financial Officer'},
+                                {'offset': rng.randrange(0, args.export_rows // 2)}])
+                    for _ in range(args.record_requests)]
+
+        def query_all():
+            rows = 0
+            with httpx.Client(base_url=f"http://127.0.0.1:{args.port}", timeout=30) as client:
+                for params in requests:
+                    response = client.get('/api/records', params=params)
+                    response.raise_for_status()
+                    rows += len(response.json()['records'])
+            return rows
+
+        try:
+            rows, elapsed, peak, calibration['records'] = measure(query_all, quiet, args.repeats)
+        finally:
+            server.should_exit = True
+            server_thread.join(timeout=10)
+        throughput['records.requests_per_sec'] = len(requests) / elapsed
+        throughput['records.rows_per_sec'] = rows / elapsed
+        memory_mb['records.peak_mb'] = peak
+        results['records.rows_served'] = rows
+
+    return throughput, memory_mb, results, calibration, skipped
+
+
+def host_speed(current, baseline, name: str) -> float:
+    """How much faster the host ran this stage than when the baseline was recorded (1.0: same)"""
+    stage = name.split('.')[0]
+    now = current.get('calibration', {}).get(stage)
+    then = baseline.get('calibration', {}).get(stage)
+    return then / now if now and then else 1.0
+
+
+def compare(current, baseline, tolerance: float):
+    """Print every metric next to its baseline and return the list of regressions"""
+    regressions = []
+
+    def row(name, value, base, status, unit=''):
+        if base is None:
+            print(f"  {name:<30} {value:>12,.2f}{unit}   (no baseline)")
+            return
+        change = (value - base) / base * 100 if base else 0.0
+        print(f"  {name:<30} {value:>12,.2f}{unit}   baseline {base:>12,.2f}  {change:+6.1f}%  {status}")
+
+    print("Throughput (higher is better, scaled to the baseline's host speed):")
+    for name, value in current['throughput'].items():
+        base = baseline.get('throughput', {}).get(name)
+        speed = host_speed(current, baseline, name)
+        value = value / speed
+        failed = base is not None and value < base * (1 - tolerance)
+        if failed:
+            regressions.append(f"{name} dropped to {value:,.2f} (baseline {base:,.2f}, host speed x{speed:.2f})")
+        row(name, value, base, f"{'❌' if failed else '✅'}  host x{speed:.2f}" if base is not None else '')
+
+    print("Peak memory (lower is better):")
+    for name, value in current['memory_mb'].items():
+        base = baseline.get('memory_mb', {}).get(name)
+        failed = base is not None and value > base * (1 + tolerance) and value - base > MEMORY_SLACK_MB
+        if failed:
+            regressions.append(f"{name} grew to {value:.2f} MB (baseline {base:.2f} MB)")
+        row(name, value, base, '❌' if failed else '✅', ' MB')
+
+    print("Results (must match exactly):")
+    for name, value in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        failed = base is not None and value != base
+        if failed:
+            regressions.append(f"{name} is {value} (baseline {base})")
+        row(name, value, base, '❌' if failed else '✅')
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline end-to-end pipeline benchmark with baseline comparison')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='Stages to run')
+    parser.add_argument('--repeats', type=int, default=5, help='Untraced timing passes per stage (median counts)')
+    parser.add_argument('--page-rounds', type=int, default=25, help='Passes over the saved pages in the scrape stage')
+    parser.add_argument('--extract-rounds', type=int, default=5, help='Passes over the parsed pages in the extract stage')
+    parser.add_argument('--export-rows', type=int, default=20000, help='Executives exported in the export stage')
+    parser.add_argument('--export-chunk', type=int, default=1000, help='Executives per export_to_csv call')
+    parser.add_argument('--record-requests', type=int, default=300, help='/api/records requests in the records stage')
+    parser.add_argument('--page-latency', type=float, default=0.0, help='Simulated page server latency in seconds')
+    parser.add_argument('--serpapi-latency', type=float, default=0.0, help='Simulated SerpAPI latency in seconds')
+    parser.add_argument('--openai-latency', type=float, default=0.0, help='Simulated OpenAI latency in seconds')
+    parser.add_argument('--ner', choices=['auto', 'model', 'stub'], default='auto',
+                        help=f"NER for extract and company: {SPACY_MODEL}, the fixture stub, or the model if installed")
+    parser.add_argument('--port', type=int, default=8767, help='Port web_app listens on in the records stage')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='Allowed relative throughput drop / memory growth before failing')
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--verbose', action='store_true', help='Show pipeline output')
+    args = parser.parse_args()
+    if args.repeats < MIN_REPEATS:
+        parser.error(f"--repeats must be at least {MIN_REPEATS} for a usable median")
+
+    if args.ner == 'auto':
+        args.ner = 'model' if spacy_model_available() else 'stub'
+
+    workdir = tempfile.mkdtemp(prefix='bench_pipeline_')
+    pages_url = configure(workdir, args.page_latency, args.serpapi_latency, args.openai_latency)
+    import config
+    config.NER_CONFIG['model'] = SPACY_MODEL if args.ner == 'model' else build_stub_ner(workdir)
+
+    with open(os.devnull, 'w') as devnull:
+        throughput, memory_mb, results, calibration, skipped = run_stages(args, pages_url,
+                                                                          None if args.verbose else devnull)
+    current = {'throughput': throughput, 'memory_mb': memory_mb, 'results': results, 'calibration': calibration}
+    workload = {name: getattr(args, name) for name in WORKLOAD_ARGS}
+
+    print("\n" + "="*50)
+    print("📊 OFFLINE PIPELINE BENCHMARK")
+    print("="*50)
+    print(f"Workdir: {workdir}")
+    print(f"NER: {config.NER_CONFIG['model'] if args.ner == 'model' else 'fixture stub'}, {args.repeats} timing passes per stage (median)")
+    for stage, reason in skipped.items():
+        print(f"⏭️ Skipped {stage}: {reason}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    comparable = baseline.get('workload', workload) == workload
+    regressions = compare(current, baseline if comparable else {}, args.tolerance)
+    print(f"Process max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.1f} MB")
+    print("="*50)
+
+    if args.update_baseline:
+        # Keep entries of stages skipped in this run
+        for section, values in current.items():
+            baseline.setdefault(section, {}).update({name: round(value, 4) if isinstance(value, float) else value
+                                                     for name, value in values.items()})
+        baseline['workload'] = workload
+        baseline['recorded_at'] = datetime.now().isoformat()
+        baseline['python'] = platform.python_version()
+        baseline['machine'] = platform.machine()
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"💾 Baseline written to {args.baseline}")
+        return
+
+    if not baseline:
+        print(f"⚠️ No baseline at {args.baseline}; record one with --update-baseline")
+    elif not comparable:
+        print(f"⚠️ Workload differs from the baseline ({baseline['workload']}); not compared")
+    elif regressions:
+        print(f"❌ {len(regressions)} regression(s) against the baseline:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+    else:
+        print(f"✅ No regressions (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark
+Compares sequential search_multiple_queries with async_search_many against a local fake SerpAPI server
+
+Usage:
+    python benchmarks/bench_search.py --queries 12 --latency 1.0
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_services import FakeSerpAPIHandler, start_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sequential vs async SerpAPI search benchmark')
+    parser.add_argument('--queries', type=int, default=12, help='Number of distinct queries')
+    parser.add_argument('--latency', type=float, default=1.0, help='Simulated SerpAPI latency in seconds')
+    parser.add_argument('--concurrency', type=int, default=4, help='Max in-flight searches for the async path')
+    args = parser.parse_args()
+
+    FakeSerpAPIHandler.latency = args.latency
+    server, base_url = start_server(FakeSerpAPIHandler)
+
+    import config
+    config.SERPAPI_KEY = config.SERPAPI_KEY or 'benchmark-key'
+    config.SEARCH_CONFIG['backend_url'] = base_url
+    config.SEARCH_CONFIG['requests_per_minute'] = 600
+    config.CACHE_CONFIG['enabled'] = False
+
+    import serpapi_searcher
+    serpapi_searcher.SERPAPI_KEY = config.SERPAPI_KEY
+    searcher = serpapi_searcher.SerpAPISearcher()
+
+    queries = [f"Company {i} current executive team linkedin" for i in range(args.queries)]
+
+    start = time.perf_counter()
+    sequential = searcher.search_multiple_queries(queries, max_results_per_query=5, concurrent=False)
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = serpapi_searcher.run_sync(
+        searcher.async_search_many(queries, max_results_per_query=5, max_concurrency=args.concurrency)
+    )
+    concurrent_time = time.perf_counter() - start
+
+    server.shutdown()
+
+    print("\n" + "="*50)
+    print("📊 SEARCH BENCHMARK")
+    print("="*50)
+    print(f"Queries: {len(queries)}  Latency: {args.latency}s  Concurrency: {args.concurrency}")
+    print(f"Sequential: {sequential_time:.1f}s ({len(sequential)} unique results)")
+    print(f"Async:      {concurrent_time:.1f}s ({len(concurrent)} unique results)")
+    print(f"Speedup:    {sequential_time / concurrent_time:.1f}x")
+    print(f"Same results: {[r['url'] for r in sequential] == [r['url'] for r in concurrent]}")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
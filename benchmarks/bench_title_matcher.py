@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Title Matcher Benchmark
+Times the four keyword checks that title_matcher replaced against their
+previous substring loops over generated contexts:
+
+    title     ExecutiveExtractor._extract_title_from_context (~100-char person contexts)
+    page      ContentScraper._parse_article relevance check (page texts)
+    article   ContentScraper._is_valid_article (page title and text)
+    result    SerpAPISearcher._is_relevant_result (result title and snippet)
+
+Results that differ from the legacy loops are counted; they come from the
+legacy substring test matching inside words ("cto" in "director") and from
+the most specific title now winning over the first one listed.
+
+Usage:
+    python benchmarks/bench_title_matcher.py --contexts 10000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SERPAPI_KEY', 'benchmark-key')
+
+from config import CXO_POSITIONS
+from title_matcher import cxo_titles, page_keywords, article_keywords, result_keywords
+
+NAMES = ['Sarah J. Whitfield', 'Khalid Al Mansoori', 'Priya Raman', 'Omar El-Sayed', 'Hessa Al Suwaidi',
+         'Rashid Bin Hamdan', 'Fatima Al Zaabi', 'John Carter']
+FILLER = [
+    'The board of directors approved the annual results.',
+    'Shares closed higher across the region on Tuesday.',
+    'The company operates in twelve countries with 4,000 employees.',
+    'Prior to joining, they held senior roles at regional banks.',
+    'The group reported record revenue for the third quarter.',
+    'Customers can reach the contact centre around the clock.',
+    'Sustainability remains central to the long-term strategy.',
+]
+TITLE_PHRASES = CXO_POSITIONS + ['Managing Director', 'Head of Treasury', 'Board Member']
+
+LEGACY_PAGE_KEYWORDS = ['ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio', 'chief', 'executive', 'president', 'director']
+LEGACY_ARTICLE_KEYWORDS = [
+    'executive', 'ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio',
+    'chief', 'president', 'director', 'manager', 'officer',
+    'leadership', 'management', 'board', 'appointed', 'named',
+    'joins', 'leaves', 'retires', 'promoted'
+]
+LEGACY_RESULT_KEYWORDS = [
+    'executive', 'ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio',
+    'chief', 'president', 'director', 'manager', 'officer',
+    'leadership', 'management', 'board'
+]
+
+
+def legacy_title(context):
+    context_lower = context.lower()
+    for position in CXO_POSITIONS:
+        if position.lower() in context_lower:
+            return position
+    return None
+
+
+def legacy_page(text):
+    text_lower = text.lower()
+    return any(keyword in text_lower for keyword in LEGACY_PAGE_KEYWORDS)
+
+
+def legacy_article(article):
+    text_to_check = f"{article['title']} {article['text']}".lower()
+    return any(keyword in text_to_check for keyword in LEGACY_ARTICLE_KEYWORDS)
+
+
+def legacy_result(result):
+    text = f"{result['title']} {result['snippet']}".lower()
+    return any(keyword in text for keyword in LEGACY_RESULT_KEYWORDS)
+
+
+def new_title(context):
+    found = cxo_titles.best(context)
+    return found[0] if found else None
+
+
+def new_page(text):
+    return page_keywords.search(text)
+
+
+def new_article(article):
+    return article_keywords.search(article['title']) or article_keywords.search(article['text'])
+
+
+def new_result(result):
+    return result_keywords.search(f"{result['title']} {result['snippet']}")
+
+
+def generate(count: int, seed: int = 11):
+    """Person contexts, page texts, articles and search results; about a third mention no executive title"""
+    rng = random.Random(seed)
+
+    def sentence():
+        if rng.random() < 0.35:
+            name = rng.choice(NAMES)
+            title = rng.choice(TITLE_PHRASES)
+            # Extracted page text often has no space between elements
+            return rng.choice([f"{name} serves as {title}.", f"{name}{title}", f"{title} {name} said."])
+        return rng.choice(FILLER)
+
+    contexts = [' '.join(sentence() for _ in range(2))[:200] for _ in range(count)]
+    pages = [' '.join(sentence() for _ in range(rng.randint(20, 60))) for _ in range(count)]
+    articles = [{'title': rng.choice(['Leadership Team', 'News', 'Annual Report', 'About Us']), 'text': page}
+                for page in pages]
+    results = [{'title': f"{rng.choice(NAMES)} - {rng.choice(['LinkedIn', 'Company Profile', 'News'])}",
+                'snippet': ' '.join(sentence() for _ in range(2))} for _ in range(count)]
+    return {'title': contexts, 'page': pages, 'article': articles, 'result': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CXO title and keyword matcher benchmark')
+    parser.add_argument('--contexts', type=int, default=10000, help='Inputs per call site')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed passes (best counts)')
+    args = parser.parse_args()
+
+    inputs = generate(args.contexts)
+    call_sites = [
+        ('title', legacy_title, new_title),
+        ('page', legacy_page, new_page),
+        ('article', legacy_article, new_article),
+        ('result', legacy_result, new_result),
+    ]
+
+    print("\n" + "="*50)
+    print("📊 TITLE MATCHER BENCHMARK")
+    print("="*50)
+    print(f"{args.contexts:,} inputs per call site, best of {args.repeats}")
+    for name, legacy, new in call_sites:
+        items = inputs[name]
+        timings = {}
+        outputs = {}
+        for label, func in (('legacy', legacy), ('matcher', new)):
+            best = None
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                outputs[label] = [func(item) for item in items]
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[label] = best
+        differ = sum(1 for a, b in zip(outputs['legacy'], outputs['matcher']) if a != b)
+        print(f"{name:8s} legacy {timings['legacy'] * 1000:8.1f} ms   matcher {timings['matcher'] * 1000:8.1f} ms   "
+              f"{timings['legacy'] / timings['matcher']:5.1f}x   ({len(items) / timings['matcher']:,.0f}/s, "
+              f"{differ:,} results differ)")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
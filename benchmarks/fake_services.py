@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Fake Local Services
+Minimal HTTP servers that stand in for external APIs during benchmarks
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class FakeSerpAPIHandler(BaseHTTPRequestHandler):
+    """Answers /search like SerpAPI's Google engine, after a simulated latency"""
+
+    latency = 0.5
+    results_per_page = 10
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        query = params.get('q', [''])[0]
+        start = int(params.get('start', ['0'])[0])
+
+        time.sleep(self.latency)
+
+        organic_results = []
+        for i in range(self.results_per_page):
+            position = start + i + 1
+            slug = '-'.join(query.lower().split())[:40]
+            organic_results.append({
+                'position': position,
+                'title': f"{query} - Executive Leadership Team #{position}",
+                'link': f"https://example.com/{slug}/leadership-{position}",
+                'snippet': f"Meet the CEO, CFO and board of directors. Result {position} for {query}."
+            })
+
+        body = json.dumps({'search_parameters': {'q': query}, 'organic_results': organic_results}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RecordedSerpAPIHandler(BaseHTTPRequestHandler):
+    """
+    Replays recorded SerpAPI responses (fixtures/serpapi_responses.json)
+
+    Responses are looked up by lowercased query; unknown queries get the
+    recorded default response. {pages_url} in links points at the fixture
+    page server and {q} is replaced with the query.
+    """
+
+    latency = 0.0
+    pages_url = ''
+    recorded = None
+    requests_served = 0
+
+    @classmethod
+    def load(cls, path: str = None):
+        with open(path or os.path.join(FIXTURES_DIR, 'serpapi_responses.json'), encoding='utf-8') as f:
+            cls.recorded = json.load(f)
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        query = params.get('q', [''])[0]
+        time.sleep(self.latency)
+
+        response = self.recorded['queries'].get(' '.join(query.lower().split()), self.recorded['default'])
+        text = json.dumps(response).replace('{pages_url}', self.pages_url).replace('{q}', query.replace('"', ''))
+        body = json.dumps({'search_parameters': {'q': query}, **json.loads(text)}).encode('utf-8')
+        type(self).requests_served += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixturePageHandler(SimpleHTTPRequestHandler):
+    """Serves the saved HTML pages in fixtures/pages (404 for anything else)"""
+
+    latency = 0.0
+    directory_path = os.path.join(FIXTURES_DIR, 'pages')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=self.directory_path, **kwargs)
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """
+    Answers /v1/chat/completions with canned replies (fixtures/llm_replies.json)
+
+    The first rule whose 'contains' substrings all occur in the last message
+    wins. 'answer_each' rules reply with a JSON array holding the answer once
+    per numbered item (1. "...") in the prompt, as batched company matching
+    expects. 'answer_sections' rules answer packed extraction prompts: each
+    "=== Article N ===" section is answered by the first rule containing the
+    'answer_sections' marker whose other substrings occur in that section,
+    and the replies are returned as one JSON object keyed by N. Usage is
+    reported at roughly four characters per token.
+
+    With fail_every=N every Nth request is answered with error_status (and
+    a Retry-After of retry_after seconds, if set) instead. max_in_flight
+    records the most requests handled at once.
+    """
+
+    latency = 0.0
+    replies = None
+    requests_served = 0
+    requests_received = 0
+    fail_every = 0
+    error_status = 429
+    retry_after = None
+    in_flight = 0
+    max_in_flight = 0
+    _counter_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str = None):
+        with open(path or os.path.join(FIXTURES_DIR, 'llm_replies.json'), encoding='utf-8') as f:
+            cls.replies = json.load(f)
+
+    def reply_for(self, prompt: str) -> str:
+        for rule in self.replies['rules']:
+            if all(fragment in prompt for fragment in rule['contains']):
+                if 'answer_each' in rule:
+                    items = re.findall(r'^\s*\d+\. "', prompt, flags=re.MULTILINE)
+                    return json.dumps([rule['answer_each']] * len(items))
+                if 'answer_sections' in rule:
+                    return json.dumps(self.answer_sections(prompt, rule['answer_sections']))
+                return rule['reply']
+        return self.replies.get('default', '')
+
+    def answer_sections(self, prompt: str, marker: str) -> dict:
+        parts = re.split(r'^\s*=== Article (\d+) ===$', prompt, flags=re.MULTILINE)
+        answers = {}
+        for number, section in zip(parts[1::2], parts[2::2]):
+            for rule in self.replies['rules']:
+                if marker in rule['contains'] and all(fragment in section for fragment in rule['contains']
+                                                      if fragment != marker):
+                    answers[number] = json.loads(rule['reply'])
+                    break
+        return answers
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        cls = type(self)
+        with cls._counter_lock:
+            cls.requests_received += 1
+            failing = cls.fail_every and cls.requests_received % cls.fail_every == 0
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(self.latency)
+        finally:
+            with cls._counter_lock:
+                cls.in_flight -= 1
+        if failing:
+            self.send_error_reply()
+            return
+
+        prompt = request.get('messages', [{}])[-1].get('content', '')
+        content = self.reply_for(prompt)
+
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        with cls._counter_lock:
+            cls.requests_served += 1
+            served = cls.requests_served
+        body = json.dumps({
+            'id': f"chatcmpl-fake{served}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'gpt-3.5-turbo'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                      'total_tokens': prompt_tokens + completion_tokens}
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_reply(self):
+        body = json.dumps({'error': {'message': f"Injected {self.error_status} error", 'type': 'requests',
+                                     'code': 'rate_limit_exceeded' if self.error_status == 429 else None}}).encode('utf-8')
+        self.send_response(self.error_status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.retry_after is not None:
+            self.send_header('Retry-After', str(self.retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(handler_class, port: int = 0):
+    """
+    Start a threaded server on localhost and return (server, base_url)
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler_class)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
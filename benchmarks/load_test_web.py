@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Web App Load Test
+Measures /api/records latency while batch jobs run in the same web_app process
+
+Two /api/batch jobs are started against a simulated extractor whose
+process_single_company blocks like the real one (network waits plus CPU-bound
+parsing), while client threads poll /api/records. With --inline the pipeline
+steps run directly on the event loop, reproducing the behaviour before they
+were moved to the pipeline executor.
+
+Usage:
+    python benchmarks/load_test_web.py --rows 100000 --companies 6 --duration 20
+    python benchmarks/load_test_web.py --inline
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # templates/ and static/
+
+os.environ.setdefault('SERPAPI_KEY', 'load-test-key')
+os.environ.setdefault('OPENAI_API_KEY', 'load-test-key')
+
+import httpx
+import uvicorn
+
+from bench_lead_store import build_store
+
+
+class SimulatedBatchExtractor:
+    """
+    Stand-in for BatchExtractor with the same blocking profile per company
+
+    Each company spends io_seconds in blocking waits (SerpAPI, page fetches,
+    OpenAI) and cpu_seconds in pure-Python work (HTML parsing, NER).
+    """
+
+    io_seconds = 1.5
+    cpu_seconds = 0.5
+    processed = 0
+    _lock = threading.Lock()
+
+    def __init__(self):
+        from data_loader import DataLoader
+        self.data_loader = DataLoader()
+        self.data_exporter = None
+
+    def load_companies_from_json(self, json_data: str):
+        return json.loads(json_data)['companies']
+
+    def load_companies_from_csv(self):
+        return []
+
+    def process_single_company(self, company):
+        time.sleep(self.io_seconds)
+        deadline = time.perf_counter() + self.cpu_seconds
+        while time.perf_counter() < deadline:
+            sum(i * i for i in range(1000))
+        with SimulatedBatchExtractor._lock:
+            SimulatedBatchExtractor.processed += 1
+        return []
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/api/records latency under concurrent batch jobs')
+    parser.add_argument('--rows', type=int, default=100000, help='Executives in the synthetic lead store')
+    parser.add_argument('--companies', type=int, default=6, help='Companies per batch job')
+    parser.add_argument('--batches', type=int, default=2, help='Concurrent /api/batch jobs')
+    parser.add_argument('--clients', type=int, default=4, help='Threads polling /api/records')
+    parser.add_argument('--duration', type=float, default=20.0, help='Seconds of polling')
+    parser.add_argument('--io-seconds', type=float, default=1.5, help='Blocking wait per company')
+    parser.add_argument('--cpu-seconds', type=float, default=0.5, help='CPU-bound work per company')
+    parser.add_argument('--max-p99-ms', type=float, default=250.0, help='Fail if /api/records p99 exceeds this')
+    parser.add_argument('--inline', action='store_true', help='Run pipeline steps on the event loop (old behaviour)')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    import config
+    workdir = tempfile.mkdtemp(prefix='load_test_')
+    db_path = os.path.join(workdir, 'leads.sqlite3')
+    config.STORE_CONFIG['db_path'] = db_path
+    config.STORE_CONFIG['import_csv_on_first_use'] = False
+    config.BATCH_CONFIG['delay_between_companies'] = 0
+    config.CACHE_CONFIG['enabled'] = False
+
+    start = time.perf_counter()
+    build_store(db_path, args.rows, max(1, args.rows // 50))
+    print(f"Built lead store with {args.rows:,} executives in {time.perf_counter() - start:.1f}s")
+
+    import web_app
+    SimulatedBatchExtractor.io_seconds = args.io_seconds
+    SimulatedBatchExtractor.cpu_seconds = args.cpu_seconds
+    web_app.BatchExtractor = SimulatedBatchExtractor
+
+    if args.inline:
+        async def run_inline(func, *a, **kw):
+            return func(*a, **kw)
+        web_app.run_blocking = run_inline
+
+    server = uvicorn.Server(uvicorn.Config(web_app.app, host='127.0.0.1', port=args.port, log_level='warning'))
+    server_thread = threading.Thread(target=server.run, daemon=True)
+    server_thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    # Silence the per-message broadcast debug prints while measuring
+    devnull = open(os.devnull, 'w')
+    stdout = sys.stdout
+    sys.stdout = devnull
+
+    latencies = []
+    errors = [0]
+    stop = threading.Event()
+
+    def poll_records(seed: int):
+        rng = random.Random(seed)
+        with httpx.Client(base_url=base_url, timeout=30) as client:
+            while not stop.is_set():
+                params = rng.choice([{}, {'has_email': 'true'}, {'company': 'Falcon'},
+                                     {'offset': rng.randrange(0, args.rows // 2)}])
+                t0 = time.perf_counter()
+                response = client.get('/api/records', params=params)
+                elapsed = time.perf_counter() - t0
+                if response.status_code != 200 or 'error' in response.json():
+                    errors[0] += 1
+                latencies.append(elapsed)
+
+    try:
+        companies = json.dumps({'companies': [
+            {'name': f"Load Test Company {i}", 'city': 'Dubai', 'country': 'UAE', 'industry': 'Banking'}
+            for i in range(args.companies)
+        ]})
+        with httpx.Client(base_url=base_url, timeout=60) as client:
+            for _ in range(args.batches):
+                client.post('/api/batch', json={'source': 'json', 'json_data': companies})
+
+        pollers = [threading.Thread(target=poll_records, args=(i,)) for i in range(args.clients)]
+        for poller in pollers:
+            poller.start()
+        time.sleep(args.duration)
+        stop.set()
+        for poller in pollers:
+            poller.join()
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+        server.should_exit = True
+        server_thread.join(timeout=10)
+
+    latencies.sort()
+    p99 = percentile(latencies, 0.99) * 1000
+
+    print("\n" + "="*50)
+    print("📊 WEB LOAD TEST" + (" (inline pipeline)" if args.inline else ""))
+    print("="*50)
+    print(f"Batch jobs: {args.batches} x {args.companies} companies  "
+          f"(per company: {args.io_seconds}s blocking wait, {args.cpu_seconds}s CPU)")
+    print(f"Companies processed during test: {SimulatedBatchExtractor.processed}")
+    print(f"/api/records requests: {len(latencies)} ({len(latencies) / args.duration:.0f}/s), errors: {errors[0]}")
+    print(f"Latency p50 {percentile(latencies, 0.50) * 1000:.1f} ms  "
+          f"p95 {percentile(latencies, 0.95) * 1000:.1f} ms  "
+          f"p99 {p99:.1f} ms  max {latencies[-1] * 1000:.1f} ms")
+    print("="*50)
+
+    if p99 > args.max_p99_ms:
+        print(f"❌ p99 {p99:.1f} ms exceeds {args.max_p99_ms:.0f} ms")
+        sys.exit(1)
+    print(f"✅ p99 within {args.max_p99_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Cache Store Module
+SQLite-backed key/value cache with per-entry TTL, LRU/size-bounded eviction and hit/miss counters
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from config import CACHE_CONFIG
+
+# How many writes to allow between eviction passes
+EVICTION_INTERVAL = 50
+
+_stores: Dict[str, 'CacheStore'] = {}
+_stores_lock = threading.Lock()
+
+
+class CacheStore:
+    def __init__(self, namespace: str, db_path: str = None, max_entries: int = None, max_bytes: int = None):
+        self.namespace = namespace
+        self.db_path = db_path or CACHE_CONFIG['db_path']
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # Hit/miss counters, overall and per label (e.g. query class or call site)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.label_stats: Dict[str, Dict[str, int]] = {}
+
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                expires_at REAL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_lru ON cache_entries (namespace, accessed_at)"
+        )
+        self._conn.commit()
+
+        with self._lock:
+            self._evict()
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """
+        Build a content-addressed key from a JSON-serializable payload
+        """
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, label: str = 'default') -> Optional[Any]:
+        """
+        Return the cached value for key, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+
+            if row is None or (row[1] is not None and row[1] < now):
+                self._record(label, hit=False)
+                return None
+
+            self._conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key)
+            )
+            self._conn.commit()
+            self._record(label, hit=True)
+
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store a JSON-serializable value, optionally expiring after ttl seconds
+        """
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO cache_entries
+                    (namespace, key, value, size, created_at, accessed_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (self.namespace, key, blob, len(blob), now, now, expires_at)
+            )
+            self._conn.commit()
+
+            self._writes_since_eviction += 1
+            if self._writes_since_eviction >= EVICTION_INTERVAL:
+                self._evict()
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every entry in this namespace"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss counters and current size of this namespace
+        """
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+            lookups = self.hits + self.misses
+
+            return {
+                'namespace': self.namespace,
+                'entries': entries,
+                'bytes': total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'by_label': {label: dict(counts) for label, counts in self.label_stats.items()}
+            }
+
+    def _record(self, label: str, hit: bool):
+        """Update hit/miss counters (caller holds the lock)"""
+        counts = self.label_stats.setdefault(label, {'hits': 0, 'misses': 0})
+        if hit:
+            self.hits += 1
+            counts['hits'] += 1
+        else:
+            self.misses += 1
+            counts['misses'] += 1
+
+    def _evict(self):
+        """
+        Drop expired entries, then least recently used ones until the
+        namespace fits within max_entries and max_bytes (caller holds the lock)
+        """
+        self._writes_since_eviction = 0
+
+        cursor = self._conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at < ?",
+            (self.namespace, time.time())
+        )
+        evicted = cursor.rowcount
+
+        entries, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()
+
+        excess_entries = entries - self.max_entries if self.max_entries else 0
+        excess_bytes = total_bytes - self.max_bytes if self.max_bytes else 0
+
+        if excess_entries > 0 or excess_bytes > 0:
+            doomed = []
+            freed = 0
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY accessed_at ASC",
+                (self.namespace,)
+            )
+            for key, size in rows:
+                if len(doomed) >= excess_entries and freed >= excess_bytes:
+                    break
+                doomed.append((self.namespace, key))
+                freed += size
+
+            self._conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", doomed)
+            evicted += len(doomed)
+
+        self._conn.commit()
+        self.evictions += evicted
+
+
+def get_cache_store(namespace: str, **kwargs) -> CacheStore:
+    """
+    Return the shared CacheStore for a namespace so that all callers in the
+    process reuse one connection and aggregate their hit/miss counters
+    """
+    with _stores_lock:
+        if namespace not in _stores:
+            _stores[namespace] = CacheStore(namespace, **kwargs)
+        return _stores[namespace]
+
+
+def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return statistics for every cache namespace opened in this process"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    return {store.namespace: store.get_stats() for store in stores}
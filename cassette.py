@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Cassette Module
+Records SerpAPI searches, page downloads and OpenAI chat completions into a
+compact SQLite cassette and replays them with simulated latency, so pipeline
+runs can be repeated deterministically without network access
+"""
+
+import io
+import time
+import argparse
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import CASSETTE_CONFIG, CACHE_CONFIG
+from cache_store import CacheStore
+from metrics import count
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+SERVICES = ('serpapi', 'http', 'openai')
+
+
+class CassetteMiss(Exception):
+    """A replayed run made a request that was never recorded"""
+
+
+class ReplayedError(Exception):
+    """An error that was raised by the live service when the exchange was recorded"""
+
+
+class Cassette:
+    """
+    Exchanges of one cassette file, one CacheStore namespace per service
+
+    Requests are keyed on their content (never on API keys), so a replay
+    finds an exchange whatever order or thread it is made in. Errors are
+    recorded too and raised again as ReplayedError. On replay each exchange
+    waits its recorded duration times latency_scale, or a fixed
+    replay_latency in seconds.
+    """
+
+    def __init__(self, mode: str, path: str, replay_latency: Any = 'recorded', latency_scale: float = 1.0):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode!r} (expected '{RECORD}' or '{REPLAY}')")
+        self.mode = mode
+        self.path = path
+        self.fixed_latency = None if replay_latency in (None, 'recorded') else float(replay_latency)
+        self.latency_scale = latency_scale
+        self._stores = {service: CacheStore(service, db_path=path) for service in SERVICES}
+
+    def exchange(self, service: str, request: Dict[str, Any], perform: Callable[[], Any],
+                 encode: Callable[[Any], Any] = None, decode: Callable[[Any], Any] = None) -> Any:
+        """Return perform()'s response, recording it or replaying the recorded one"""
+        key = CacheStore.make_key(request)
+        if self.mode == REPLAY:
+            return self._replay(service, key, request, decode)
+
+        start = time.perf_counter()
+        try:
+            response = perform()
+        except Exception as e:
+            self._save(service, key, {'error': f"{e.__class__.__name__}: {e}"}, time.perf_counter() - start)
+            raise
+        self._save(service, key, {'response': encode(response) if encode else response},
+                   time.perf_counter() - start)
+        return response
+
+    def http_get(self, session: requests.Session, url: str, **kwargs: Any) -> requests.Response:
+        """
+        session.get through the cassette
+
+        The body is recorded as the caller streams it, so a download aborted
+        early replays the same truncated body and aborts at the same point.
+        """
+        headers = kwargs.get('headers') or {}
+        request = {'method': 'GET', 'url': url,
+                   'if_none_match': headers.get('If-None-Match'),
+                   'if_modified_since': headers.get('If-Modified-Since')}
+        key = CacheStore.make_key(request)
+        if self.mode == REPLAY:
+            return self._replay('http', key, request, lambda recorded: _build_response(url, recorded))
+
+        start = time.perf_counter()
+        try:
+            response = session.get(url, **kwargs)
+        except Exception as e:
+            self._save('http', key, {'error': f"{e.__class__.__name__}: {e}"}, time.perf_counter() - start)
+            raise
+
+        chunks = []
+        iter_content = response.iter_content
+        close = response.close
+
+        def recording_iter_content(*args, **iter_kwargs):
+            for chunk in iter_content(*args, **iter_kwargs):
+                chunks.append(chunk)
+                yield chunk
+
+        def recording_close():
+            response.close = close
+            close()
+            # latin-1 maps every byte to one code point, so the body round-trips exactly
+            self._save('http', key, {'response': {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': dict(response.headers),
+                'body': b''.join(chunks).decode('latin-1')
+            }}, time.perf_counter() - start)
+
+        response.iter_content = recording_iter_content
+        response.close = recording_close
+        return response
+
+    def _save(self, service: str, key: str, entry: Dict[str, Any], elapsed: float):
+        entry['elapsed'] = round(elapsed, 4)
+        self._stores[service].set(key, entry)
+        count(f'cassette.{service}', 'recorded')
+
+    def _replay(self, service: str, key: str, request: Dict[str, Any], decode: Callable[[Any], Any] = None) -> Any:
+        entry = self._stores[service].get(key, label=service)
+        if entry is None:
+            count(f'cassette.{service}', 'misses')
+            raise CassetteMiss(f"No recorded {service} exchange for {_describe(request)} in {self.path}")
+
+        time.sleep(self.fixed_latency if self.fixed_latency is not None else entry['elapsed'] * self.latency_scale)
+        count(f'cassette.{service}', 'replayed')
+        if 'error' in entry:
+            raise ReplayedError(entry['error'])
+        return decode(entry['response']) if decode else entry['response']
+
+
+def _build_response(url: str, recorded: Dict[str, Any]) -> requests.Response:
+    """A streamable requests.Response holding a recorded page"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = recorded['status']
+    response.reason = recorded['reason']
+    response.headers = CaseInsensitiveDict(recorded['headers'])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(recorded['body'].encode('latin-1'))
+    return response
+
+
+def _describe(request: Dict[str, Any]) -> str:
+    if 'url' in request:
+        return request['url']
+    if 'q' in request:
+        return f"query {request['q']!r}"
+    return f"{request.get('model', 'request')} call"
+
+
+# Cassette used by this process (None: live traffic)
+_active: Optional[Cassette] = None
+
+
+def configure(mode: str = None, path: str = None, replay_latency: Any = None) -> Optional[Cassette]:
+    """
+    Switch this process to record or replay mode
+
+    Arguments override CASSETTE_CONFIG (whose defaults come from the
+    LEADS_CASSETTE_MODE, LEADS_CASSETTE and LEADS_CASSETTE_LATENCY
+    environment variables). The search, page and LLM caches are disabled,
+    so every exchange is recorded and replayed. Must be called before the
+    pipeline components are created.
+    """
+    global _active
+    mode = mode or CASSETTE_CONFIG.get('mode')
+    if not mode:
+        _active = None
+        return None
+
+    path = path or CASSETTE_CONFIG['path']
+    if replay_latency is None:
+        replay_latency = CASSETTE_CONFIG.get('replay_latency', 'recorded')
+    _active = Cassette(mode, path, replay_latency, CASSETTE_CONFIG.get('latency_scale', 1.0))
+    CACHE_CONFIG['enabled'] = False
+
+    if mode == REPLAY:
+        latency = 'recorded latency' if _active.fixed_latency is None else f"{_active.fixed_latency}s latency"
+        print(f"📼 Replaying external traffic from {path} ({latency})")
+    else:
+        print(f"📼 Recording external traffic to {path}")
+    return _active
+
+
+def replaying() -> bool:
+    return _active is not None and _active.mode == REPLAY
+
+
+def serpapi_search(search_params: Dict[str, Any], perform: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """GoogleSearch.get_dict through the active cassette, if any"""
+    if _active is None:
+        return perform()
+    request = {name: value for name, value in search_params.items() if name != 'api_key'}
+    return _active.exchange('serpapi', request, perform)
+
+
+def http_get(session: requests.Session, url: str, **kwargs: Any) -> requests.Response:
+    """session.get through the active cassette, if any"""
+    if _active is None:
+        return session.get(url, **kwargs)
+    return _active.http_get(session, url, **kwargs)
+
+
+def openai_chat(params: Dict[str, Any], perform: Callable[[], Any]):
+    """A chat completion (perform() with these params) through the active cassette, if any"""
+    if _active is None:
+        return perform()
+
+    from openai.types.chat import ChatCompletion
+    return _active.exchange('openai', params, perform,
+                            encode=lambda response: response.model_dump(mode='json'),
+                            decode=ChatCompletion.model_validate)
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Add --record/--replay options to a command line parser"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--record', nargs='?', const='', metavar='CASSETTE',
+                       help='Record SerpAPI, page and OpenAI traffic (default file from config)')
+    group.add_argument('--replay', nargs='?', const='', metavar='CASSETTE',
+                       help='Replay recorded traffic instead of calling the network')
+    parser.add_argument('--replay-latency', metavar='SECONDS',
+                        help="Simulated latency per replayed exchange ('recorded' for the recorded timings)")
+
+
+def configure_from_args(args: argparse.Namespace) -> Optional[Cassette]:
+    """Apply the options added by add_arguments (falling back to CASSETTE_CONFIG)"""
+    if args.record is not None:
+        return configure(RECORD, args.record or None, args.replay_latency)
+    if args.replay is not None:
+        return configure(REPLAY, args.replay or None, args.replay_latency)
+    return configure(replay_latency=args.replay_latency)
@@ -7,15 +7,17 @@ OpenAI-powered agent that understands user queries and generates JSON for batch
 import json
 import re
 from typing import Dict, Any, List, Optional, Tuple
-import openai
 from config import OPENAI_API_KEY
+from llm_client import chat_completion
+from llm_gateway import get_llm_gateway
+from metrics import timed
 
 class ProfessionalInvestorAgent:
     def __init__(self):
         if not OPENAI_API_KEY:
             raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in config.py")
         
-        self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
+        self.client = get_llm_gateway()
         
         # System prompt for the agent
         self.system_prompt = """You are a Professional Investor Leads Generator specializing in finding CXO-level executives from companies. 
@@ -46,6 +48,7 @@ For vague queries, use your knowledge to find relevant companies. Focus on:
 
 Always respond in a helpful, professional tone and guide users through the process."""
 
+    @timed('agent.query')
     def process_user_query(self, user_query: str) -> Dict[str, Any]:
         """
         Process user query and return structured response with JSON data
@@ -144,7 +147,9 @@ Always respond in a helpful, professional tone and guide users through the proce
         """
         
         try:
-            response = self.client.chat.completions.create(
+            content = chat_completion(
+                self.client,
+                'analyze_query',
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": self.system_prompt},
@@ -152,9 +157,7 @@ Always respond in a helpful, professional tone and guide users through the proce
                 ],
                 max_tokens=1500,
                 temperature=0.3
-            )
-            
-            content = response.choices[0].message.content.strip()
+            ).strip()
             
             # Parse the response
             if content.startswith('```json'):
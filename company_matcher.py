@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Company Name Matcher
+Resolves extracted company names against the company being processed, locally where possible
+and with a single batched LLM call for the rest
+"""
+
+import re
+import json
+import threading
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from llm_client import chat_completion
+
+# Legal forms and generic words that do not distinguish one company from another
+COMPANY_SUFFIXES = {
+    'pjsc', 'psc', 'pjs', 'jsc', 'saog', 'saoc', 'qpsc', 'qsc', 'bsc', 'kscp', 'ksc',
+    'llc', 'ltd', 'limited', 'inc', 'incorporated', 'corp', 'corporation', 'plc',
+    'co', 'company', 'sa', 'ag', 'nv', 'bv', 'gmbh', 'fze', 'fzco', 'fzc', 'fzllc', 'wll',
+    'group', 'holding', 'holdings', 'the'
+}
+
+# Common abbreviations expanded before comparison
+COMPANY_ABBREVIATIONS = {
+    'intl': 'international',
+    'int': 'international',
+    'natl': 'national',
+    'nat': 'national',
+    'bk': 'bank',
+    'invest': 'investment',
+    'inv': 'investment',
+    'mgmt': 'management',
+    'cap': 'capital',
+    'dev': 'development',
+    'fin': 'financial',
+    'svcs': 'services',
+    'svc': 'services',
+    '&': 'and'
+}
+
+# Words too common to identify a company on their own
+GENERIC_COMPANY_WORDS = {
+    'bank', 'capital', 'investment', 'investments', 'financial', 'finance', 'international',
+    'national', 'services', 'management', 'partners', 'fund', 'asset', 'assets', 'and', 'of'
+}
+
+# Names at least this similar after normalization are treated as the same company
+FUZZY_MATCH_THRESHOLD = 0.9
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Lowercase a company name, expand abbreviations and drop legal suffixes
+
+    "Emirates NBD Bank (P.J.S.C.)" and "emirates nbd bank" normalize to the same string.
+    """
+    name = name.lower().replace('&', ' & ')
+    # Join dotted abbreviations such as "p.j.s.c." before stripping punctuation
+    name = re.sub(r'\b(?:[a-z]\.){2,}', lambda m: m.group(0).replace('.', ''), name)
+    name = re.sub(r"[^\w&\s]", ' ', name)
+
+    tokens = [COMPANY_ABBREVIATIONS.get(token, token) for token in name.split()]
+    tokens = [token for token in tokens if token not in COMPANY_SUFFIXES]
+    return ' '.join(tokens)
+
+
+def company_acronym(normalized_name: str) -> str:
+    """Initials of a normalized name, ignoring 'and'/'of'"""
+    return ''.join(token[0] for token in normalized_name.split() if token not in ('and', 'of'))
+
+
+class CompanyMatcher:
+    """
+    Decides whether extracted company names refer to the company being processed
+
+    Pairs are resolved by the local alias/fuzzy rules first, then from a memo
+    of earlier answers; whatever is left goes to the LLM in one request per
+    company instead of one request per executive.
+    """
+
+    def __init__(self, client=None):
+        self.client = client
+        self._memo: Dict[Tuple[str, str], bool] = {}
+        self._memo_lock = threading.Lock()
+        self.stats = {'local': 0, 'memo': 0, 'llm': 0, 'llm_calls': 0}
+
+    def local_match(self, extracted_name: str, actual_name: str) -> Optional[bool]:
+        """
+        Match using normalization, acronyms and fuzzy similarity
+
+        Returns True for a confident match and None when the LLM should decide.
+        """
+        extracted = normalize_company_name(extracted_name)
+        actual = normalize_company_name(actual_name)
+
+        if not extracted or not actual:
+            return None
+
+        if extracted == actual:
+            return True
+
+        # "FAB" vs "First Abu Dhabi Bank", "ADCB" vs "Abu Dhabi Commercial Bank"
+        compact_extracted = extracted.replace(' ', '')
+        compact_actual = actual.replace(' ', '')
+        if compact_extracted == company_acronym(actual) or compact_actual == company_acronym(extracted):
+            return True
+        if compact_extracted == compact_actual:
+            return True
+
+        # One name is the other plus trailing words ("Mashreq" vs "Mashreq Bank"),
+        # as long as the shorter one is more than generic words like "Bank"
+        shorter, longer = sorted((extracted.split(), actual.split()), key=len)
+        if longer[:len(shorter)] == shorter and set(shorter) - GENERIC_COMPANY_WORDS:
+            return True
+
+        if SequenceMatcher(None, extracted, actual).ratio() >= FUZZY_MATCH_THRESHOLD:
+            return True
+
+        return None
+
+    def match_many(self, extracted_names: List[str], actual_name: str) -> List[str]:
+        """
+        Resolve every extracted name for one company
+
+        Returns, in input order, actual_name for names referring to the same
+        company and the extracted name otherwise.
+        """
+        decisions: Dict[str, bool] = {}
+        pending: List[str] = []
+
+        for extracted_name in extracted_names:
+            if extracted_name in decisions or extracted_name in pending:
+                continue
+
+            if not extracted_name or extracted_name.lower() == actual_name.lower():
+                decisions[extracted_name] = True
+                continue
+
+            memo_key = self._memo_key(extracted_name, actual_name)
+            with self._memo_lock:
+                memoized = self._memo.get(memo_key)
+            if memoized is not None:
+                decisions[extracted_name] = memoized
+                self._count('memo')
+                continue
+
+            local = self.local_match(extracted_name, actual_name)
+            if local is not None:
+                decisions[extracted_name] = local
+                self._count('local')
+                self._remember(memo_key, local)
+                continue
+
+            pending.append(extracted_name)
+
+        if pending:
+            for extracted_name, same in zip(pending, self._llm_match(pending, actual_name)):
+                decisions[extracted_name] = same
+
+        return [actual_name if decisions[name] else name for name in extracted_names]
+
+    def match(self, extracted_name: str, actual_name: str) -> str:
+        """Resolve a single extracted name"""
+        return self.match_many([extracted_name], actual_name)[0]
+
+    def _llm_match(self, extracted_names: List[str], actual_name: str) -> List[bool]:
+        """Ask the LLM about all unresolved names in one request"""
+        if not self.client:
+            # Fallback to simple matching
+            return [name.lower() in actual_name.lower() or actual_name.lower() in name.lower()
+                    for name in extracted_names]
+
+        numbered = '\n'.join(f'{i + 1}. "{name}"' for i, name in enumerate(extracted_names))
+        prompt = f"""
+        Determine whether each extracted company name refers to the same company as the actual company name.
+
+        Actual company name: "{actual_name}"
+
+        Extracted names:
+        {numbered}
+
+        Consider abbreviations, common variations, and parent/subsidiary relationships.
+        Return only a JSON array with one "YES" or "NO" per extracted name, in the same order.
+        """
+
+        try:
+            content = chat_completion(
+                self.client,
+                'match_company',
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=10 + 6 * len(extracted_names),
+                temperature=0.1
+            ).strip()
+            self._count('llm_calls')
+
+            if content.startswith('```json'):
+                content = content[7:]
+            if content.startswith('```'):
+                content = content[3:]
+            if content.endswith('```'):
+                content = content[:-3]
+
+            answers = json.loads(content)
+            if not isinstance(answers, list) or len(answers) != len(extracted_names):
+                raise ValueError(f"expected {len(extracted_names)} answers, got {answers!r}")
+
+            results = [str(answer).strip().upper() == 'YES' for answer in answers]
+
+        except Exception as e:
+            # Same policy as before batching: keep the company being processed
+            print(f"⚠️ LLM company matching failed: {e}")
+            return [True] * len(extracted_names)
+
+        self._count('llm', len(extracted_names))
+        for name, same in zip(extracted_names, results):
+            self._remember(self._memo_key(name, actual_name), same)
+
+        return results
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._memo_lock:
+            self.stats[counter] += amount
+
+    def _remember(self, memo_key: Tuple[str, str], same: bool):
+        with self._memo_lock:
+            self._memo[memo_key] = same
+
+    @staticmethod
+    def _memo_key(extracted_name: str, actual_name: str) -> Tuple[str, str]:
+        return (' '.join(extracted_name.lower().split()), ' '.join(actual_name.lower().split()))
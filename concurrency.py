@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Concurrency Utilities
+Shared rate limiters, per-service concurrency caps and helpers for bridging sync and async code
+"""
+
+import time
+import contextlib
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+from config import BATCH_CONFIG
+
+_rate_limiters: Dict[str, 'TokenBucket'] = {}
+_registry_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from both threads and coroutines.
+
+    Callers reserve tokens up front, so concurrent waiters are served in
+    arrival order and the long-run rate never exceeds rate_per_second.
+    """
+
+    def __init__(self, rate_per_second: Optional[float], capacity: float = 1):
+        self.rate = rate_per_second
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Reserve tokens and return how long the caller must wait before using them"""
+        if not self.rate:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """Block the current thread until tokens are available"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Wait without blocking the event loop until tokens are available"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def get_rate_limiter(name: str, rate_per_second: Optional[float] = None, capacity: float = 1) -> TokenBucket:
+    """
+    Return the process-wide limiter for a service, creating it on first use
+    """
+    with _registry_lock:
+        if name not in _rate_limiters:
+            _rate_limiters[name] = TokenBucket(rate_per_second, capacity)
+        return _rate_limiters[name]
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    When the calling thread already runs an event loop (e.g. inside the web
+    app), the coroutine is executed on a private loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+_pipeline_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_pipeline_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide pool that runs blocking pipeline steps for the web app
+
+    Sized by BATCH_CONFIG['web_pipeline_threads']. It is kept separate from the
+    event loop's default executor so long extraction steps cannot starve
+    short request handlers that also run in threads.
+    """
+    global _pipeline_executor
+    with _registry_lock:
+        if _pipeline_executor is None:
+            _pipeline_executor = ThreadPoolExecutor(
+                max_workers=BATCH_CONFIG.get('web_pipeline_threads', 4),
+                thread_name_prefix='pipeline'
+            )
+        return _pipeline_executor
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    Await a synchronous call on the pipeline executor instead of blocking the event loop
+
+    The pipeline's clients, caches and spaCy model are shared in-process
+    objects and most of the time is spent waiting on the network, so threads
+    are used rather than a process pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pipeline_executor(), functools.partial(func, *args, **kwargs))
+
+
+_service_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def service_slot(name: str):
+    """
+    Context manager limiting how many threads use an external service at once.
+
+    Caps come from BATCH_CONFIG['service_concurrency']; services without a
+    configured cap are not limited.
+    """
+    limit = BATCH_CONFIG.get('service_concurrency', {}).get(name)
+    if not limit:
+        return contextlib.nullcontext()
+
+    with _registry_lock:
+        if name not in _service_semaphores:
+            _service_semaphores[name] = threading.BoundedSemaphore(limit)
+        return _service_semaphores[name]
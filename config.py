@@ -31,6 +31,14 @@ SCRAPING_CONFIG = {
     'delay_between_requests': 2,
     'timeout': 30,
     'max_retries': 3,
+    'connect_timeout': 5,
+    'read_timeout': 15,
+    'max_concurrent_fetches': 8,  # Pages in flight across all domains
+    'per_domain_concurrency': 2,  # Pages in flight per domain (also the per-host pool size)
+    'per_domain_delay': 0.5,  # Minimum seconds between request starts to one domain
+    'max_page_bytes': 2 * 1024 * 1024,  # Downloads are aborted beyond this size
+    'allowed_content_types': ['text/html', 'application/xhtml+xml', 'text/plain'],
+    'html_backend': 'auto',  # 'lxml', 'bs4' or 'auto' (lxml when installed)
     'user_agents': [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -38,6 +46,15 @@ SCRAPING_CONFIG = {
     ]
 }
 
+# Search Configuration
+SEARCH_CONFIG = {
+    'backend_url': os.getenv('SERPAPI_BACKEND_URL'),  # Override SerpAPI host (e.g. a local fake server)
+    'max_concurrent_searches': 4,
+    'requests_per_minute': 60,  # Shared token bucket sized to the SerpAPI plan
+    'burst': 5,
+    'concurrent_multi_query': True
+}
+
 # Output Configuration
 OUTPUT_CONFIG = {
     'csv_filename': 'executives.csv',
@@ -48,11 +65,13 @@ OUTPUT_CONFIG = {
 BATCH_CONFIG = {
     'companies_csv_file': 'companies_in_uae.csv',
     'progress_file': 'batch_progress.json',
+    'metrics_report_file': 'batch_metrics.json',  # Per-run stage timings, written next to progress_file
     'log_file': 'batch_logs.txt',
     'country_filter': 'UAE',
     'max_results_per_company': 5,
     'delay_between_companies': 1,
     'delay_between_queries': 1,
+    'delay_between_executives': 2,  # Pause between enrichment searches of one company's executives
     'max_retries_per_company': 2,
     'recent_days_threshold': 7,
     'batch_mode_flag': 'Yes',
@@ -70,5 +89,90 @@ BATCH_CONFIG = {
     # Retry settings for executive extraction
     'max_retry_attempts': 3,
     'retry_delay_seconds': 2,
-    'enable_retry_on_zero_executives': True
+    'enable_retry_on_zero_executives': True,
+    
+    # Parallel processing settings
+    'max_workers': 1,  # Companies processed concurrently (overridden by --workers)
+    'web_pipeline_threads': 4,  # Threads running blocking pipeline steps for the web app
+    'max_concurrent_jobs': 2,  # Web app jobs running at once; later submissions queue
+    'max_finished_jobs': 100,  # Finished jobs kept for /api/jobs
+    'ws_max_queue': 1000,  # Messages queued per WebSocket client before logs are dropped
+    'ws_send_timeout': 10,  # Seconds before a stalled client is disconnected
+    'service_concurrency': {
+        'serpapi': 4,
+        'http': 8,
+        'openai': 4
+    }
+}
+
+# spaCy NER Configuration (rule-based extraction next to OpenAI)
+NER_CONFIG = {
+    'model': 'en_core_web_sm',
+    'keep_components': ['ner'],  # Every other pipe is disabled, except embedding layers these listen to
+    'batch_size': 16,  # Articles per nlp.pipe batch
+    'n_process': 1,  # Worker processes for nlp.pipe (only pays off for large batches)
+    'window_chars': 200  # NER runs only on text this close to a CXO title mention
+}
+
+# LLM Extraction Input Configuration (what part of a page the extraction prompt contains)
+LLM_INPUT_CONFIG = {
+    'token_budget': 1000,  # Approximate article tokens per extraction prompt
+    'chars_per_token': 4,  # Rough estimate for English text
+    'window_chars': 150,  # Text kept on each side of a CXO title or person mention
+    'request_token_budget': 4000,  # Article tokens packed into one extraction request
+    'max_articles_per_request': 8,
+    'parallel_requests': 2  # Packed requests of one company sent at once
+}
+
+# OpenAI Gateway Configuration (every LLM call; concurrency cap is BATCH_CONFIG['service_concurrency']['openai'])
+LLM_GATEWAY_CONFIG = {
+    'requests_per_minute': 500,  # Size to the account's rate limits
+    'tokens_per_minute': 200000,  # Prompt estimate plus max_tokens per request
+    'burst_seconds': 10,  # Limiter capacity in seconds of rate
+    'timeout_seconds': 60,
+    'max_retries': 5,  # On 429, 5xx, timeouts and connection errors
+    'backoff_base_seconds': 1,  # Doubles per retry, with jitter; a longer Retry-After wins
+    'backoff_max_seconds': 30
+}
+
+# Cache Configuration
+CACHE_CONFIG = {
+    'enabled': True,
+    'db_path': 'cache/cache.sqlite3',
+
+    # SerpAPI result cache, TTL in seconds per query class
+    'search_ttl_seconds': {
+        'executive_team': 7 * 24 * 3600,
+        'enrichment': 30 * 24 * 3600,
+        'default': 7 * 24 * 3600
+    },
+    'search_max_entries': 50000,
+    'search_max_bytes': 200 * 1024 * 1024,
+    
+    # Page cache (compressed HTML + extracted article), revalidated with ETag/Last-Modified
+    'page_fresh_seconds': 6 * 3600,  # Reuse without any request while younger than this
+    'page_ttl_seconds': 30 * 24 * 3600,
+    'page_max_entries': 20000,
+    'page_max_bytes': 500 * 1024 * 1024,
+    
+    # OpenAI response cache, keyed on (model, messages, params)
+    'llm_ttl_seconds': 30 * 24 * 3600,
+    'llm_max_entries': 100000,
+    'llm_max_bytes': 200 * 1024 * 1024
+}
+
+# Lead Store Configuration (SQLite system of record; CSV files remain export formats)
+STORE_CONFIG = {
+    'enabled': True,
+    'db_path': 'leads.sqlite3',
+    'import_csv_on_first_use': True,  # Load executives.csv into an empty store
+    'search_candidate_limit': 1000  # Full-text matches ranked per query (newest first)
+}
+
+# Record/replay of external traffic (SerpAPI, page downloads, OpenAI) for deterministic re-runs
+CASSETTE_CONFIG = {
+    'mode': os.getenv('LEADS_CASSETTE_MODE'),  # 'record', 'replay' or None for live traffic
+    'path': os.getenv('LEADS_CASSETTE', 'cassettes/cassette.sqlite3'),
+    'replay_latency': os.getenv('LEADS_CASSETTE_LATENCY', 'recorded'),  # 'recorded' timings or fixed seconds per exchange
+    'latency_scale': 1.0  # Multiplier applied to recorded timings on replay
 }
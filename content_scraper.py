@@ -1,11 +1,19 @@
 import requests
 import time
-import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
 from fake_useragent import UserAgent
-from config import SCRAPING_CONFIG
-from bs4 import BeautifulSoup
+from config import SCRAPING_CONFIG, CACHE_CONFIG
+from concurrency import service_slot, run_sync
+from metrics import timed, count
+from cache_store import get_cache_store
+from html_extractor import get_extractor, BeautifulSoupExtractor
+from title_matcher import page_keywords, article_keywords
+import cassette
 
 class ContentScraper:
     def __init__(self):
@@ -20,6 +28,36 @@ class ContentScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        
+        # One pooled session per host, created on demand
+        self._host_sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        
+        # HTML extraction backend (lxml when available) with BeautifulSoup fallback
+        self.extractor = get_extractor()
+        self.fallback_extractor = BeautifulSoupExtractor()
+        
+        # On-disk page cache (raw HTML, extracted article and HTTP validators)
+        if CACHE_CONFIG.get('enabled', True):
+            self.page_cache = get_cache_store(
+                'pages',
+                max_entries=CACHE_CONFIG.get('page_max_entries'),
+                max_bytes=CACHE_CONFIG.get('page_max_bytes')
+            )
+        else:
+            self.page_cache = None
+        
+        # Streaming download counters
+        self.download_stats = {
+            'pages_downloaded': 0,
+            'bytes_downloaded': 0,
+            'aborted_content_type': 0,
+            'aborted_content_length': 0,
+            'aborted_stream': 0,
+            'aborted_unknown_size': 0,  # Aborts without a Content-Length: their savings are unknown
+            'bytes_saved': 0
+        }
+        self._stats_lock = threading.Lock()
     
     def process_articles(self, search_results: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
@@ -34,38 +72,30 @@ class ContentScraper:
             'amazon.com', 'podcasts.apple.com', 'x.com'
         ]
         
-        for i, result in enumerate(search_results):
-            try:
-                url = result['url']
-                domain = urlparse(url).netloc.lower()
-                
-                # Skip problematic domains
-                if any(skip_domain in domain for skip_domain in skip_domains):
-                    print(f"Skipping {url} (problematic domain)")
-                    continue
-                
-                print(f"Processing source {i + 1}/{len(search_results)}: {url}")
-                
-                article_data = self.process_single_article(url)
-                if article_data:
-                    # Merge with search result data
-                    article_data.update({
-                        'search_title': result['title'],
-                        'search_snippet': result['snippet'],
-                        'search_query': result['search_query']
-                    })
-                    processed_articles.append(article_data)
-                
-                # Random delay between requests
-                time.sleep(random.uniform(1, 2))
-                
-                # Rotate user agent periodically
-                if i % 5 == 0:
-                    self.session.headers['User-Agent'] = self.ua.random
-                
-            except Exception as e:
-                print(f"Error processing {result['url']}: {e}")
+        to_fetch = []
+        for result in search_results:
+            url = result['url']
+            domain = urlparse(url).netloc.lower()
+            
+            # Skip problematic domains
+            if any(skip_domain in domain for skip_domain in skip_domains):
+                print(f"Skipping {url} (problematic domain)")
                 continue
+            
+            to_fetch.append(result)
+        
+        print(f"Processing {len(to_fetch)}/{len(search_results)} sources concurrently")
+        articles = self.fetch_many([result['url'] for result in to_fetch])
+        
+        for result, article_data in zip(to_fetch, articles):
+            if article_data:
+                # Merge with search result data
+                article_data.update({
+                    'search_title': result['title'],
+                    'search_snippet': result['snippet'],
+                    'search_query': result['search_query']
+                })
+                processed_articles.append(article_data)
         
         return processed_articles
     
@@ -89,113 +119,258 @@ class ContentScraper:
     
     def _fallback_processing(self, url: str) -> Optional[Dict[str, Any]]:
         """
-        Primary processing method using requests and BeautifulSoup
+        Primary processing method: streamed download plus HTML extraction
         """
         try:
-            # Make request with proper headers
-            headers = {
-                'User-Agent': self.ua.random,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            response = self.session.get(url, timeout=15, headers=headers)
-            response.raise_for_status()
-            
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title = ""
-            title_selectors = [
-                'h1', 'title', 
-                'meta[property="og:title"]',
-                'meta[name="twitter:title"]',
-                '.page-title', '.post-title', '.article-title'
-            ]
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text(strip=True) if element.name != 'meta' else element.get('content', '')
-                    if title and len(title) > 5:
-                        break
-            
-            # Extract text content
-            text = ""
+            cache_key = None
+            cached = None
+            if self.page_cache:
+                cache_key = self.page_cache.make_key({'url': url})
+                cached = self.page_cache.get(cache_key, label='pages')
             
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'menu', 'iframe']):
-                element.decompose()
+            # Recently fetched pages are reused without touching the network
+            if cached and time.time() - cached['fetched_at'] < CACHE_CONFIG.get('page_fresh_seconds', 0):
+                print(f"💾 Using cached page: {url}")
+                count('page.fetch', 'cache_hits')
+                return self._cached_article(url, cache_key, cached)
             
-            # Try to find main content with multiple selectors
-            main_selectors = [
-                'main', 'article', 
-                '.content', '.post-content', '.entry-content', '#content',
-                '.main-content', '.article-content', '.post-body',
-                '.page-content', '.story-content', '.text-content'
-            ]
-            main_content = None
+            validators = None
+            if cached and (cached.get('etag') or cached.get('last_modified')):
+                validators = {'etag': cached.get('etag'), 'last_modified': cached.get('last_modified')}
             
-            for selector in main_selectors:
-                main_content = soup.select_one(selector)
-                if main_content:
-                    break
-            
-            if main_content:
-                text = main_content.get_text(strip=True)
-            else:
-                # Fallback to body text, but exclude navigation and other noise
-                body = soup.find('body')
-                if body:
-                    # Remove navigation and other noise
-                    for noise in body.find_all(['nav', 'header', 'footer', 'aside', 'menu']):
-                        noise.decompose()
-                    text = body.get_text(strip=True)
-                else:
-                    text = soup.get_text(strip=True)
-            
-            # Clean up text
-            text = ' '.join(text.split())
-            
-            # Check content size to avoid memory issues
-            if len(text) > 50000:  # Skip very large content (50KB+)
-                print(f"❌ Content too large ({len(text)} chars): {url}")
+            download = self._download(url, validators=validators)
+            if download is None:
                 return None
             
-            # Check if we have enough content
-            if len(text) < 200:
-                print(f"❌ Too little content ({len(text)} chars): {url}")
-                return None
+            # Unchanged since the cached copy: skip parsing entirely
+            if download['status'] == 304 and cached:
+                print(f"♻️ Page not modified, using cached copy: {url}")
+                count('page.fetch', 'not_modified')
+                cached['fetched_at'] = time.time()
+                article_data = self._cached_article(url, cache_key, cached)
+                self.page_cache.set(cache_key, cached, ttl=CACHE_CONFIG.get('page_ttl_seconds'))
+                return article_data
             
-            # Check if content is relevant (contains executive-related keywords)
-            text_lower = text.lower()
-            executive_keywords = ['ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio', 'chief', 'executive', 'president', 'director']
-            if not any(keyword in text_lower for keyword in executive_keywords):
-                print(f"❌ Content not relevant to executives: {url}")
-                return None
+            article_data = self._parse_article(url, download['content'])
             
-            article_data = {
-                'url': url,
-                'title': title,
-                'text': text,
-                'summary': text[:500] if text else '',
-                'keywords': [],
-                'publish_date': None,
-                'authors': [],
-                'domain': urlparse(url).netloc,
-                'word_count': len(text.split())
-            }
+            if self.page_cache:
+                self.page_cache.set(cache_key, {
+                    'etag': download['etag'],
+                    'last_modified': download['last_modified'],
+                    'fetched_at': time.time(),
+                    # Raw bytes as latin-1 so they round-trip through JSON; the
+                    # store compresses the whole entry
+                    'html': download['content'].decode('latin-1'),
+                    'extractor': self.extractor.name,
+                    'article_data': article_data
+                }, ttl=CACHE_CONFIG.get('page_ttl_seconds'))
             
-            print(f"✅ Successfully processed ({len(text)} chars): {url}")
             return article_data
             
         except Exception as e:
             print(f"❌ Processing failed for {url}: {e}")
             return None
     
+    def _cached_article(self, url: str, cache_key: str, cached: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached article, re-extracting from the cached HTML if it
+        was produced by a different extraction backend
+        """
+        if cached.get('extractor') == self.extractor.name or not cached.get('html'):
+            return cached['article_data']
+        
+        print(f"🔁 Re-extracting cached page with {self.extractor.name}: {url}")
+        cached['article_data'] = self._parse_article(url, cached['html'].encode('latin-1'))
+        cached['extractor'] = self.extractor.name
+        self.page_cache.set(cache_key, cached, ttl=CACHE_CONFIG.get('page_ttl_seconds'))
+        return cached['article_data']
+    
+    @timed('page.fetch')
+    def _download(self, url: str, validators: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Stream the page body over the pooled, keep-alive session for its host
+        
+        Content-Type and Content-Length are checked before any body is read,
+        and the transfer is aborted as soon as it exceeds max_page_bytes.
+        With validators (etag/last_modified) the request is conditional and a
+        304 response comes back with an empty body.
+        
+        Returns a dict with status, content, etag and last_modified, or None.
+        """
+        # Make request with proper headers
+        headers = {
+            'User-Agent': self.ua.random,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+        timeout = (SCRAPING_CONFIG.get('connect_timeout', 5), SCRAPING_CONFIG.get('read_timeout', 15))
+        max_bytes = SCRAPING_CONFIG.get('max_page_bytes', 2 * 1024 * 1024)
+        allowed_types = SCRAPING_CONFIG.get('allowed_content_types', ['text/html'])
+        
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        
+        with service_slot('http'):
+            response = cassette.http_get(self._get_session(url), url, timeout=timeout, headers=headers, stream=True)
+            try:
+                if response.status_code == 304:
+                    return {
+                        'status': 304,
+                        'content': b'',
+                        'etag': response.headers.get('ETag') or (validators or {}).get('etag'),
+                        'last_modified': response.headers.get('Last-Modified') or (validators or {}).get('last_modified')
+                    }
+                
+                response.raise_for_status()
+                
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type and not any(allowed in content_type for allowed in allowed_types):
+                    print(f"❌ Skipping non-HTML content ({content_type}): {url}")
+                    self._record_abort('aborted_content_type', self._content_length(response) or None)
+                    return None
+                
+                content_length = self._content_length(response)
+                if content_length > max_bytes:
+                    print(f"❌ Page too large ({content_length} bytes): {url}")
+                    self._record_abort('aborted_content_length', content_length)
+                    return None
+                
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(chunk_size=16384):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        print(f"❌ Page exceeded {max_bytes} bytes during download: {url}")
+                        wire_bytes = response.raw.tell() if hasattr(response.raw, 'tell') else received
+                        self._record_abort('aborted_stream',
+                                           max(content_length - wire_bytes, 0) if content_length else None)
+                        return None
+                    chunks.append(chunk)
+            finally:
+                response.close()
+        
+        with self._stats_lock:
+            self.download_stats['pages_downloaded'] += 1
+            self.download_stats['bytes_downloaded'] += received
+        count('page.fetch', 'bytes', received)
+        
+        return {
+            'status': response.status_code,
+            'content': b''.join(chunks),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+    
+    @staticmethod
+    def _content_length(response) -> int:
+        """Declared body size in bytes, or 0 when unknown"""
+        try:
+            return int(response.headers.get('Content-Length') or 0)
+        except ValueError:
+            return 0
+    
+    def _record_abort(self, reason: str, bytes_saved: Optional[int]):
+        """
+        Count an early-aborted download and the bytes it avoided transferring
+
+        bytes_saved is None when the response declared no Content-Length
+        (chunked pages); those aborts are counted in aborted_unknown_size.
+        """
+        with self._stats_lock:
+            self.download_stats[reason] += 1
+            if bytes_saved is None:
+                self.download_stats['aborted_unknown_size'] += 1
+            else:
+                self.download_stats['bytes_saved'] += bytes_saved
+        count('page.fetch', 'aborted')
+    
+    def get_download_stats(self) -> Dict[str, int]:
+        """
+        Return download counters, including aborts and bytes saved by them
+
+        bytes_saved only covers aborted responses that declared their length;
+        aborted_unknown_size counts the others.
+        """
+        with self._stats_lock:
+            return dict(self.download_stats)
+    
+    def _get_session(self, url: str) -> requests.Session:
+        """
+        Return the session dedicated to this URL's host, so connections are
+        pooled per host and reused across requests (HTTP/1.1 keep-alive)
+        """
+        host = urlparse(url).netloc.lower()
+        
+        with self._sessions_lock:
+            session = self._host_sessions.get(host)
+            if session is None:
+                pool_size = SCRAPING_CONFIG.get('per_domain_concurrency', 2)
+                session = requests.Session()
+                session.headers.update(self.session.headers)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._host_sessions[host] = session
+            return session
+    
+    @timed('page.parse')
+    def _parse_article(self, url: str, content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Extract title and main text from a downloaded page
+        """
+        # Single-pass extraction with the configured backend, BeautifulSoup as fallback
+        try:
+            extracted = self.extractor.extract(content)
+        except Exception as e:
+            if self.extractor.name == self.fallback_extractor.name:
+                raise
+            print(f"⚠️ {self.extractor.name} extraction failed ({e}), retrying with BeautifulSoup: {url}")
+            extracted = self.fallback_extractor.extract(content)
+        
+        title = extracted['title']
+        text = extracted['text']
+        meta = extracted['meta']
+        
+        # Clean up text
+        text = ' '.join(text.split())
+        
+        # Check content size to avoid memory issues
+        if len(text) > 50000:  # Skip very large content (50KB+)
+            print(f"❌ Content too large ({len(text)} chars): {url}")
+            return None
+        
+        # Check if we have enough content
+        if len(text) < 200:
+            print(f"❌ Too little content ({len(text)} chars): {url}")
+            return None
+        
+        # Check if content is relevant (contains executive-related keywords)
+        if not page_keywords.search(text):
+            print(f"❌ Content not relevant to executives: {url}")
+            return None
+        
+        article_data = {
+            'url': url,
+            'title': title,
+            'text': text,
+            'summary': text[:500] if text else '',
+            'keywords': [],
+            'publish_date': None,
+            'authors': [],
+            'domain': urlparse(url).netloc,
+            'word_count': len(text.split()),
+            'meta_description': meta.get('description') or meta.get('og:description', '')
+        }
+        
+        print(f"✅ Successfully processed ({len(text)} chars): {url}")
+        return article_data
+    
     def _is_valid_article(self, article_data: Dict[str, Any]) -> bool:
         """
         Check if article is valid for executive information extraction
@@ -205,16 +380,7 @@ class ContentScraper:
             return False
         
         # Check for executive-related keywords in title or text
-        executive_keywords = [
-            'executive', 'ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio',
-            'chief', 'president', 'director', 'manager', 'officer',
-            'leadership', 'management', 'board', 'appointed', 'named',
-            'joins', 'leaves', 'retires', 'promoted'
-        ]
-        
-        text_to_check = f"{article_data['title']} {article_data['text']}".lower()
-        
-        return any(keyword in text_to_check for keyword in executive_keywords)
+        return article_keywords.search(article_data['title']) or article_keywords.search(article_data['text'])
     
     def get_article_text(self, url: str) -> Optional[str]:
         """
@@ -227,28 +393,66 @@ class ContentScraper:
         """
         Process multiple URLs with controlled concurrency
         """
-        results = []
+        articles = self.fetch_many(urls, max_concurrent=max_concurrent)
+        return [article for article in articles if article]
+    
+    def fetch_many(self, urls: List[str], max_concurrent: int = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch and process many URLs concurrently
         
-        for i in range(0, len(urls), max_concurrent):
-            batch = urls[i:i + max_concurrent]
-            batch_results = []
-            
-            for url in batch:
-                try:
-                    article_data = self.process_single_article(url)
-                    if article_data:
-                        batch_results.append(article_data)
-                except Exception as e:
-                    print(f"Error in batch processing {url}: {e}")
-            
-            results.extend(batch_results)
+        Returns one entry per URL, in input order (None where processing failed).
+        """
+        if not urls:
+            return []
+        return run_sync(self.fetch_many_async(urls, max_concurrent=max_concurrent))
+    
+    async def fetch_many_async(self, urls: List[str], max_concurrent: int = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Asyncio fetch engine behind fetch_many
+        
+        A global semaphore caps pages in flight, while each domain gets its own
+        concurrency limit and a minimum interval between request starts. Pages
+        are downloaded on worker threads over per-host keep-alive pools, so N
+        page loads take roughly as long as the slowest domain's queue.
+        """
+        if max_concurrent is None:
+            max_concurrent = SCRAPING_CONFIG.get('max_concurrent_fetches', 8)
+        per_domain_limit = SCRAPING_CONFIG.get('per_domain_concurrency', 2)
+        per_domain_delay = SCRAPING_CONFIG.get('per_domain_delay', 0.5)
+        
+        loop = asyncio.get_running_loop()
+        global_semaphore = asyncio.Semaphore(max_concurrent)
+        domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+        domain_locks: Dict[str, asyncio.Lock] = {}
+        domain_last_start: Dict[str, float] = {}
+        executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix='fetch')
+        
+        async def wait_for_domain_turn(domain: str):
+            """Space out request starts to the same domain"""
+            async with domain_locks.setdefault(domain, asyncio.Lock()):
+                elapsed = loop.time() - domain_last_start.get(domain, float('-inf'))
+                if elapsed < per_domain_delay:
+                    await asyncio.sleep(per_domain_delay - elapsed)
+                domain_last_start[domain] = loop.time()
+        
+        async def fetch_one(url: str) -> Optional[Dict[str, Any]]:
+            domain = urlparse(url).netloc.lower()
+            domain_semaphore = domain_semaphores.setdefault(domain, asyncio.Semaphore(per_domain_limit))
             
-            # Delay between batches
-            if i + max_concurrent < len(urls):
-                time.sleep(random.uniform(2, 5))
+            async with domain_semaphore:
+                async with global_semaphore:
+                    await wait_for_domain_turn(domain)
+                    try:
+                        return await loop.run_in_executor(executor, self.process_single_article, url)
+                    except Exception as e:
+                        print(f"Error fetching {url}: {e}")
+                        return None
         
-        return results 
-
+        try:
+            return await asyncio.gather(*(fetch_one(url) for url in urls))
+        finally:
+            executor.shutdown(wait=False)
+    
     def _should_skip_url(self, url: str) -> bool:
         """
         Check if URL should be skipped based on file type or other criteria
@@ -1,7 +1,9 @@
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any
-from config import OUTPUT_CONFIG, BATCH_CONFIG
+from config import OUTPUT_CONFIG, BATCH_CONFIG, STORE_CONFIG
+from file_utils import file_lock, atomic_write, read_csv_header, ends_with_newline
+from lead_store import get_lead_store
 
 class DataExporter:
     def __init__(self):
@@ -45,32 +47,35 @@ class DataExporter:
         df = pd.DataFrame(csv_data)
         
         if append_mode:
-            # Append to existing file
-            try:
-                existing_df = pd.read_csv(filename)
-                # Add batch columns if they don't exist
-                if 'Batch_Mode' not in existing_df.columns:
-                    existing_df['Batch_Mode'] = 'No'
-                if 'Processing_Date' not in existing_df.columns:
-                    existing_df['Processing_Date'] = ''
-                if 'Company_Industry' not in existing_df.columns:
-                    existing_df['Company_Industry'] = ''
-                
-                # Combine existing and new data
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
-                combined_df.to_csv(filename, index=False, encoding='utf-8')
-                print(f"✅ Appended {len(executives)} executives to {filename}")
-            except FileNotFoundError:
-                # File doesn't exist, create new
-                df.to_csv(filename, index=False, encoding='utf-8')
+            # Append to existing file (batch columns default to 'No' for older files)
+            outcome = self._append_rows(df, filename, {'Batch_Mode': 'No', 'Processing_Date': '', 'Company_Industry': ''})
+            if outcome == 'created':
                 print(f"✅ Created new file {filename} with {len(executives)} executives")
+            else:
+                print(f"✅ Appended {len(executives)} executives to {filename}")
         else:
             # Overwrite existing file
-            df.to_csv(filename, index=False, encoding='utf-8')
+            self._overwrite(df, filename)
             print(f"✅ Exported {len(executives)} executives to {filename}")
         
+        # The lead store is the system of record; the CSV above is an export of it
+        if STORE_CONFIG.get('enabled', True) and executives:
+            self.save_to_store(executives, source='batch' if batch_mode else 'export',
+                               batch_mode=self.batch_mode_flag if batch_mode else '')
+        
         return filename
     
+    def save_to_store(self, executives: List[Dict[str, Any]], source: str = 'export', batch_mode: str = '') -> int:
+        """
+        Upsert executives into the SQLite lead store as one recorded run
+        """
+        store = get_lead_store()
+        run_id = store.start_run(source)
+        written = store.upsert_executives(executives, run_id=run_id, batch_mode=batch_mode)
+        store.finish_run(run_id, written)
+        print(f"✅ Saved {written} executives to lead store")
+        return written
+    
     def export_detailed_csv(self, executives: List[Dict[str, Any]], filename: str = None, append_mode: bool = False, batch_mode: bool = False) -> str:
         """
         Export detailed executive data with additional fields
@@ -111,31 +116,67 @@ class DataExporter:
         
         if append_mode:
             # Append to existing file
-            try:
-                existing_df = pd.read_csv(filename)
-                # Add batch columns if they don't exist
-                if 'Batch_Mode' not in existing_df.columns:
-                    existing_df['Batch_Mode'] = ''
-                if 'Processing_Date' not in existing_df.columns:
-                    existing_df['Processing_Date'] = ''
-                if 'Company_Industry' not in existing_df.columns:
-                    existing_df['Company_Industry'] = ''
-                
-                # Combine existing and new data
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
-                combined_df.to_csv(filename, index=False, encoding='utf-8')
-                print(f"✅ Appended detailed data for {len(executives)} executives to {filename}")
-            except FileNotFoundError:
-                # File doesn't exist, create new
-                df.to_csv(filename, index=False, encoding='utf-8')
+            outcome = self._append_rows(df, filename, {'Batch_Mode': '', 'Processing_Date': '', 'Company_Industry': ''})
+            if outcome == 'created':
                 print(f"✅ Created new detailed file {filename} with {len(executives)} executives")
+            else:
+                print(f"✅ Appended detailed data for {len(executives)} executives to {filename}")
         else:
             # Overwrite existing file
-            df.to_csv(filename, index=False, encoding='utf-8')
+            self._overwrite(df, filename)
             print(f"✅ Exported detailed data for {len(executives)} executives to {filename}")
         
         return filename
     
+    def _append_rows(self, df: pd.DataFrame, filename: str, legacy_defaults: Dict[str, str]) -> str:
+        """
+        Append new rows to a CSV without reading the existing rows
+        
+        The header is checked first: when the file already has every column
+        the new rows are written in the file's column order. Only a file
+        missing columns (written before the batch columns existed) is
+        rewritten once, atomically, with legacy_defaults filled in.
+        
+        Returns 'created', 'appended' or 'rewritten'.
+        """
+        with file_lock(filename):
+            header = read_csv_header(filename)
+            
+            if header is None:
+                with atomic_write(filename) as f:
+                    df.to_csv(f, index=False)
+                return 'created'
+            
+            missing_columns = [column for column in df.columns if column not in header]
+            
+            if not missing_columns:
+                rows = df.reindex(columns=header, fill_value='')
+                needs_newline = not ends_with_newline(filename)
+                with open(filename, 'a', encoding='utf-8', newline='') as f:
+                    if needs_newline:
+                        f.write('\n')
+                    rows.to_csv(f, index=False, header=False)
+                return 'appended'
+            
+            # Schema evolution: add the new columns to the existing rows once
+            try:
+                existing_df = pd.read_csv(filename, dtype=str, keep_default_na=False)
+            except UnicodeDecodeError:
+                existing_df = pd.read_csv(filename, dtype=str, keep_default_na=False, encoding='latin-1')
+            for column in missing_columns:
+                existing_df[column] = legacy_defaults.get(column, '')
+            
+            combined_df = pd.concat([existing_df, df], ignore_index=True)
+            with atomic_write(filename) as f:
+                combined_df.to_csv(f, index=False)
+            return 'rewritten'
+    
+    def _overwrite(self, df: pd.DataFrame, filename: str):
+        """Replace a CSV atomically while holding its lock"""
+        with file_lock(filename):
+            with atomic_write(filename) as f:
+                df.to_csv(f, index=False)
+    
     def generate_summary_report(self, executives: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate a summary report of the extraction results
@@ -1,15 +1,56 @@
 import re
-import openai
+import json
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import spacy
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from email_validator import validate_email, EmailNotValidError
-from config import OPENAI_API_KEY, CXO_POSITIONS
+from config import OPENAI_API_KEY, NER_CONFIG, LLM_INPUT_CONFIG
+from llm_client import chat_completion
+from llm_gateway import get_llm_gateway
+from executive_index import ExecutiveIndex
+from metrics import span, timed, count
+from title_matcher import cxo_titles
+
+# Characters of the page the extraction prompt used to contain (baseline for tokens saved)
+LEGACY_PROMPT_CHARS = 4000
+
+def unused_components(nlp, keep: List[str]) -> List[str]:
+    """
+    Names of the pipeline components not needed to run the components in keep
+    
+    Shared embedding layers (tok2vec, transformer) are kept when a kept
+    component listens to them; in en_core_web_sm the NER has its own.
+    """
+    needed = set(keep)
+    for name, component in nlp.pipeline:
+        listeners = getattr(component, 'listening_components', None) or []
+        if any(listener in needed for listener in listeners):
+            needed.add(name)
+    return [name for name in nlp.pipe_names if name not in needed]
+
+def _widen(text: str, start: int, end: int, radius: int) -> Tuple[int, int]:
+    """Span of text within radius of [start, end), widened to whole words"""
+    start = text.rfind(' ', 0, max(0, start - radius)) + 1
+    end = text.find(' ', min(len(text), end + radius))
+    return start, len(text) if end == -1 else end
+
+def _merge_spans(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sort spans and merge those that overlap or touch"""
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
 
 class ExecutiveExtractor:
     def __init__(self):
         if OPENAI_API_KEY:
             try:
-                self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
+                self.client = get_llm_gateway()
             except Exception as e:
                 print(f"Warning: Could not initialize OpenAI client: {e}")
                 self.client = None
@@ -17,19 +58,35 @@ class ExecutiveExtractor:
             self.client = None
         
         # Load spaCy model for NER
+        model = NER_CONFIG.get('model', 'en_core_web_sm')
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load(model)
         except OSError:
             print("spaCy model not found. Installing...")
             import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
+            subprocess.run(["python", "-m", "spacy", "download", model])
+            self.nlp = spacy.load(model)
+        
+        # Only doc.ents is used, so the tagger, parser, lemmatizer etc. never run
+        self.nlp.select_pipes(disable=unused_components(self.nlp, NER_CONFIG.get('keep_components', ['ner'])))
+        
+        # Article text sent to the LLM against what the legacy page head would have been
+        self.llm_input_stats = {
+            'articles': 0,
+            'windowed': 0,
+            'chars_sent': 0,
+            'chars_legacy': 0
+        }
+        self._stats_lock = threading.Lock()
+        
+        # spaCy pipelines are not guaranteed thread-safe; serialize NER calls
+        self._nlp_lock = threading.Lock()
     
     def extract_executives_from_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Extract executive information from multiple articles with target limit
         """
-        executives = []
+        executive_index = ExecutiveIndex()
         
         # Import config to get target count
         from config import BATCH_CONFIG
@@ -37,26 +94,23 @@ class ExecutiveExtractor:
         
         print(f"🎯 Target: Extract up to {target_executive_count} unique executives")
         
-        for i, article in enumerate(articles):
+        for i, article, entities, ai_executives in self._articles_with_extractions(articles):
             try:
                 print(f"Extracting executives from article {i + 1}/{len(articles)}")
                 
-                article_executives = self.extract_from_single_article(article)
-                executives.extend(article_executives)
+                article_executives = self.extract_from_single_article(article, entities, ai_executives)
                 
-                # Check if we've reached the target after deduplication
-                unique_executives = self._deduplicate_executives(executives)
-                if len(unique_executives) >= target_executive_count:
-                    print(f"✅ Reached target executive count ({len(unique_executives)}), stopping extraction")
-                    executives = unique_executives[:target_executive_count]  # Limit to target
+                # Duplicates are merged on insert, so the unique count is always current
+                executive_index.extend(article_executives)
+                if len(executive_index) >= target_executive_count:
+                    print(f"✅ Reached target executive count ({len(executive_index)}), stopping extraction")
                     break
                 
             except Exception as e:
                 print(f"Error extracting from article {i + 1}: {e}")
                 continue
         
-        # Remove duplicates and merge information (final deduplication)
-        unique_executives = self._deduplicate_executives(executives)
+        unique_executives = executive_index.values()
         
         # Limit to target count
         if len(unique_executives) > target_executive_count:
@@ -68,27 +122,29 @@ class ExecutiveExtractor:
         
         return enriched_executives
     
-    def extract_executives_basic_from_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def extract_executives_basic_from_articles(self, articles: List[Dict[str, Any]],
+                                               target_executive_count: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Extract only basic executive info (name, title, company/bank, source) from articles, without enrichment.
+        Stops at target_executive_count (default: BATCH_CONFIG['target_executives_per_company']).
         """
-        executives = []
-        from config import BATCH_CONFIG
-        target_executive_count = BATCH_CONFIG.get('target_executives_per_company', 5)
+        executive_index = ExecutiveIndex()
+        if target_executive_count is None:
+            from config import BATCH_CONFIG
+            target_executive_count = BATCH_CONFIG.get('target_executives_per_company', 5)
         print(f"🎯 [Basic] Target: Extract up to {target_executive_count} unique executives (basic info only)")
         
-        for i, article in enumerate(articles):
+        for i, article, entities, ai_executives in self._articles_with_extractions(articles):
             try:
                 print(f"[Basic] Extracting executives from article {i + 1}/{len(articles)}")
-                article_executives = self.extract_from_single_article(article)
-                executives.extend(article_executives)
+                article_executives = self.extract_from_single_article(article, entities, ai_executives)
                 
-                # Check if we've reached the target after deduplication
-                unique_executives = self._deduplicate_executives(executives)
-                if len(unique_executives) >= target_executive_count:
-                    print(f"✅ [Basic] Reached target executive count ({len(unique_executives)}), stopping extraction")
+                # Duplicates are merged on insert, so the unique count is always current
+                executive_index.extend(article_executives)
+                if len(executive_index) >= target_executive_count:
+                    print(f"✅ [Basic] Reached target executive count ({len(executive_index)}), stopping extraction")
                     # Limit to target count and return immediately
-                    limited_executives = unique_executives[:target_executive_count]
+                    limited_executives = executive_index.values()[:target_executive_count]
                     # Only keep basic fields
                     basic_executives = []
                     for ex in limited_executives:
@@ -106,7 +162,7 @@ class ExecutiveExtractor:
                 continue
         
         # If we get here, we didn't reach the target, so return what we have
-        unique_executives = self._deduplicate_executives(executives)
+        unique_executives = executive_index.values()
         if len(unique_executives) > target_executive_count:
             unique_executives = unique_executives[:target_executive_count]
         
@@ -122,22 +178,114 @@ class ExecutiveExtractor:
             })
         return basic_executives
     
-    def extract_from_single_article(self, article: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _articles_with_entities(self, articles: List[Dict[str, Any]]):
+        """
+        Yield (index, article, entities), running NER one nlp.pipe batch of
+        articles at a time, so a caller that stops early skips later batches
+        """
+        batch_size = max(1, NER_CONFIG.get('batch_size', 16))
+        for start in range(0, len(articles), batch_size):
+            batch = articles[start:start + batch_size]
+            entities = self._recognize_entities([self._article_text(article) for article in batch])
+            for offset, (article, article_entities) in enumerate(zip(batch, entities)):
+                yield start + offset, article, article_entities
+    
+    def _articles_with_extractions(self, articles: List[Dict[str, Any]]):
+        """
+        Yield (index, article, entities, ai_executives), extracting with
+        OpenAI for several consecutive articles per request
+        
+        Articles are packed in order until their LLM contexts fill
+        request_token_budget or max_articles_per_request. Up to
+        parallel_requests packed requests are sent at once, and only when
+        the first of their articles is needed, so a caller that stops early
+        never pays for later rounds. ai_executives is None without OpenAI.
+        """
+        source = self._articles_with_entities(articles)
+        if not (OPENAI_API_KEY and self.client):
+            for i, article, entities in source:
+                yield i, article, entities, None
+            return
+        
+        budget = (LLM_INPUT_CONFIG.get('request_token_budget', 4000) *
+                  LLM_INPUT_CONFIG.get('chars_per_token', 4))
+        max_articles = max(1, LLM_INPUT_CONFIG.get('max_articles_per_request', 8))
+        parallel = max(1, LLM_INPUT_CONFIG.get('parallel_requests', 2))
+        lookahead = deque()
+        
+        def pull() -> bool:
+            item = next(source, None)
+            if item is None:
+                return False
+            i, article, entities = item
+            lookahead.append((i, article, entities, self._llm_context(article['text'], entities['persons'])))
+            return True
+        
+        def next_pack() -> list:
+            pack = [lookahead.popleft()]
+            size = len(pack[0][1]['title']) + len(pack[0][3])
+            while len(pack) < max_articles and (lookahead or pull()):
+                next_size = len(lookahead[0][1]['title']) + len(lookahead[0][3])
+                if size + next_size > budget:
+                    break
+                pack.append(lookahead.popleft())
+                size += next_size
+            return pack
+        
+        def extract_pack(pack: list) -> List[List[Dict[str, Any]]]:
+            if len(pack) == 1:
+                _, article, _, context = pack[0]
+                return [self._extract_with_openai(self._article_text(article), article, context=context)]
+            return self._extract_with_openai_packed([(article, context) for _, article, _, context in pack])
+        
+        while lookahead or pull():
+            packs = [next_pack()]
+            while len(packs) < parallel and (lookahead or pull()):
+                packs.append(next_pack())
+            
+            # The gateway overlaps the requests of a round (within its shared limits)
+            if len(packs) == 1:
+                results = [extract_pack(packs[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(packs)) as pool:
+                    results = list(pool.map(extract_pack, packs))
+            
+            for pack, pack_results in zip(packs, results):
+                for (i, article, entities, _), ai_executives in zip(pack, pack_results):
+                    yield i, article, entities, ai_executives
+    
+    @staticmethod
+    def _article_text(article: Dict[str, Any]) -> str:
+        """Title and text combined for analysis"""
+        return f"{article['title']}\n\n{article['text']}"
+    
+    @timed('extract.article')
+    def extract_from_single_article(self, article: Dict[str, Any],
+                                    entities: Optional[Dict[str, Any]] = None,
+                                    ai_executives: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Extract executive information from a single article
+        
+        entities is this article's entry from _recognize_entities when NER
+        already ran for a batch of articles, and ai_executives its share of
+        a packed OpenAI request.
         """
         executives = []
         
         # Combine title and text for analysis
-        full_text = f"{article['title']}\n\n{article['text']}"
+        full_text = self._article_text(article)
+        if entities is None:
+            entities = self._recognize_entities([full_text])[0]
         
         # Use OpenAI for extraction if available
-        if OPENAI_API_KEY:
-            ai_executives = self._extract_with_openai(full_text, article)
+        if ai_executives is not None:
+            executives.extend(ai_executives)
+        elif OPENAI_API_KEY:
+            ai_executives = self._extract_with_openai(full_text, article, entities['persons'])
             executives.extend(ai_executives)
         
         # Use spaCy as backup or additional extraction
-        spacy_executives = self._extract_with_spacy(full_text, article)
+        spacy_executives = self._extract_with_spacy(full_text, article, entities)
         executives.extend(spacy_executives)
         
         # Extract emails and LinkedIn profiles
@@ -153,15 +301,21 @@ class ExecutiveExtractor:
         
         return executives
     
-    def _extract_with_openai(self, text: str, article: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_with_openai(self, text: str, article: Dict[str, Any],
+                             persons: Optional[List[str]] = None, context: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Use OpenAI to extract executive information
+        
+        context is the article's _llm_context when the caller already built it.
         """
         if not self.client:
             print("OpenAI client not available")
             return []
             
         try:
+            if context is None:
+                context = self._llm_context(article['text'], persons or [])
+            text = f"{article['title']}\n\n{context}"
             prompt = f"""
             Extract executive information from this article. Look for:
             - Executive names
@@ -171,7 +325,7 @@ class ExecutiveExtractor:
             - LinkedIn profile URLs
             
             Article text:
-            {text[:4000]}  # Limit text length
+            {text}
             
             Return a JSON array of executives found, with this structure:
             [
@@ -188,60 +342,239 @@ class ExecutiveExtractor:
             Only include executives from companies/organizations. If no executives found, return empty array [].
             """
             
-            response = self.client.chat.completions.create(
+            content = chat_completion(
+                self.client,
+                'extract_executives',
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1000,
                 temperature=0.1
-            )
+            ).strip()
             
-            import json
-            content = response.choices[0].message.content.strip()
+            return self._tag_openai_executives(self._parse_json_reply(content), article)
             
-            # Clean up the response
-            if content.startswith('```json'):
-                content = content[7:]
-            if content.endswith('```'):
-                content = content[:-3]
+        except Exception as e:
+            print(f"OpenAI extraction failed: {e}")
+            return []
+    
+    def _extract_with_openai_packed(self, items: List[Tuple[Dict[str, Any], str]]) -> List[List[Dict[str, Any]]]:
+        """
+        Extract executives from several (article, context) pairs in one OpenAI request
+        
+        The reply is a JSON object keyed by article number; each article's
+        executives get its own source_url/source_title. If the request or
+        its reply fails, the articles are extracted one request at a time.
+        """
+        sections = '\n\n'.join(f"=== Article {number} ===\n{article['title']}\n\n{context}"
+                                 for number, (article, context) in enumerate(items, 1))
+        prompt = f"""
+            Extract executive information from each of these articles. Look for:
+            - Executive names
+            - Their titles/positions
+            - The company/organization they work for
+            - Any email addresses
+            - LinkedIn profile URLs
             
-            executives = json.loads(content)
+            Articles:
+            {sections}
             
-            # Add source information and normalize company field
-            for executive in executives:
-                executive.update({
-                    'source_url': article['url'],
-                    'source_title': article['title'],
-                    'extraction_method': 'openai'
-                })
-                # Normalize company field (for backward compatibility)
-                if 'company' in executive and 'bank' not in executive:
-                    executive['bank'] = executive['company']
+            Return a JSON object keyed by article number. Each value is the JSON array of executives found in that article, with this structure:
+            {{
+                "1": [
+                    {{
+                        "name": "Full Name",
+                        "title": "Position Title",
+                        "company": "Company Name",
+                        "email": "email@domain.com" (if found),
+                        "linkedin": "linkedin.com/in/profile" (if found),
+                        "confidence": 0.9
+                    }}
+                ],
+                "2": []
+            }}
             
-            return executives
+            Only include executives from companies/organizations, and only in the article that mentions them. Use an empty array for an article without executives.
+            """
+        
+        try:
+            content = chat_completion(
+                self.client,
+                'extract_executives_packed',
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=min(4000, 1000 * len(items)),
+                temperature=0.1
+            ).strip()
+            
+            by_article = self._parse_json_reply(content)
+            results = [self._tag_openai_executives(by_article.get(str(number)) or [], article)
+                       for number, (article, _) in enumerate(items, 1)]
+            count('openai.extract_executives_packed', 'articles', len(items))
+            return results
             
         except Exception as e:
-            print(f"OpenAI extraction failed: {e}")
-            return []
+            print(f"Packed OpenAI extraction failed ({len(items)} articles), extracting one by one: {e}")
+            return [self._extract_with_openai(self._article_text(article), article, context=context)
+                    for article, context in items]
     
-    def _extract_with_spacy(self, text: str, article: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _parse_json_reply(content: str) -> Any:
+        """Parse a JSON reply, dropping a surrounding ``` or ```json fence"""
+        content = content.strip()
+        if content.startswith('```json'):
+            content = content[7:]
+        if content.startswith('```'):
+            content = content[3:]
+        if content.endswith('```'):
+            content = content[:-3]
+        return json.loads(content)
+    
+    @staticmethod
+    def _tag_openai_executives(executives: List[Dict[str, Any]], article: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Add source information to executives from OpenAI and normalize the company field"""
+        for executive in executives:
+            executive.update({
+                'source_url': article['url'],
+                'source_title': article['title'],
+                'extraction_method': 'openai'
+            })
+            # Normalize company field (for backward compatibility)
+            if 'company' in executive and 'bank' not in executive:
+                executive['bank'] = executive['company']
+        
+        return executives
+    
+    def _llm_context(self, text: str, persons: List[str]) -> str:
+        """
+        The parts of an article worth sending to the LLM, within the token budget
+        
+        Windows of window_chars around whole-word CXO title mentions and the
+        given person names are chosen in order of priority (a title with a
+        person nearby, then a lone title, then a lone person) and joined in
+        page order. Articles that fit the budget are sent whole; articles
+        without any mention fall back to their head.
+        """
+        budget = LLM_INPUT_CONFIG.get('token_budget', 1000) * LLM_INPUT_CONFIG.get('chars_per_token', 4)
+        radius = LLM_INPUT_CONFIG.get('window_chars', 150)
+        
+        windowed = False
+        if len(text) <= budget:
+            context = text
+        else:
+            person_spans = [(match.start(), match.end())
+                            for person in set(persons)
+                            for match in re.finditer(re.escape(person), text)]
+            windows = []
+            for _, title_start, title_end in cxo_titles.finditer(text):
+                start, end = _widen(text, title_start, title_end, radius)
+                has_person = any(start <= p_start and p_end <= end for p_start, p_end in person_spans)
+                windows.append((0 if has_person else 1, start, end))
+            for p_start, p_end in person_spans:
+                windows.append((2,) + _widen(text, p_start, p_end, radius))
+            
+            # Greedily add windows by priority, paying only for characters not already selected
+            selected = []
+            used = 0
+            for _, start, end in sorted(windows):
+                added = (end - start) - sum(max(0, min(end, s_end) - max(start, s_start))
+                                            for s_start, s_end in selected)
+                if used + added <= budget:
+                    selected.append((start, end))
+                    used += added
+            
+            if selected:
+                context = '\n...\n'.join(text[start:end] for start, end in _merge_spans(selected))
+                windowed = True
+            else:
+                context = text[:budget]
+        
+        with self._stats_lock:
+            self.llm_input_stats['articles'] += 1
+            self.llm_input_stats['windowed'] += windowed
+            self.llm_input_stats['chars_sent'] += len(context)
+            self.llm_input_stats['chars_legacy'] += min(len(text), LEGACY_PROMPT_CHARS)
+        count('openai.extract_executives', 'input_chars', len(context))
+        count('openai.extract_executives', 'input_chars_saved', min(len(text), LEGACY_PROMPT_CHARS) - len(context))
+        return context
+    
+    def get_llm_input_stats(self) -> Dict[str, int]:
+        """
+        Return LLM input counters with estimated tokens sent and saved
+        against the legacy 4000-character page head
+        """
+        with self._stats_lock:
+            stats = dict(self.llm_input_stats)
+        chars_per_token = LLM_INPUT_CONFIG.get('chars_per_token', 4)
+        stats['tokens_sent'] = round(stats['chars_sent'] / chars_per_token)
+        stats['tokens_legacy'] = round(stats['chars_legacy'] / chars_per_token)
+        stats['tokens_saved'] = stats['tokens_legacy'] - stats['tokens_sent']
+        return stats
+    
+    def _recognize_entities(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run NER over the candidate windows of each text in one nlp.pipe call
+        
+        Returns one {'text', 'persons', 'organizations'} dict per input, where
+        text is the windowed text the entities were found in. Texts without
+        any CXO title mention are not analysed at all.
+        """
+        windows = [self._candidate_windows(text) for text in texts]
+        results = [{'text': window, 'persons': [], 'organizations': []} for window in windows]
+        pending = [i for i, window in enumerate(windows) if window]
+        
+        try:
+            if pending:
+                with self._nlp_lock, span('spacy.ner'):
+                    docs = self.nlp.pipe((windows[i] for i in pending),
+                                         batch_size=NER_CONFIG.get('batch_size', 16),
+                                         n_process=NER_CONFIG.get('n_process', 1))
+                    for i, doc in zip(pending, docs):
+                        results[i]['persons'] = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
+                        results[i]['organizations'] = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
+        except Exception as e:
+            print(f"spaCy extraction failed: {e}")
+            return [{'text': window, 'persons': [], 'organizations': []} for window in windows]
+        
+        analysed = sum(len(window) for window in windows)
+        count('spacy.ner', 'docs', len(pending))
+        count('spacy.ner', 'chars', analysed)
+        count('spacy.ner', 'chars_skipped', sum(len(text) for text in texts) - analysed)
+        return results
+    
+    def _candidate_windows(self, text: str) -> str:
+        """
+        The parts of text within window_chars of a CXO title mention, merged
+        where they overlap; empty when no title is mentioned
+        
+        A person only becomes an executive when a title occurs within 100
+        characters of their name, so NER elsewhere in the page is wasted.
+        """
+        radius = NER_CONFIG.get('window_chars', 200)
+        if not radius:
+            return text
+        
+        spans = [_widen(text, start, end, radius) for _, start, end in cxo_titles.finditer(text)]
+        return '\n\n'.join(text[start:end] for start, end in _merge_spans(spans))
+    
+    def _extract_with_spacy(self, text: str, article: Dict[str, Any],
+                            entities: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Use spaCy NER to extract executive information
         """
         executives = []
         
         try:
-            doc = self.nlp(text)
-            
-            # Find person names
-            persons = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
+            if entities is None:
+                entities = self._recognize_entities([text])[0]
             
-            # Find organizations (banks)
-            organizations = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
+            # Person names and organizations (banks) found in the candidate windows
+            persons = entities['persons']
+            organizations = entities['organizations']
             
             # Look for executive titles near person names
             for person in persons[:10]:  # Limit to first 10 persons
                 # Find context around the person name
-                person_context = self._find_person_context(text, person)
+                person_context = self._find_person_context(entities['text'], person)
                 
                 if person_context:
                     title = self._extract_title_from_context(person_context)
@@ -285,15 +618,10 @@ class ExecutiveExtractor:
     
     def _extract_title_from_context(self, context: str) -> Optional[str]:
         """
-        Extract executive title from context
+        Extract executive title from context (the most specific one mentioned)
         """
-        context_lower = context.lower()
-        
-        for position in CXO_POSITIONS:
-            if position.lower() in context_lower:
-                return position
-        
-        return None
+        found = cxo_titles.best(context)
+        return found[0] if found else None
     
     def _identify_company_from_context(self, context: str, organizations: List[str]) -> Optional[str]:
         """
@@ -344,32 +672,11 @@ class ExecutiveExtractor:
         """
         Remove duplicate executives and merge information
         """
-        unique_executives = {}
-        
-        for executive in executives:
-            # Create a key based on name and bank
-            key = f"{executive['name'].lower()}_{executive['bank'].lower()}"
-            
-            if key in unique_executives:
-                # Merge information
-                existing = unique_executives[key]
-                
-                # Keep the higher confidence extraction
-                if executive.get('confidence', 0) > existing.get('confidence', 0):
-                    unique_executives[key] = executive
-                
-                # Merge additional information
-                if not existing.get('email') and executive.get('email'):
-                    existing['email'] = executive['email']
-                if not existing.get('linkedin') and executive.get('linkedin'):
-                    existing['linkedin'] = executive['linkedin']
-                if not existing.get('title') and executive.get('title'):
-                    existing['title'] = executive['title']
-            else:
-                unique_executives[key] = executive
-        
-        return list(unique_executives.values())
+        executive_index = ExecutiveIndex()
+        executive_index.extend(executives)
+        return executive_index.values()
     
+    @timed('enrich.executives')
     def _enrich_executives(self, executives: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Enrich executives with LinkedIn profiles and email addresses
@@ -419,7 +726,7 @@ class ExecutiveExtractor:
                 # Add delay between executives to respect rate limits
                 if i < len(executives_to_enrich) - 1:
                     import time
-                    time.sleep(2)  # 2 second delay between executives
+                    time.sleep(BATCH_CONFIG.get('delay_between_executives', 2))
                 
             except Exception as e:
                 print(f"⚠️ Error enriching executive {executive.get('name', 'Unknown')}: {e}")
@@ -457,7 +764,7 @@ class ExecutiveExtractor:
         """
         try:
             # Perform web search
-            search_results = searcher.search_google(query, max_results=3)
+            search_results = searcher.search_google(query, max_results=3, query_class='enrichment')
             
             if not search_results:
                 return None
@@ -493,14 +800,14 @@ class ExecutiveExtractor:
                     Format: linkedin.com/in/username or NOT_FOUND
                     """
                     
-                    response = self.client.chat.completions.create(
+                    result_text = chat_completion(
+                        self.client,
+                        'linkedin_lookup',
                         model="gpt-3.5-turbo",
                         messages=[{"role": "user", "content": prompt}],
                         max_tokens=50,
                         temperature=0.1
-                    )
-                    
-                    result_text = response.choices[0].message.content.strip()
+                    ).strip()
                     
                     if result_text.startswith('linkedin.com/') and result_text != 'NOT_FOUND':
                         return result_text
@@ -516,7 +823,7 @@ class ExecutiveExtractor:
         """
         try:
             # Perform web search
-            search_results = searcher.search_google(query, max_results=3)
+            search_results = searcher.search_google(query, max_results=3, query_class='enrichment')
             
             if not search_results:
                 return None
@@ -557,14 +864,14 @@ class ExecutiveExtractor:
                     Format: email@domain.com or NOT_FOUND
                     """
                     
-                    response = self.client.chat.completions.create(
+                    result_text = chat_completion(
+                        self.client,
+                        'email_lookup',
                         model="gpt-3.5-turbo",
                         messages=[{"role": "user", "content": prompt}],
                         max_tokens=50,
                         temperature=0.1
-                    )
-                    
-                    result_text = response.choices[0].message.content.strip()
+                    ).strip()
                     
                     if '@' in result_text and result_text != 'NOT_FOUND':
                         # Validate email format
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Executive Index Module
+Incremental de-duplication of extracted executives keyed on normalized name and company
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+from company_matcher import normalize_company_name
+
+# Honorifics and titles that prefix names in press releases
+NAME_HONORIFICS = {
+    'dr', 'mr', 'mrs', 'ms', 'miss', 'prof', 'professor', 'eng', 'engr', 'sir',
+    'he', 'his', 'her', 'excellency', 'highness', 'sheikh', 'shaikh', 'sheikha', 'shaikha'
+}
+
+# Arabic particles that are written attached, hyphenated or separate ("Al-Nahyan", "Al Nahyan", "Alnahyan")
+NAME_PARTICLES = {'al', 'el', 'ul', 'abd', 'abdul', 'abdel', 'abu', 'bin', 'ibn', 'bint'}
+
+# Canonical spelling of particles
+PARTICLE_ALIASES = {'el': 'al', 'ul': 'al', 'ibn': 'bin', 'abdel': 'abdul'}
+
+# Romanizations of the same Arabic name, canonical spelling first. Only
+# spellings listed here are merged: similar names of different people
+# (Hamad/Hamid, Rana/Rania) stay apart.
+NAME_VARIANTS = [
+    ['mohammed', 'muhammad', 'mohamed', 'mohammad', 'muhammed', 'mohamad', 'muhamad', 'mohd'],
+    ['ahmed', 'ahmad'],
+    ['yousef', 'yusuf', 'youssef', 'yousif', 'yusef', 'youssif'],
+    ['abdullah', 'abdulla'],
+    ['abdulrahman', 'abdelrahman', 'abdurrahman', 'abdalrahman'],
+    ['abdulaziz', 'abdelaziz'],
+    ['khalid', 'khaled'],
+    ['hussein', 'hussain', 'husain', 'husein', 'hossein'],
+    ['hassan', 'hasan'],
+    ['omar', 'umar'],
+    ['othman', 'osman', 'uthman'],
+    ['fatima', 'fatimah'],
+    ['aisha', 'aysha', 'ayesha', 'aishah'],
+    ['saeed', 'saied', 'saeid'],
+    ['rashid', 'rasheed', 'rashed'],
+    ['majid', 'majed'],
+    ['nasser', 'nasir', 'naser', 'nassir'],
+    ['tariq', 'tarek', 'tareq', 'tarik'],
+    ['faisal', 'faysal', 'feisal'],
+    ['mansoor', 'mansour', 'mansur'],
+    ['yasser', 'yasir', 'yaser'],
+    ['waleed', 'walid'],
+    ['ibrahim', 'ebrahim'],
+    ['ismail', 'ismael'],
+    ['mustafa', 'mostafa', 'moustafa', 'mustapha'],
+    ['mahmoud', 'mahmood', 'mahmud'],
+    ['suwaidi', 'suwaydi'],
+    ['hashimi', 'hashemi'],
+    ['khalifa', 'khalifah'],
+]
+
+_CANONICAL_NAMES = {variant: names[0] for names in NAME_VARIANTS for variant in names}
+
+# Particles a listed name may carry attached ("Alsuwaidi", "Abdelaziz")
+_ATTACHED_PARTICLES = ('abdul', 'abdel', 'abu', 'bin', 'al')
+
+
+def _canonical_token(token: str) -> str:
+    """Canonical spelling of a name token, with any attached particle kept in front"""
+    if token in _CANONICAL_NAMES:
+        return _CANONICAL_NAMES[token]
+    for particle in _ATTACHED_PARTICLES:
+        rest = token[len(particle):]
+        if token.startswith(particle) and rest in _CANONICAL_NAMES:
+            return PARTICLE_ALIASES.get(particle, particle) + _CANONICAL_NAMES[rest]
+    return token
+
+
+def normalize_executive_name(name: str) -> str:
+    """
+    Normalize a person's name for de-duplication
+
+    Drops honorifics ("Dr.", "H.E."), joins Arabic particles to the following
+    word and maps listed romanizations to one spelling. Middle initials are
+    kept; split_initials() separates them for comparison.
+    """
+    name = name.lower().replace('-', ' ')
+    name = re.sub(r'\bh\.\s*e\.', ' ', name)
+    name = re.sub(r"[^\w\s]", ' ', name)
+    tokens = [token for token in name.split() if token not in NAME_HONORIFICS]
+
+    joined: List[str] = []
+    prefix = ''
+    for token in tokens:
+        if token in NAME_PARTICLES:
+            prefix += PARTICLE_ALIASES.get(token, token)
+            continue
+        joined.append(_canonical_token(prefix + token))
+        prefix = ''
+    if prefix:
+        joined.append(prefix)
+
+    return ' '.join(joined)
+
+
+def split_initials(normalized: str) -> Tuple[str, str]:
+    """
+    Split a normalized name into (name without middle initials, middle initials)
+
+    A name made only of initials keeps them all in the first part.
+    """
+    tokens = normalized.split()
+    if len(tokens) <= 2:
+        return normalized, ''
+    middle = tokens[1:-1]
+    initials = ''.join(token for token in middle if len(token) == 1)
+    base = [tokens[0]] + [token for token in middle if len(token) > 1] + [tokens[-1]]
+    return ' '.join(base), initials
+
+
+class ExecutiveIndex:
+    """
+    Insertion-ordered set of executives with merge-on-insert
+
+    Records are keyed on (normalized name, normalized company). Middle
+    initials only tell records apart when both have them: "John A. Smith"
+    merges with "John Smith" but not with "John B. Smith". Adding a
+    duplicate keeps the higher-confidence record and fills in any missing
+    email, LinkedIn profile or title from the other one. len() is O(1).
+    """
+
+    MERGED_FIELDS = ('email', 'linkedin', 'title')
+
+    def __init__(self):
+        # (name without initials, company) -> [[initials, record], ...]
+        self._entries: Dict[Tuple[str, str], List[List[Any]]] = {}
+        self._order: List[List[Any]] = []
+
+    @staticmethod
+    def make_key(executive: Dict[str, Any]) -> Tuple[str, str, str]:
+        """(name without middle initials, company, middle initials)"""
+        company = executive.get('bank') or executive.get('company') or ''
+        base, initials = split_initials(normalize_executive_name(executive.get('name') or ''))
+        return base, normalize_company_name(company), initials
+
+    def _find(self, key: Tuple[str, str, str]):
+        """The entry the key merges into: same initials first, then one without initials"""
+        base, company, initials = key
+        entries = self._entries.get((base, company), [])
+        for entry in entries:
+            if entry[0] == initials:
+                return entry
+        for entry in entries:
+            if not entry[0] or not initials:
+                return entry
+        return None
+
+    def add(self, executive: Dict[str, Any]) -> bool:
+        """Insert or merge an executive; returns True if it was not seen before"""
+        key = self.make_key(executive)
+        entry = self._find(key)
+
+        if entry is None:
+            entry = [key[2], executive]
+            self._entries.setdefault(key[:2], []).append(entry)
+            self._order.append(entry)
+            return True
+
+        existing = entry[1]
+        if executive.get('confidence', 0) > existing.get('confidence', 0):
+            winner, other = executive, existing
+        else:
+            winner, other = existing, executive
+
+        for field in self.MERGED_FIELDS:
+            if not winner.get(field) and other.get(field):
+                winner[field] = other[field]
+
+        # Once merged with "John A. Smith", "John Smith" no longer matches "John B. Smith"
+        entry[0] = entry[0] or key[2]
+        entry[1] = winner
+        return False
+
+    def extend(self, executives: List[Dict[str, Any]]) -> int:
+        """Add several executives; returns how many were new"""
+        return sum(1 for executive in executives if self.add(executive))
+
+    def values(self) -> List[Dict[str, Any]]:
+        """Unique executives in first-seen order"""
+        return [entry[1] for entry in self._order]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, executive: Dict[str, Any]) -> bool:
+        return self._find(self.make_key(executive)) is not None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+File Utilities
+Cross-process file locks, atomic writes and cheap CSV header/tail inspection
+"""
+
+import os
+import csv
+import stat
+import tempfile
+import contextlib
+from typing import List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# The process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextlib.contextmanager
+def file_lock(path: str):
+    """
+    Hold an exclusive lock on path + '.lock' for the duration of the block
+
+    The lock is advisory and shared between processes, so the web app and a
+    CLI batch run writing the same CSV take turns instead of interleaving.
+    """
+    lock_path = path + '.lock'
+    lock_dir = os.path.dirname(lock_path)
+    if lock_dir:
+        os.makedirs(lock_dir, exist_ok=True)
+
+    with open(lock_path, 'a+b') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = 'w', encoding: Optional[str] = 'utf-8', newline: Optional[str] = ''):
+    """
+    Write to a temp file next to path and rename it over path on success
+
+    Readers never see a half-written file; on error the original is untouched.
+    The result keeps the permissions of the file it replaces, or gets the
+    umask default of a newly created file (mkstemp itself creates 0600).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    if 'b' in mode:
+        encoding = newline = None
+
+    try:
+        with os.fdopen(fd, mode, encoding=encoding, newline=newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            file_mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            file_mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, file_mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def read_csv_header(path: str) -> Optional[List[str]]:
+    """Return the column names of a CSV file, or None if it is missing or empty"""
+    try:
+        with open(path, 'rb') as f:
+            first_line = f.readline()
+    except FileNotFoundError:
+        return None
+
+    if not first_line.strip():
+        return None
+
+    text = first_line.decode('utf-8-sig', errors='replace')
+    return next(csv.reader([text]))
+
+
+def ends_with_newline(path: str) -> bool:
+    """True if the file is empty or its last byte is a newline"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+HTML Extraction Backends
+Pluggable page extractors that pull title, main-content text and meta tags from raw HTML
+"""
+
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+from config import SCRAPING_CONFIG
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = None
+    lxml_html = None
+
+# Title sources in priority order (CSS-style selectors)
+TITLE_SELECTORS = [
+    'h1', 'title',
+    'meta[property="og:title"]',
+    'meta[name="twitter:title"]',
+    '.page-title', '.post-title', '.article-title'
+]
+
+# Main content containers in priority order
+MAIN_SELECTORS = [
+    'main', 'article',
+    '.content', '.post-content', '.entry-content', '#content',
+    '.main-content', '.article-content', '.post-body',
+    '.page-content', '.story-content', '.text-content'
+]
+
+# Elements that never contain useful article text
+NOISE_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'menu', 'iframe']
+
+
+class BeautifulSoupExtractor:
+    """Reference extractor using BeautifulSoup with the pure-Python html.parser"""
+
+    name = 'bs4'
+
+    def extract(self, content: bytes) -> Dict[str, Any]:
+        """
+        Extract title, main text and meta tags from a page
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+
+        meta = {}
+        for element in soup.find_all('meta'):
+            key = element.get('property') or element.get('name')
+            if key and element.get('content') and key.lower() not in meta:
+                meta[key.lower()] = element.get('content')
+
+        # Extract title
+        title = ""
+        for selector in TITLE_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                title = element.get_text(strip=True) if element.name != 'meta' else element.get('content', '')
+                if title and len(title) > 5:
+                    break
+
+        # Remove unwanted elements
+        for element in soup(NOISE_TAGS):
+            element.decompose()
+
+        # Try to find main content with multiple selectors
+        main_content = None
+        for selector in MAIN_SELECTORS:
+            main_content = soup.select_one(selector)
+            if main_content:
+                break
+
+        if main_content:
+            text = main_content.get_text(strip=True)
+        else:
+            # Fallback to body text (noise was already removed above)
+            body = soup.find('body')
+            text = body.get_text(strip=True) if body else soup.get_text(strip=True)
+
+        return {'title': title, 'text': text, 'meta': meta}
+
+
+class LxmlExtractor:
+    """
+    Single-pass extractor on lxml's C parser
+
+    One walk over the tree records title candidates, meta tags and every
+    match for the main-content selectors; noise elements are then stripped
+    in C and the first container still attached to the tree wins, as with
+    select_one() after decompose(). Output matches BeautifulSoupExtractor
+    (strings are stripped and joined the same way).
+    """
+
+    name = 'lxml'
+
+    def __init__(self):
+        if lxml_html is None:
+            raise ImportError("lxml is not installed")
+
+        self._title_keys = [self._selector_key(selector) for selector in TITLE_SELECTORS]
+        self._main_keys = [self._selector_key(selector) for selector in MAIN_SELECTORS]
+        self._wanted = set(self._title_keys) | set(self._main_keys)
+
+    @staticmethod
+    def _selector_key(selector: str) -> tuple:
+        """Turn the simple selectors used here into (kind, value) lookups"""
+        if selector.startswith('meta['):
+            attribute, value = selector[5:-1].split('=')
+            return ('meta', attribute, value.strip('"'))
+        if selector.startswith('.'):
+            return ('class', selector[1:])
+        if selector.startswith('#'):
+            return ('id', selector[1:])
+        return ('tag', selector)
+
+    def extract(self, content: bytes) -> Dict[str, Any]:
+        """
+        Extract title, main text and meta tags from a page
+        """
+        root = lxml_html.fromstring(content)
+        etree.strip_elements(root, etree.Comment, etree.ProcessingInstruction, with_tail=False)
+
+        # Selector key -> matching elements in document order
+        found: Dict[tuple, List[Any]] = {}
+        meta = {}
+        wanted = self._wanted
+
+        def add(key, element):
+            if key in wanted:
+                found.setdefault(key, []).append(element)
+
+        for element in root.iter():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+
+            add(('tag', tag), element)
+
+            if tag == 'meta':
+                name = element.get('property') or element.get('name')
+                if name and element.get('content') and name.lower() not in meta:
+                    meta[name.lower()] = element.get('content')
+                # Like meta[property="..."] / meta[name="..."]: one attribute each, exact value
+                for attribute in ('property', 'name'):
+                    if element.get(attribute) is not None:
+                        add(('meta', attribute, element.get(attribute)), element)
+                continue
+
+            element_id = element.get('id')
+            if element_id:
+                add(('id', element_id), element)
+
+            classes = element.get('class')
+            if classes:
+                for class_name in classes.split():
+                    add(('class', class_name), element)
+
+        # Extract title
+        title = ""
+        for key in self._title_keys:
+            elements = found.get(key)
+            if elements:
+                element = elements[0]
+                title = element.get('content', '') if key[0] == 'meta' else self._joined_text(element)
+                if title and len(title) > 5:
+                    break
+
+        # Remove unwanted elements; candidates inside them are detached with them
+        etree.strip_elements(root, *NOISE_TAGS, with_tail=False)
+
+        main_content = None
+        for key in self._main_keys:
+            for element in found.get(key, ()):
+                if self._is_attached(element, root):
+                    main_content = element
+                    break
+            if main_content is not None:
+                break
+
+        if main_content is None:
+            body = root.find('.//body') if root.tag != 'body' else root
+            main_content = body if body is not None else root
+
+        return {'title': title, 'text': self._joined_text(main_content), 'meta': meta}
+
+    @staticmethod
+    def _joined_text(element) -> str:
+        """Equivalent of BeautifulSoup's get_text(strip=True)"""
+        return ''.join(piece.strip() for piece in element.itertext())
+
+    @staticmethod
+    def _is_attached(element, root) -> bool:
+        """True if element was not removed together with a noise ancestor"""
+        while element is not None:
+            if element is root:
+                return True
+            element = element.getparent()
+        return False
+
+
+_EXTRACTORS = {
+    'bs4': BeautifulSoupExtractor,
+    'lxml': LxmlExtractor,
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the extraction backends usable in this environment"""
+    return [name for name in _EXTRACTORS if name != 'lxml' or lxml_html is not None]
+
+
+def get_extractor(backend: Optional[str] = None):
+    """
+    Return an extractor instance for the configured backend
+
+    'auto' picks lxml when it is installed and BeautifulSoup otherwise.
+    """
+    backend = backend or SCRAPING_CONFIG.get('html_backend', 'auto')
+
+    if backend == 'auto':
+        backend = 'lxml' if lxml_html is not None else 'bs4'
+
+    if backend == 'lxml' and lxml_html is None:
+        print("⚠️ lxml not installed, falling back to BeautifulSoup extraction")
+        backend = 'bs4'
+
+    if backend not in _EXTRACTORS:
+        raise ValueError(f"Unknown HTML extraction backend: {backend}")
+
+    return _EXTRACTORS[backend]()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Job Manager Module
+Tracks web app background jobs with unique IDs, status, per-company progress,
+cancellation and a cap on how many run at once
+"""
+
+import time
+import uuid
+import asyncio
+import contextvars
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import BATCH_CONFIG
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+# The job whose runner is executing in the current task (None outside jobs)
+current_job: contextvars.ContextVar[Optional['Job']] = contextvars.ContextVar('current_job', default=None)
+
+
+class Job:
+    """State and progress counters of one background job"""
+
+    def __init__(self, kind: str, description: str = ''):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.description = description
+        self.status = QUEUED
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+
+        self.companies_total = 0
+        self.companies_done = 0
+        self.companies_failed = 0
+        self.executives_found = 0
+        self.current_company: Optional[str] = None
+
+        self._task: Optional[asyncio.Task] = None
+        self._started: Optional[float] = None
+        self._elapsed: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def start_company(self, name: str):
+        self.current_company = name
+
+    def company_done(self, executives_found: int = 0, failed: bool = False):
+        """Record one finished company"""
+        self.companies_done += 1
+        if failed:
+            self.companies_failed += 1
+        self.executives_found += executives_found
+        self.current_company = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self._elapsed
+        if elapsed is None and self._started is not None:
+            elapsed = time.monotonic() - self._started
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'description': self.description,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'elapsed_seconds': round(elapsed, 1) if elapsed is not None else None,
+            'error': self.error,
+            'progress': {
+                'companies_total': self.companies_total,
+                'companies_done': self.companies_done,
+                'companies_failed': self.companies_failed,
+                'executives_found': self.executives_found,
+                'current_company': self.current_company
+            },
+            'result': self.result
+        }
+
+
+class JobManager:
+    """
+    Run coroutines as tracked jobs, at most max_concurrent_jobs at a time
+
+    Jobs beyond the limit wait in 'queued' state in submission order, so
+    several uploads share the SerpAPI/OpenAI quotas instead of multiplying
+    the load. Cancelling a running job interrupts it at its next await; a
+    pipeline step already running in a worker thread finishes, but its
+    result is discarded.
+    """
+
+    def __init__(self, max_concurrent_jobs: int = None, max_finished_jobs: int = None,
+                 on_update: Optional[Callable[[Job], None]] = None):
+        self.on_update = on_update
+        self.max_concurrent_jobs = max_concurrent_jobs or BATCH_CONFIG.get('max_concurrent_jobs', 2)
+        self.max_finished_jobs = max_finished_jobs or BATCH_CONFIG.get('max_finished_jobs', 100)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+
+    def submit(self, kind: str, runner: Callable[[Job], Awaitable[Optional[Dict[str, Any]]]],
+               description: str = '') -> Job:
+        """
+        Create a job and schedule runner(job) on the running event loop
+
+        The runner may update the job's progress counters and return a
+        result dict, which is stored on the job when it completes.
+        """
+        job = Job(kind, description)
+        self._jobs[job.id] = job
+        job._task = asyncio.create_task(self._run(job, runner))
+        return job
+
+    async def _run(self, job: Job, runner: Callable[[Job], Awaitable[Optional[Dict[str, Any]]]]):
+        current_job.set(job)
+        try:
+            async with self._semaphore:
+                job.status = RUNNING
+                job.started_at = datetime.now().isoformat()
+                job._started = time.monotonic()
+                self._notify(job)
+                job.result = await runner(job)
+                job.status = DONE
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+            print(f"❌ Job {job.id} ({job.kind}) failed: {e}")
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            if job._started is not None:
+                job._elapsed = time.monotonic() - job._started
+            job.current_company = None
+            self._notify(job)
+            self._prune()
+
+    def _notify(self, job: Job):
+        if self.on_update:
+            try:
+                self.on_update(job)
+            except Exception as e:
+                print(f"⚠️ Job update listener failed: {e}")
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_finished_jobs"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self, status: Optional[str] = None) -> List[Job]:
+        """All tracked jobs, newest first, optionally filtered by status"""
+        jobs = reversed(self._jobs.values())
+        return [job for job in jobs if status is None or job.status == status]
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation; returns False if the job is unknown or already finished"""
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        job._task.cancel()
+        return True
+
+    def counts(self) -> Dict[str, int]:
+        counts = {state: 0 for state in (QUEUED, RUNNING) + FINISHED_STATES}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return counts
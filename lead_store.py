@@ -0,0 +1,667 @@
+#!/usr/bin/env python3
+"""
+Lead Store Module
+SQLite system of record for extracted executives, their companies, sources and extraction runs
+"""
+
+import os
+import re
+import csv
+import sqlite3
+import threading
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import STORE_CONFIG, OUTPUT_CONFIG, CXO_POSITIONS
+from company_matcher import normalize_company_name
+
+# Columns returned by query_records, matching the executives.csv export
+RECORD_COLUMNS = [
+    'Name', 'Title', 'Company', 'LinkedIn', 'Email', 'Source URL', 'Extraction Date',
+    'Batch_Mode', 'Processing_Date', 'Company_Industry'
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    normalized_name TEXT NOT NULL UNIQUE,
+    industry TEXT NOT NULL DEFAULT ''
+);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    executives_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS executives (
+    id INTEGER PRIMARY KEY,
+    exec_key TEXT NOT NULL UNIQUE,
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    name TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    linkedin TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    has_email INTEGER NOT NULL DEFAULT 0,
+    has_linkedin INTEGER NOT NULL DEFAULT 0,
+    confidence REAL NOT NULL DEFAULT 0,
+    extraction_method TEXT NOT NULL DEFAULT '',
+    company_industry TEXT NOT NULL DEFAULT '',
+    batch_mode TEXT NOT NULL DEFAULT '',
+    source_url TEXT NOT NULL DEFAULT '',
+    extraction_date TEXT NOT NULL DEFAULT '',
+    processing_date TEXT NOT NULL DEFAULT '',
+    first_run_id INTEGER REFERENCES runs(id),
+    last_run_id INTEGER REFERENCES runs(id)
+);
+
+-- Distinct titles, so substring title filters scan a few hundred rows instead of every executive
+CREATE TABLE IF NOT EXISTS titles (
+    title TEXT PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    executive_id INTEGER NOT NULL REFERENCES executives(id),
+    url TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    run_id INTEGER REFERENCES runs(id),
+    UNIQUE (executive_id, url)
+);
+
+CREATE INDEX IF NOT EXISTS idx_executives_company ON executives(company_id, id);
+CREATE INDEX IF NOT EXISTS idx_executives_title ON executives(title);
+CREATE INDEX IF NOT EXISTS idx_executives_has_email ON executives(has_email, id);
+CREATE INDEX IF NOT EXISTS idx_executives_has_linkedin ON executives(has_linkedin, id);
+CREATE INDEX IF NOT EXISTS idx_executives_extraction_date ON executives(extraction_date);
+CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name COLLATE NOCASE);
+"""
+
+# Full-text index over executives, kept in sync by triggers so every writer updates it
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS executives_fts USING fts5(
+    name, title, company, industry, source_titles,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS executives_fts_insert AFTER INSERT ON executives BEGIN
+    INSERT INTO executives_fts (rowid, name, title, company, industry, source_titles)
+    VALUES (new.id, new.name, new.title, (SELECT name FROM companies WHERE id = new.company_id),
+            new.company_industry, '');
+END;
+
+CREATE TRIGGER IF NOT EXISTS executives_fts_update AFTER UPDATE OF name, title, company_industry ON executives
+WHEN old.name IS NOT new.name OR old.title IS NOT new.title OR old.company_industry IS NOT new.company_industry
+BEGIN
+    UPDATE executives_fts SET name = new.name, title = new.title, industry = new.company_industry
+    WHERE rowid = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS sources_fts_insert AFTER INSERT ON sources WHEN new.title != '' BEGIN
+    UPDATE executives_fts SET source_titles = trim(source_titles || ' ' || new.title)
+    WHERE rowid = new.executive_id;
+END;
+"""
+
+REBUILD_FTS = """
+INSERT INTO executives_fts (rowid, name, title, company, industry, source_titles)
+SELECT e.id, e.name, e.title, c.name, e.company_industry,
+       COALESCE((SELECT group_concat(s.title, ' ') FROM sources s WHERE s.executive_id = e.id AND s.title != ''), '')
+FROM executives e JOIN companies c ON c.id = e.company_id
+"""
+
+# Relevance weight per indexed column: name, title, company, industry, source_titles
+FTS_COLUMN_WEIGHTS = (10.0, 5.0, 5.0, 1.0, 1.0)
+
+
+def _cxo_synonym_groups() -> List[List[str]]:
+    """
+    Group CXO_POSITIONS into synonym sets: each acronym starts a new group
+    (['CEO', 'Chief Executive Officer', 'Chief Executive'], ...)
+    """
+    groups: List[List[str]] = []
+    for position in CXO_POSITIONS:
+        if position.isupper() or not groups:
+            groups.append([])
+        groups[-1].append(position.lower())
+    return groups
+
+
+# Words dropped from search queries (they would prefix-match almost everything)
+FTS_STOPWORDS = {'of', 'the', 'and', 'at', 'in', 'for', 'a', 'an'}
+
+# Shortest word matched as a prefix; the index only keeps 2- and 3-character
+# prefixes (prefix = '2 3'), a 1-character prefix would scan every token
+FTS_MIN_PREFIX_CHARS = 2
+
+# Phrase (as a word tuple) -> every spelling of that position, longest phrases first
+_CXO_SYNONYMS = sorted(
+    ((tuple(phrase.split()), group) for group in _cxo_synonym_groups() for phrase in group),
+    key=lambda item: -len(item[0])
+)
+
+_WORDS = re.compile(r'\w+')
+_NON_WORDS = re.compile(r'\W+')
+
+
+def _singular(word: str) -> str:
+    """Drop a plural 's' ("ceos" -> "ceo", "directors" -> "director")"""
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def _with_plurals(phrase: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+    """The phrase and its plural (last word with an 's'), singular first"""
+    if len(phrase[-1]) < 3:
+        return [phrase]
+    return [phrase, phrase[:-1] + (phrase[-1] + 's',)]
+
+
+def parse_search_terms(text: str) -> List[Tuple[List[Tuple[str, ...]], bool]]:
+    """
+    Split free text into search terms
+
+    Each term is (alternative phrases, is_prefix). A CXO title in any
+    spelling becomes one term with all of its spellings, so "CEO" finds
+    "Chief Executive Officer". Words match singular or plural, so "CEOs"
+    finds "CEO" and "director" finds "Directors". The last plain word
+    matches as a prefix (search-as-you-type) once it has at least
+    FTS_MIN_PREFIX_CHARS characters; a single letter matches whole words only.
+    """
+    words = [word for word in _WORDS.findall(text.lower()) if word not in FTS_STOPWORDS]
+    terms = []
+    i = 0
+
+    while i < len(words):
+        for phrase, group in _CXO_SYNONYMS:
+            candidate = words[i:i + len(phrase)]
+            if candidate and tuple(candidate[:-1] + [_singular(candidate[-1])]) == phrase:
+                terms.append(([plural for spelling in group for plural in _with_plurals(tuple(spelling.split()))],
+                              False))
+                i += len(phrase)
+                break
+        else:
+            word = _singular(words[i])
+            if i == len(words) - 1 and len(word) >= FTS_MIN_PREFIX_CHARS:
+                terms.append(([(word,)], True))
+            else:
+                terms.append((_with_plurals((word,)), False))
+            i += 1
+
+    return terms
+
+
+def build_fts_query(text: str) -> Optional[str]:
+    """Turn free text into an FTS5 MATCH expression (every term must match)"""
+    parts = []
+    for alternatives, is_prefix in parse_search_terms(text):
+        phrases = [f'"{" ".join(phrase)}"' + ('*' if is_prefix else '') for phrase in alternatives]
+        parts.append(phrases[0] if len(phrases) == 1 else '(' + ' OR '.join(phrases) + ')')
+    return ' AND '.join(parts) if parts else None
+
+
+def score_match(columns: Tuple[str, ...], terms: List[Tuple[List[str], bool]]) -> float:
+    """
+    Field-weighted relevance of one matched record
+
+    Each term contributes a saturating term frequency, damped by column
+    length, times the column weight, so a hit in a short name outranks the
+    same word buried in a long source title.
+    """
+    score = 0.0
+    for weight, text in zip(FTS_COLUMN_WEIGHTS, columns):
+        if not text:
+            continue
+        joined = ' ' + _NON_WORDS.sub(' ', text.lower()) + ' '
+        length_norm = 0.25 + 0.75 * (joined.count(' ') - 1) / 4.0
+        for needles, _ in terms:
+            tf = sum(joined.count(needle) for needle in needles)
+            if tf:
+                score += weight * tf / (tf + 1.2 * length_norm)
+    return score
+
+
+def _term_needles(terms: List[Tuple[List[Tuple[str, ...]], bool]]) -> List[Tuple[List[str], bool]]:
+    """Space-delimited substrings that find each term in a ' '-joined token string"""
+    return [([' ' + ' '.join(phrase) + ('' if is_prefix else ' ') for phrase in alternatives], is_prefix)
+            for alternatives, is_prefix in terms]
+
+
+# Merge rules on conflict: the higher-confidence extraction wins the title,
+# contact details are only filled in when missing
+UPSERT_EXECUTIVE = """
+INSERT INTO executives (
+    exec_key, company_id, name, title, linkedin, email, has_email, has_linkedin,
+    confidence, extraction_method, company_industry, batch_mode, source_url,
+    extraction_date, processing_date, first_run_id, last_run_id
+) VALUES (
+    :exec_key, :company_id, :name, :title, :linkedin, :email, :has_email, :has_linkedin,
+    :confidence, :extraction_method, :company_industry, :batch_mode, :source_url,
+    :extraction_date, :processing_date, :run_id, :run_id
+)
+ON CONFLICT(exec_key) DO UPDATE SET
+    title = CASE
+        WHEN executives.title = '' OR excluded.confidence > executives.confidence
+        THEN COALESCE(NULLIF(excluded.title, ''), executives.title)
+        ELSE executives.title END,
+    linkedin = COALESCE(NULLIF(executives.linkedin, ''), excluded.linkedin),
+    email = COALESCE(NULLIF(executives.email, ''), excluded.email),
+    has_email = executives.has_email OR excluded.has_email,
+    has_linkedin = executives.has_linkedin OR excluded.has_linkedin,
+    confidence = MAX(executives.confidence, excluded.confidence),
+    company_industry = COALESCE(NULLIF(excluded.company_industry, ''), executives.company_industry),
+    batch_mode = COALESCE(NULLIF(excluded.batch_mode, ''), executives.batch_mode),
+    processing_date = COALESCE(NULLIF(excluded.processing_date, ''), executives.processing_date),
+    last_run_id = excluded.last_run_id
+"""
+
+# Filters matching fewer rows than this are paged via their index plus a sort
+SELECTIVE_FILTER_ROWS = 10000
+
+_stores: Dict[str, 'LeadStore'] = {}
+_stores_lock = threading.Lock()
+
+
+def _text(value: Any) -> str:
+    """Normalize a record value to a clean string (NaN/None become '')"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return str(value).strip()
+
+
+def normalize_person_key(name: str) -> str:
+    """
+    Conservative person-name key for the store: lowercased, accents stripped, whitespace collapsed
+
+    Deliberately looser matching (honorifics, transliterations) stays in
+    ExecutiveIndex; a wrong merge here would be permanent.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.lower().split())
+
+
+def make_exec_key(name: str, company: str) -> str:
+    return f"{normalize_person_key(name)}|{normalize_company_name(company)}"
+
+
+def _confidence(value: Any) -> float:
+    try:
+        confidence = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return confidence if confidence == confidence else 0.0
+
+
+class LeadStore:
+    """
+    Executives keyed on normalized (name, company) with UPSERT merge semantics
+
+    The CSV files remain an export format; this store is what the web app
+    filters and pages over.
+    """
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or STORE_CONFIG['db_path']
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+
+        fts_exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'executives_fts'"
+        ).fetchone()
+        self._conn.executescript(FTS_SCHEMA)
+        if not fts_exists:
+            # Stores created before the search index existed are indexed once
+            self._conn.execute(REBUILD_FTS)
+        self._conn.commit()
+
+        self._company_ids: Dict[str, int] = {}
+        self._known_titles = set()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def start_run(self, source: str) -> int:
+        """Record the start of an extraction run and return its id"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (source, started_at) VALUES (?, ?)",
+                (source, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def finish_run(self, run_id: int, executives_count: int):
+        """Mark a run as finished"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET finished_at = ?, executives_count = executives_count + ? WHERE id = ?",
+                (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), executives_count, run_id)
+            )
+            self._conn.commit()
+
+    def upsert_executives(self, executives: Iterable[Dict[str, Any]], run_id: Optional[int] = None,
+                          batch_mode: str = '') -> int:
+        """
+        Insert or merge executives (extractor dicts) and their sources
+
+        Returns the number of executives written.
+        """
+        now = datetime.now()
+        defaults = {
+            'extraction_date': now.strftime('%Y-%m-%d'),
+            'processing_date': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'batch_mode': batch_mode
+        }
+
+        rows = []
+        for executive in executives:
+            rows.append({
+                'name': _text(executive.get('name')),
+                'title': _text(executive.get('title')),
+                'company': _text(executive.get('company') or executive.get('bank')),
+                'linkedin': _text(executive.get('linkedin')),
+                'email': _text(executive.get('email')),
+                'confidence': _confidence(executive.get('confidence')),
+                'extraction_method': _text(executive.get('extraction_method')),
+                'company_industry': _text(executive.get('company_industry')),
+                'source_url': _text(executive.get('source_url')),
+                'source_title': _text(executive.get('source_title')),
+                **defaults
+            })
+
+        return self._write_rows(rows, run_id)
+
+    def import_csv(self, filename: str, batch_size: int = 5000) -> int:
+        """
+        Load an existing executives CSV export into the store
+
+        Used once on first start so the store picks up the CSV history.
+        """
+        if not os.path.exists(filename):
+            return 0
+
+        run_id = self.start_run('csv_import')
+
+        try:
+            imported = self._import_csv_rows(filename, run_id, 'utf-8-sig', batch_size)
+        except UnicodeDecodeError:
+            # Upserts are idempotent, so re-reading with latin-1 is safe
+            imported = self._import_csv_rows(filename, run_id, 'latin-1', batch_size)
+
+        self.finish_run(run_id, imported)
+        self.analyze()
+        return imported
+
+    def analyze(self):
+        """Refresh planner statistics after bulk loads so filters pick the right index"""
+        with self._lock:
+            self._conn.execute("ANALYZE")
+            self._conn.commit()
+
+    def _import_csv_rows(self, filename: str, run_id: int, encoding: str, batch_size: int) -> int:
+        imported = 0
+
+        with open(filename, 'r', encoding=encoding, newline='') as f:
+            batch = []
+            for record in csv.DictReader(f):
+                batch.append({
+                    'name': _text(record.get('Name')),
+                    'title': _text(record.get('Title')),
+                    'company': _text(record.get('Company')),
+                    'linkedin': _text(record.get('LinkedIn')),
+                    'email': _text(record.get('Email')),
+                    'confidence': _confidence(record.get('Confidence')),
+                    'extraction_method': _text(record.get('Extraction Method')),
+                    'company_industry': _text(record.get('Company_Industry')),
+                    'source_url': _text(record.get('Source URL')),
+                    'source_title': _text(record.get('Source Title')),
+                    'extraction_date': _text(record.get('Extraction Date')),
+                    'processing_date': _text(record.get('Processing_Date')),
+                    'batch_mode': _text(record.get('Batch_Mode'))
+                })
+                if len(batch) >= batch_size:
+                    imported += self._write_rows(batch, run_id)
+                    batch = []
+            if batch:
+                imported += self._write_rows(batch, run_id)
+
+        return imported
+
+    def _write_rows(self, rows: List[Dict[str, Any]], run_id: Optional[int]) -> int:
+        """Upsert prepared rows in a single transaction"""
+        written = 0
+
+        with self._lock:
+            try:
+                for row in rows:
+                    if not row['name']:
+                        continue
+
+                    company_id = self._company_id(row['company'], row['company_industry'])
+                    if row['title'] and row['title'] not in self._known_titles:
+                        self._conn.execute("INSERT OR IGNORE INTO titles (title) VALUES (?)", (row['title'],))
+                        self._known_titles.add(row['title'])
+                    exec_key = make_exec_key(row['name'], row['company'])
+
+                    self._conn.execute(UPSERT_EXECUTIVE, {
+                        **row,
+                        'exec_key': exec_key,
+                        'company_id': company_id,
+                        'has_email': int(bool(row['email'])),
+                        'has_linkedin': int(bool(row['linkedin'])),
+                        'run_id': run_id
+                    })
+
+                    if row['source_url']:
+                        executive_id = self._conn.execute(
+                            "SELECT id FROM executives WHERE exec_key = ?", (exec_key,)
+                        ).fetchone()[0]
+                        self._conn.execute(
+                            "INSERT OR IGNORE INTO sources (executive_id, url, title, run_id) VALUES (?, ?, ?, ?)",
+                            (executive_id, row['source_url'], row['source_title'], run_id)
+                        )
+                    written += 1
+
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        return written
+
+    def _company_id(self, name: str, industry: str = '') -> int:
+        """Return the id of a company, creating it on first sight (caller holds the lock)"""
+        normalized = normalize_company_name(name) or name.lower()
+        company_id = self._company_ids.get(normalized)
+        if company_id is not None:
+            return company_id
+
+        row = self._conn.execute("SELECT id FROM companies WHERE normalized_name = ?", (normalized,)).fetchone()
+        if row:
+            company_id = row[0]
+        else:
+            company_id = self._conn.execute(
+                "INSERT INTO companies (name, normalized_name, industry) VALUES (?, ?, ?)",
+                (name, normalized, industry)
+            ).lastrowid
+
+        self._company_ids[normalized] = company_id
+        return company_id
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        """Number of unique executives"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM executives").fetchone()[0]
+
+    def query_records(self, company: Optional[str] = None, position: Optional[str] = None,
+                      has_email: Optional[bool] = None, has_linkedin: Optional[bool] = None,
+                      limit: int = 100, offset: int = 0, cursor: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Filter and page executives in insertion order
+
+        company and position are case-insensitive substring filters, like
+        the CSV-based records view. cursor is the next_cursor of the previous
+        page (keyset paging, cheap at any depth); offset is applied after it.
+        Returns {'records': [...], 'total': n, 'next_cursor': id or None}.
+        """
+        where, params = self._build_filters(company, position, has_email, has_linkedin)
+
+        page_where, page_params = where, list(params)
+        if cursor is not None:
+            page_where = f"{where} AND e.id > ?" if where else "WHERE e.id > ?"
+            page_params.append(cursor)
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM executives e {where}", params
+            ).fetchone()[0]
+
+            if total == 0 or offset >= total:
+                return {'records': [], 'total': total, 'next_cursor': None}
+
+            # Few matches: read them through the filter index and sort.
+            # Many matches: walking the table in id order reaches a page quickly.
+            order_by = "+e.id" if where and total < SELECTIVE_FILTER_ROWS else "e.id"
+
+            rows = self._conn.execute(
+                f"""
+                SELECT e.id, e.name, e.title, c.name AS company, e.linkedin, e.email, e.source_url,
+                       e.extraction_date, e.batch_mode, e.processing_date, e.company_industry
+                FROM executives e JOIN companies c ON c.id = e.company_id
+                {page_where}
+                ORDER BY {order_by}
+                LIMIT ? OFFSET ?
+                """,
+                page_params + [limit + 1, offset]  # One extra row tells whether another page follows
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1][0]
+        return {'records': [dict(zip(RECORD_COLUMNS, row[1:])) for row in rows], 'total': total,
+                'next_cursor': next_cursor}
+
+    def search(self, text: str, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+        """
+        Ranked full-text search over name, title, company, industry and source titles
+
+        The index returns the newest search_candidate_limit matches and only
+        those are scored, so broad queries cost the same at any store size;
+        below that limit ranking and total are exact. Returns
+        {'records': [...], 'total': n, 'total_capped': bool, 'query': fts_query};
+        each record carries a Score (higher is more relevant).
+        """
+        terms = _term_needles(parse_search_terms(text or ''))
+        fts_query = build_fts_query(text or '')
+        if not fts_query:
+            return {'records': [], 'total': 0, 'total_capped': False, 'query': None}
+
+        candidate_limit = STORE_CONFIG.get('search_candidate_limit', 1000)
+
+        with self._lock:
+            candidates = self._conn.execute(
+                """
+                SELECT rowid, name, title, company, industry, source_titles
+                FROM executives_fts WHERE executives_fts MATCH ?
+                ORDER BY rowid DESC LIMIT ?
+                """,
+                (fts_query, candidate_limit)
+            ).fetchall()
+
+            # Newest first among equally relevant matches
+            ranked = sorted(((score_match(tuple(row[1:]), terms), row[0]) for row in candidates),
+                            key=lambda item: (-item[0], -item[1]))
+            page = ranked[offset:offset + limit]
+
+            rows = {}
+            if page:
+                placeholders = ', '.join('?' for _ in page)
+                for row in self._conn.execute(
+                    f"""
+                    SELECT e.id, e.name, e.title, c.name AS company, e.linkedin, e.email, e.source_url,
+                           e.extraction_date, e.batch_mode, e.processing_date, e.company_industry
+                    FROM executives e JOIN companies c ON c.id = e.company_id
+                    WHERE e.id IN ({placeholders})
+                    """,
+                    [executive_id for _, executive_id in page]
+                ):
+                    rows[row[0]] = row
+
+        records = []
+        for score, executive_id in page:
+            record = dict(zip(RECORD_COLUMNS, rows[executive_id][1:]))
+            record['Score'] = round(score, 3)
+            records.append(record)
+
+        return {'records': records, 'total': len(candidates),
+                'total_capped': len(candidates) >= candidate_limit, 'query': fts_query}
+
+    @staticmethod
+    def _build_filters(company: Optional[str], position: Optional[str],
+                       has_email: Optional[bool], has_linkedin: Optional[bool]) -> Tuple[str, List[Any]]:
+        clauses = []
+        params: List[Any] = []
+
+        if company:
+            # The companies table is small, so the substring match runs there
+            # and executives are reached through the company index
+            clauses.append("e.company_id IN (SELECT id FROM companies WHERE name LIKE ? ESCAPE '\\')")
+            params.append(f"%{_escape_like(company)}%")
+        if position:
+            clauses.append("e.title IN (SELECT title FROM titles WHERE title LIKE ? ESCAPE '\\')")
+            params.append(f"%{_escape_like(position)}%")
+        if has_email is not None:
+            clauses.append("e.has_email = ?")
+            params.append(int(has_email))
+        if has_linkedin is not None:
+            clauses.append("e.has_linkedin = ?")
+            params.append(int(has_linkedin))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def get_lead_store(db_path: str = None) -> LeadStore:
+    """
+    Return the process-wide store for db_path, importing the CSV export on first use
+    """
+    db_path = db_path or STORE_CONFIG['db_path']
+
+    with _stores_lock:
+        if db_path not in _stores:
+            store = LeadStore(db_path)
+            if STORE_CONFIG.get('import_csv_on_first_use', True) and store.count() == 0:
+                csv_file = OUTPUT_CONFIG['csv_filename']
+                if os.path.exists(csv_file):
+                    print(f"📥 Importing {csv_file} into lead store...")
+                    imported = store.import_csv(csv_file)
+                    print(f"✅ Imported {imported} executives into {db_path}")
+            _stores[db_path] = store
+        return _stores[db_path]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+LLM Client Module
+Cached wrapper around OpenAI chat completions shared by every call site
+"""
+
+from typing import Any, Dict
+
+from config import CACHE_CONFIG
+from cache_store import get_cache_store
+from metrics import span, count
+import cassette
+
+
+def _get_llm_cache():
+    """Return the shared LLM response cache, or None when caching is disabled"""
+    if not CACHE_CONFIG.get('enabled', True):
+        return None
+    return get_cache_store(
+        'llm',
+        max_entries=CACHE_CONFIG.get('llm_max_entries'),
+        max_bytes=CACHE_CONFIG.get('llm_max_bytes')
+    )
+
+
+def chat_completion(client, call_site: str, **params: Any) -> str:
+    """
+    Run a chat completion through client (an LLMGateway) and return the message content
+
+    Responses are cached on a hash of (model, messages, params), so repeated
+    runs with identical prompts make no OpenAI call. call_site labels the
+    lookup for per-call-site hit-rate statistics and names the
+    openai.<call_site> metrics stage (latency, tokens, cache hits).
+    """
+    cache = _get_llm_cache()
+    cache_key = None
+
+    if cache:
+        cache_key = cache.make_key(params)
+        cached = cache.get(cache_key, label=call_site)
+        if cached is not None:
+            count(f'openai.{call_site}', 'cache_hits')
+            return cached['content']
+
+    with span(f'openai.{call_site}'):
+        response = cassette.openai_chat(params, lambda: client.complete(**params))
+
+    usage = getattr(response, 'usage', None)
+    if usage:
+        count(f'openai.{call_site}', 'prompt_tokens', usage.prompt_tokens or 0)
+        count(f'openai.{call_site}', 'completion_tokens', usage.completion_tokens or 0)
+
+    content = response.choices[0].message.content or ""
+
+    if cache:
+        cache.set(cache_key, {'content': content, 'model': params.get('model')},
+                  ttl=CACHE_CONFIG.get('llm_ttl_seconds'))
+
+    return content
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss statistics of the LLM cache, broken down by call site"""
+    cache = _get_llm_cache()
+    return cache.get_stats() if cache else {}
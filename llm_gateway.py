@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+LLM Gateway Module
+Shared AsyncOpenAI client running on its own event loop thread, with a
+concurrency cap, requests/tokens per minute limiters, timeouts and
+exponential backoff with jitter on rate limits and server errors
+"""
+
+import random
+import asyncio
+import threading
+import concurrent.futures
+from typing import Any, Dict, Optional
+
+import openai
+
+from config import OPENAI_API_KEY, BATCH_CONFIG, LLM_GATEWAY_CONFIG, LLM_INPUT_CONFIG
+from concurrency import TokenBucket
+from metrics import count
+
+# Errors worth retrying: 429, 5xx, timeouts and dropped connections
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError,
+                    openai.APITimeoutError, openai.APIConnectionError)
+
+
+class LLMGateway:
+    """
+    Every OpenAI request of the process goes through one gateway
+
+    Requests run as coroutines on a private event loop thread, so calls
+    made from any number of worker threads (or event loops) overlap while
+    sharing one connection pool and one set of limits. complete() blocks the
+    calling thread, submit() returns a concurrent.futures.Future and
+    complete_async() can be awaited from another event loop.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_concurrency: Optional[int] = None, config: Optional[Dict[str, Any]] = None):
+        self.config = dict(LLM_GATEWAY_CONFIG, **(config or {}))
+        self.api_key = api_key or OPENAI_API_KEY
+        self.base_url = base_url  # None: the OpenAI default (or OPENAI_BASE_URL)
+        self.max_concurrency = max_concurrency or BATCH_CONFIG.get('service_concurrency', {}).get('openai') or 4
+
+        burst_seconds = self.config.get('burst_seconds', 10)
+        rpm = self.config.get('requests_per_minute')
+        tpm = self.config.get('tokens_per_minute')
+        self.request_limiter = TokenBucket(rpm / 60 if rpm else None, rpm / 60 * burst_seconds if rpm else 1)
+        self.token_limiter = TokenBucket(tpm / 60 if tpm else None, tpm / 60 * burst_seconds if tpm else 1)
+
+        self.stats = {
+            'requests': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'server_errors': 0,
+            'timeouts': 0,
+            'failed': 0
+        }
+        self._stats_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client = None
+        self._semaphore = None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread and client on first use"""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='llm-gateway', daemon=True)
+                thread.start()
+                # Retries are handled here, with the shared limits, not inside the client
+                self._client = openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url,
+                                                  timeout=self.config.get('timeout_seconds', 60), max_retries=0)
+                self._semaphore = asyncio.run_coroutine_threadsafe(self._make_semaphore(), loop).result()
+                self._loop = loop
+            return self._loop
+
+    async def _make_semaphore(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.max_concurrency)
+
+    def submit(self, **params: Any) -> concurrent.futures.Future:
+        """Schedule a chat completion and return a Future of the ChatCompletion"""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._complete(params), loop)
+
+    def complete(self, **params: Any):
+        """Run a chat completion and return the ChatCompletion, blocking the calling thread"""
+        if threading.current_thread().name == 'llm-gateway':
+            raise RuntimeError("LLMGateway.complete() cannot be called from the gateway's own event loop")
+        return self.submit(**params).result()
+
+    async def complete_async(self, **params: Any):
+        """Await a chat completion from any event loop"""
+        return await asyncio.wrap_future(self.submit(**params))
+
+    async def _complete(self, params: Dict[str, Any]):
+        max_retries = self.config.get('max_retries', 5)
+        attempt = 0
+        while True:
+            # Wait for rate-limit budget before taking a slot, so throttled
+            # requests don't hold the semaphore while they sleep
+            await self.request_limiter.acquire_async(1)
+            await self.token_limiter.acquire_async(self._estimate_tokens(params))
+            async with self._semaphore:
+                try:
+                    response = await self._client.chat.completions.create(**params)
+                    self._record('requests')
+                    return response
+                except RETRYABLE_ERRORS as e:
+                    self._record(self._error_kind(e))
+                    if attempt >= max_retries:
+                        self._record('failed')
+                        raise
+                    delay = self._backoff_delay(attempt, e)
+            # Wait outside the semaphore so other requests keep flowing
+            attempt += 1
+            self._record('retries')
+            await asyncio.sleep(delay)
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with jitter, never shorter than the server's Retry-After"""
+        ceiling = min(self.config.get('backoff_max_seconds', 30),
+                      self.config.get('backoff_base_seconds', 1) * 2 ** attempt)
+        delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        try:
+            return max(delay, min(float(retry_after), self.config.get('backoff_max_seconds', 30)))
+        except (TypeError, ValueError):
+            return delay
+
+    @staticmethod
+    def _error_kind(error: Exception) -> str:
+        if isinstance(error, openai.RateLimitError):
+            return 'rate_limited'
+        if isinstance(error, openai.APITimeoutError):
+            return 'timeouts'
+        return 'server_errors'
+
+    @staticmethod
+    def _estimate_tokens(params: Dict[str, Any]) -> float:
+        """Prompt tokens (from message length) plus the completion allowance"""
+        chars = sum(len(str(message.get('content') or '')) for message in params.get('messages', []))
+        return chars / LLM_INPUT_CONFIG.get('chars_per_token', 4) + params.get('max_tokens', 0)
+
+    def _record(self, counter: str):
+        with self._stats_lock:
+            self.stats[counter] += 1
+        count('llm.gateway', counter)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return request, retry and error counters"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def close(self):
+        """Close the client and stop the event loop thread"""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> Optional[LLMGateway]:
+    """Return the process-wide gateway, or None when no OpenAI API key is configured"""
+    global _gateway
+    if not OPENAI_API_KEY:
+        return None
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway()
+        return _gateway
@@ -7,6 +7,7 @@ A comprehensive tool to extract CXO-level executives using AI-powered chat agent
 import sys
 import time
 import json
+import argparse
 from typing import List, Dict, Any
 from serpapi_searcher import SerpAPISearcher
 from content_scraper import ContentScraper
@@ -15,6 +16,7 @@ from data_exporter import DataExporter
 from chat_agent import ProfessionalInvestorAgent
 from batch_extractor import BatchExtractor
 from config import BATCH_CONFIG
+import cassette
 
 class ProfessionalInvestorLeadsGenerator:
     def __init__(self):
@@ -166,16 +168,16 @@ def main():
     """
     Main entry point
     """
+    parser = argparse.ArgumentParser(description='Professional Investor Leads Generator (interactive by default)')
+    parser.add_argument('--demo', action='store_true', help='Run with a demo query')
+    cassette.add_arguments(parser)
+    args = parser.parse_args()
+    
+    cassette.configure_from_args(args)
     scraper = ProfessionalInvestorLeadsGenerator()
     
-    # Check command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] == '--demo':
-            scraper.run_demo()
-        else:
-            print("Usage:")
-            print("  python main.py        # Interactive mode")
-            print("  python main.py --demo # Demo mode")
+    if args.demo:
+        scraper.run_demo()
     else:
         # Run in interactive mode
         scraper.run()
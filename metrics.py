@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Metrics Module
+Lightweight per-stage timers with latency histograms, call/error counts and
+byte/token counters, exported in Prometheus text format and as JSON reports
+"""
+
+import re
+import time
+import json
+import bisect
+import functools
+import threading
+import contextlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Histogram upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_PREFIX = 'leads'
+
+
+class StageStats:
+    """Latency histogram, call/error counts and named counters of one stage"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.counters: Dict[str, float] = {}
+
+    def observe(self, seconds: float, error: bool = False):
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (max for the +Inf bucket)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max_seconds
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_seconds': round(self.total_seconds, 4),
+            'mean_seconds': round(self.total_seconds / self.count, 4) if self.count else None,
+            'p50_seconds': self.quantile(0.50),
+            'p95_seconds': self.quantile(0.95),
+            'p99_seconds': self.quantile(0.99),
+            'max_seconds': round(self.max_seconds, 4),
+            'buckets': list(self.buckets),
+            'counters': dict(self.counters)
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe collection of StageStats keyed by stage name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, StageStats] = {}
+
+    def _stage(self, stage: str) -> StageStats:
+        stats = self._stages.get(stage)
+        if stats is None:
+            stats = self._stages[stage] = StageStats()
+        return stats
+
+    def observe(self, stage: str, seconds: float, error: bool = False):
+        with self._lock:
+            self._stage(stage).observe(seconds, error)
+
+    def add(self, stage: str, counter: str, value: float = 1):
+        """Add to a named counter of a stage (bytes, tokens, cache hits, ...)"""
+        with self._lock:
+            counters = self._stage(stage).counters
+            counters[counter] = counters.get(counter, 0) + value
+
+    @contextlib.contextmanager
+    def span(self, stage: str):
+        """Time the block under stage; an exception escaping it counts as an error"""
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - start, error)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {stage: stats.to_dict() for stage, stats in sorted(self._stages.items())}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def prometheus(self) -> str:
+        """Render all stages in the Prometheus text exposition format"""
+        name = f"{METRIC_PREFIX}_stage_duration_seconds"
+        lines = [f"# HELP {name} Time spent in each pipeline stage",
+                 f"# TYPE {name} histogram"]
+        counter_lines: Dict[str, list] = {}
+        error_lines = []
+
+        with self._lock:
+            for stage, stats in sorted(self._stages.items()):
+                label = f'stage="{_escape_label(stage)}"'
+                for counter, value in sorted(stats.counters.items()):
+                    counter_lines.setdefault(counter, []).append(f'{{{label}}} {_format_value(value)}')
+                if not stats.count:
+                    continue
+
+                cumulative = 0
+                for bound, bucket_count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{label},le="+Inf"}} {stats.count}')
+                lines.append(f'{name}_sum{{{label}}} {stats.total_seconds:.6f}')
+                lines.append(f'{name}_count{{{label}}} {stats.count}')
+                error_lines.append(f'{METRIC_PREFIX}_stage_errors_total{{{label}}} {stats.errors}')
+
+        lines.append(f"# HELP {METRIC_PREFIX}_stage_errors_total Stage calls that raised")
+        lines.append(f"# TYPE {METRIC_PREFIX}_stage_errors_total counter")
+        lines.extend(error_lines)
+        for counter, samples in sorted(counter_lines.items()):
+            metric = f"{METRIC_PREFIX}_{_metric_name(counter)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(f"{metric}{sample}" for sample in samples)
+        return '\n'.join(lines) + '\n'
+
+
+def diff_snapshots(after: Dict[str, Dict[str, Any]], before: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Stage metrics accumulated between two snapshots
+
+    Quantiles are recomputed from the bucket differences; max_seconds is the
+    process-wide maximum and is therefore omitted.
+    """
+    report = {}
+    for stage, current in after.items():
+        previous = before.get(stage)
+        if previous is None:
+            delta = {key: value for key, value in current.items() if key != 'max_seconds'}
+            if delta['count'] or delta['counters']:
+                report[stage] = delta
+            continue
+
+        stats = StageStats()
+        stats.count = current['count'] - previous['count']
+        stats.errors = current['errors'] - previous['errors']
+        stats.total_seconds = current['total_seconds'] - previous['total_seconds']
+        stats.buckets = [a - b for a, b in zip(current['buckets'], previous['buckets'])]
+        stats.max_seconds = current['max_seconds']
+        stats.counters = {name: value - previous['counters'].get(name, 0)
+                          for name, value in current['counters'].items()
+                          if value - previous['counters'].get(name, 0)}
+        if stats.count or stats.counters:
+            delta = stats.to_dict()
+            del delta['max_seconds']
+            report[stage] = delta
+    return report
+
+
+def write_report(path: str, stages: Dict[str, Dict[str, Any]], **extra: Any):
+    """Write a JSON metrics report (stages plus any extra run fields)"""
+    report = {'generated_at': datetime.now().isoformat(), **extra, 'stages': stages}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _metric_name(counter: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', counter)
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.6f}"
+
+
+# Process-wide registry used by the pipeline
+metrics = MetricsRegistry()
+
+
+def span(stage: str):
+    """Context manager timing a block under stage in the process-wide registry"""
+    return metrics.span(stage)
+
+
+def timed(stage: str):
+    """Decorator timing every call of the function under stage"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metrics.span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(stage: str, counter: str, value: float = 1):
+    """Add to a named counter of a stage in the process-wide registry"""
+    metrics.add(stage, counter, value)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Records Service Module
+Cached in-memory view of executives.csv for the records API, reloaded only when the file changes
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import OUTPUT_CONFIG
+
+
+class RecordsService:
+    """
+    Filter and page the executives CSV without re-reading it per request
+
+    The file is loaded once and reloaded when its mtime or size changes.
+    Company and title are stored as categoricals, so substring filters run
+    over the distinct values only; email/LinkedIn presence are precomputed
+    boolean masks.
+    """
+
+    def __init__(self, filename: str = None):
+        self.filename = filename or OUTPUT_CONFIG['csv_filename']
+        self._lock = threading.Lock()
+        self._signature = None
+        self._df: Optional[pd.DataFrame] = None
+        self._company: Optional[pd.Categorical] = None
+        self._title: Optional[pd.Categorical] = None
+        self._has_email: Optional[np.ndarray] = None
+        self._has_linkedin: Optional[np.ndarray] = None
+
+    def _refresh(self) -> bool:
+        """Reload the CSV if it changed on disk; returns False if it does not exist"""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            self._signature = None
+            self._df = None
+            return False
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return True
+
+        try:
+            df = pd.read_csv(self.filename, dtype=str, keep_default_na=False, encoding='utf-8')
+        except UnicodeDecodeError:
+            df = pd.read_csv(self.filename, dtype=str, keep_default_na=False, encoding='latin-1')
+
+        empty = pd.Series([''] * len(df), index=df.index, dtype=object)
+        self._company = pd.Categorical(df['Company'] if 'Company' in df.columns else empty)
+        self._title = pd.Categorical(df['Title'] if 'Title' in df.columns else empty)
+        self._has_email = (df['Email'].str.strip() != '').to_numpy() if 'Email' in df.columns else np.zeros(len(df), bool)
+        self._has_linkedin = (df['LinkedIn'].str.strip() != '').to_numpy() if 'LinkedIn' in df.columns else np.zeros(len(df), bool)
+
+        self._df = df
+        self._signature = signature
+        print(f"📄 Loaded {len(df)} records from {self.filename}")
+        return True
+
+    @staticmethod
+    def _contains_mask(column: pd.Categorical, needle: str) -> np.ndarray:
+        """Case-insensitive substring match evaluated once per distinct value"""
+        matching = np.flatnonzero(column.categories.str.lower().str.contains(needle.lower(), regex=False))
+        return np.isin(column.codes, matching)
+
+    def query(self, company: Optional[str] = None, position: Optional[str] = None,
+              has_email: Optional[bool] = None, has_linkedin: Optional[bool] = None,
+              limit: int = 100, offset: int = 0, cursor: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Return one page of matching records and the true filtered total
+
+        cursor is the row position returned as next_cursor by the previous
+        page; offset is applied after it.
+        """
+        with self._lock:
+            if not self._refresh():
+                return {'records': [], 'total': 0, 'next_cursor': None}
+
+            df = self._df
+            mask = np.ones(len(df), dtype=bool)
+            if company:
+                mask &= self._contains_mask(self._company, company)
+            if position:
+                mask &= self._contains_mask(self._title, position)
+            if has_email is not None:
+                mask &= self._has_email if has_email else ~self._has_email
+            if has_linkedin is not None:
+                mask &= self._has_linkedin if has_linkedin else ~self._has_linkedin
+
+            positions = np.flatnonzero(mask)
+            total = len(positions)
+
+            if cursor is not None:
+                positions = positions[np.searchsorted(positions, cursor, side='right'):]
+            page = positions[offset:offset + limit]
+
+            records = df.iloc[page].to_dict('records')
+
+        next_cursor = int(page[-1]) if len(page) and offset + limit < len(positions) else None
+        return {'records': records, 'total': total, 'next_cursor': next_cursor}
+
+
+_service: Optional[RecordsService] = None
+_service_lock = threading.Lock()
+
+
+def get_records_service() -> RecordsService:
+    """Return the process-wide records service"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = RecordsService()
+        return _service
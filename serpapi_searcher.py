@@ -1,18 +1,69 @@
 import time
 import random
-from typing import List, Dict, Any
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional
 from serpapi import GoogleSearch
-from config import SERPAPI_KEY, SCRAPING_CONFIG
+from config import SERPAPI_KEY, SCRAPING_CONFIG, CACHE_CONFIG, SEARCH_CONFIG, BATCH_CONFIG
+from cache_store import get_cache_store
+from concurrency import get_rate_limiter, run_sync, service_slot
+from metrics import span, count
+from title_matcher import result_keywords
+import cassette
+
+_search_executor: Optional[ThreadPoolExecutor] = None
+_search_executor_lock = threading.Lock()
+
+
+def get_search_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide pool that runs blocking SerpAPI searches
+
+    Shared by every async_search_many call instead of a pool per call; sized
+    to cover both the per-call concurrency and the 'serpapi' service slots.
+    """
+    global _search_executor
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(
+                max_workers=max(SEARCH_CONFIG.get('max_concurrent_searches', 4),
+                                BATCH_CONFIG.get('service_concurrency', {}).get('serpapi', 4)),
+                thread_name_prefix='serpapi'
+            )
+        return _search_executor
+
 
 class SerpAPISearcher:
     def __init__(self):
         if not SERPAPI_KEY:
             raise ValueError("SERPAPI_KEY not found in environment variables. Please add it to your .env file.")
         self.api_key = SERPAPI_KEY
+        
+        # Shared on-disk cache of raw search pages
+        if CACHE_CONFIG.get('enabled', True):
+            self.cache = get_cache_store(
+                'search',
+                max_entries=CACHE_CONFIG.get('search_max_entries'),
+                max_bytes=CACHE_CONFIG.get('search_max_bytes')
+            )
+        else:
+            self.cache = None
+        
+        # Token bucket shared by every searcher in the process
+        self.rate_limiter = get_rate_limiter(
+            'serpapi',
+            rate_per_second=SEARCH_CONFIG.get('requests_per_minute', 60) / 60.0,
+            capacity=SEARCH_CONFIG.get('burst', 5)
+        )
     
-    def search_google(self, query: str, max_pages: int = None, max_results: int = None) -> List[Dict[str, str]]:
+    def search_google(self, query: str, max_pages: int = None, max_results: int = None,
+                      query_class: str = 'default') -> List[Dict[str, str]]:
         """
         Perform Google search using SerpAPI
+        
+        query_class selects the cache TTL ('executive_team', 'enrichment' or 'default')
         """
         if max_pages is None:
             max_pages = 1  # Reduced from SCRAPING_CONFIG['max_pages_per_search'] for speed
@@ -36,9 +87,8 @@ class SerpAPISearcher:
                     "gl": "us"  # Country
                 }
                 
-                # Perform search
-                search = GoogleSearch(search_params)
-                results = search.get_dict()
+                # Perform search (served from cache when possible)
+                results, from_cache = self._fetch_page(search_params, query_class)
                 
                 # Extract organic results
                 organic_results = results.get("organic_results", [])
@@ -82,8 +132,8 @@ class SerpAPISearcher:
                     print(f"Reached end of results on page {page + 1}")
                     break
                 
-                # Reduced delay for speed
-                if page < max_pages - 1:
+                # Reduced delay for speed (no need to wait after a cache hit)
+                if page < max_pages - 1 and not from_cache:
                     delay = random.uniform(0.5, 1.5)  # Reduced from 1-3 seconds
                     print(f"Waiting {delay:.1f} seconds...")
                     time.sleep(delay)
@@ -95,12 +145,70 @@ class SerpAPISearcher:
         # Limit results to max_results
         return all_results[:max_results]
     
+    def _fetch_page(self, search_params: Dict[str, Any], query_class: str = 'default') -> Tuple[Dict[str, Any], bool]:
+        """
+        Fetch one page of SerpAPI results, using the on-disk cache when enabled
+        
+        Returns the results dict and whether it was served from cache
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(search_params)
+            cached = self.cache.get(cache_key, label=query_class)
+            if cached is not None:
+                print(f"💾 Cache hit for: {search_params['q']} (start={search_params['start']})")
+                count('serpapi.search', 'cache_hits')
+                return cached, True
+        
+        if not cassette.replaying():
+            self.rate_limiter.acquire()
+        search = GoogleSearch(search_params)
+        if SEARCH_CONFIG.get('backend_url'):
+            search.BACKEND = SEARCH_CONFIG['backend_url'].rstrip('/')
+        with service_slot('serpapi'), span('serpapi.search'):
+            results = cassette.serpapi_search(search_params, search.get_dict)
+        
+        # Only cache successful responses, keeping just the fields we use
+        if self.cache and 'error' not in results:
+            ttl_by_class = CACHE_CONFIG.get('search_ttl_seconds', {})
+            ttl = ttl_by_class.get(query_class, ttl_by_class.get('default'))
+            trimmed = {
+                'organic_results': [
+                    {
+                        'title': result.get('title', ''),
+                        'link': result.get('link', ''),
+                        'snippet': result.get('snippet', '')
+                    }
+                    for result in results.get('organic_results', [])
+                ]
+            }
+            self.cache.set(cache_key, trimmed, ttl=ttl)
+        
+        return results, False
+    
+    def _cache_key(self, search_params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from the normalized search parameters (never the API key)
+        """
+        return self.cache.make_key({
+            'engine': search_params.get('engine', 'google'),
+            'q': ' '.join(str(search_params.get('q', '')).lower().split()),
+            'start': int(search_params.get('start', 0)),
+            'num': int(search_params.get('num', 10)),
+            'hl': search_params.get('hl', ''),
+            'gl': search_params.get('gl', '')
+        })
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss counters for the search cache
+        """
+        return self.cache.get_stats() if self.cache else {'enabled': False}
+    
     def _is_relevant_result(self, title: str, snippet: str, url: str) -> bool:
         """
         Check if search result is relevant to our executive search
         """
-        text = f"{title} {snippet}".lower()
-        
         # Skip certain types of pages
         skip_domains = [
             'youtube.com', 'facebook.com', 'twitter.com', 'instagram.com',
@@ -112,23 +220,26 @@ class SerpAPISearcher:
             return False
         
         # Look for executive-related keywords
-        executive_keywords = [
-            'executive', 'ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio',
-            'chief', 'president', 'director', 'manager', 'officer',
-            'leadership', 'management', 'board'
-        ]
-        
-        return any(keyword in text for keyword in executive_keywords)
+        return result_keywords.search(f"{title} {snippet}")
     
-    def search_multiple_queries(self, queries: List[str], max_results_per_query: int = None) -> List[Dict[str, str]]:
+    def search_multiple_queries(self, queries: List[str], max_results_per_query: int = None,
+                                query_class: str = 'default', concurrent: bool = None) -> List[Dict[str, str]]:
         """
         Search multiple queries and combine results
+        
+        With concurrent=True (default from SEARCH_CONFIG) queries are fanned out
+        through async_search_many instead of running one after another.
         """
+        if concurrent is None:
+            concurrent = SEARCH_CONFIG.get('concurrent_multi_query', False)
+        if concurrent:
+            return run_sync(self.async_search_many(queries, max_results_per_query, query_class=query_class))
+        
         all_results = []
         
         for i, query in enumerate(queries):
             print(f"\nSearching query {i + 1}/{len(queries)}: {query}")
-            results = self.search_google(query, max_results=max_results_per_query)
+            results = self.search_google(query, max_results=max_results_per_query, query_class=query_class)
             all_results.extend(results)
             
             # Delay between different queries
@@ -137,7 +248,45 @@ class SerpAPISearcher:
                 print(f"Waiting {delay:.1f} seconds between queries...")
                 time.sleep(delay)
         
-        # Remove duplicates based on URL
+        return self._deduplicate_results(all_results)
+    
+    async def async_search_many(self, queries: List[str], max_results_per_query: int = None,
+                                query_class: str = 'default', max_concurrency: int = None) -> List[Dict[str, str]]:
+        """
+        Search multiple queries concurrently with a bounded number in flight
+        
+        Pacing comes from the shared SerpAPI token bucket instead of fixed sleeps;
+        results keep query order and are de-duplicated by URL.
+        """
+        if max_concurrency is None:
+            max_concurrency = SEARCH_CONFIG.get('max_concurrent_searches', 4)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        executor = get_search_executor()
+        
+        async def run_query(i: int, query: str) -> List[Dict[str, str]]:
+            async with semaphore:
+                print(f"\nSearching query {i + 1}/{len(queries)}: {query}")
+                try:
+                    return await loop.run_in_executor(
+                        executor,
+                        functools.partial(self.search_google, query, max_results=max_results_per_query,
+                                          query_class=query_class)
+                    )
+                except Exception as e:
+                    print(f"Error searching query {i + 1}: {e}")
+                    return []
+        
+        per_query_results = await asyncio.gather(*(run_query(i, query) for i, query in enumerate(queries)))
+        
+        all_results = [result for results in per_query_results for result in results]
+        return self._deduplicate_results(all_results)
+    
+    def _deduplicate_results(self, all_results: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Remove duplicates based on URL, keeping the first occurrence
+        """
         unique_results = []
         seen_urls = set()
         
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from cache_store import CacheStore
+from content_scraper import ContentScraper
+from html_extractor import BeautifulSoupExtractor
+
+PAGE = Path(__file__).resolve().parent.parent / 'benchmarks' / 'fixtures' / 'pages' / 'falconcrest_leadership.html'
+URL = 'https://falconcrest.example.com/leadership'
+
+
+def make_scraper(tmp_path, content):
+    scraper = ContentScraper()
+    scraper.page_cache = CacheStore('pages', db_path=str(tmp_path / 'cache.db'))
+    scraper._download = lambda url, validators=None: {
+        'status': 200, 'content': content, 'etag': '"v1"', 'last_modified': None
+    }
+    return scraper
+
+
+def test_page_cache_keeps_raw_html(tmp_path):
+    content = PAGE.read_bytes()
+    scraper = make_scraper(tmp_path, content)
+    article = scraper._fallback_processing(URL)
+
+    entry = scraper.page_cache.get(scraper.page_cache.make_key({'url': URL}))
+    assert entry['html'].encode('latin-1') == content
+    assert entry['article_data'] == article
+
+
+def test_cached_page_is_re_extracted_after_backend_change(tmp_path, monkeypatch):
+    from config import CACHE_CONFIG
+    monkeypatch.setitem(CACHE_CONFIG, 'page_fresh_seconds', 3600)
+
+    scraper = make_scraper(tmp_path, PAGE.read_bytes())
+    scraper._fallback_processing(URL)
+
+    scraper.extractor = BeautifulSoupExtractor()
+    scraper.extractor.name = 'other'
+    scraper._download = None
+    article = scraper._fallback_processing(URL)
+
+    entry = scraper.page_cache.get(scraper.page_cache.make_key({'url': URL}))
+    assert entry['extractor'] == 'other'
+    assert article['title'] and entry['article_data'] == article
@@ -0,0 +1,13 @@
+import pytest
+
+from executive_extractor import ExecutiveExtractor
+
+
+@pytest.mark.parametrize('reply', [
+    '{"1": []}',
+    '```json\n{"1": []}\n```',
+    '```\n{"1": []}\n```',
+    '\n  ```json\n{"1": []}\n```  \n',
+])
+def test_json_reply_fences_are_dropped(reply):
+    assert ExecutiveExtractor._parse_json_reply(reply) == {'1': []}
@@ -0,0 +1,78 @@
+import pytest
+
+from executive_index import ExecutiveIndex, normalize_executive_name
+
+
+def executive(name, company='Emirates NBD', **fields):
+    return dict({'name': name, 'company': company, 'confidence': 0.8}, **fields)
+
+
+@pytest.mark.parametrize('first, second', [
+    ('Mohammed Al Suwaidi', 'Muhammad Al-Suwaidi'),
+    ('Mohamed Alsuwaidi', 'Mohammad El Suwaidi'),
+    ('Yousef Hassan', 'Yusuf Hasan'),
+    ('Youssef Al Hashimi', 'Yousef Alhashemi'),
+    ('Abdullah Khalifa', 'Abdulla Khalifah'),
+    ('Abdel Rahman Saeed', 'Abdulrahman Saeed'),
+    ('Dr. Khalid Ahmed', 'Khaled Ahmad'),
+    ('H.E. Sheikh Tariq Al Mansoori', 'Tarek Al Mansoori'),
+    ('John A. Smith', 'John Smith'),
+    ('John A. Smith', 'John A Smith'),
+    ('Omar El-Sayed', 'Omar Al Sayed'),
+    ('Omar el Sayed', 'Omar Al-Sayed'),
+])
+def test_merges_spellings_of_one_person(first, second):
+    index = ExecutiveIndex()
+    assert index.add(executive(first))
+    assert not index.add(executive(second))
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize('first, second', [
+    ('Dan Smith', 'Don Smith'),
+    ('Tim Cook', 'Tom Cook'),
+    ('Hamad Ahmed', 'Hamid Ahmed'),
+    ('Rana Saleh', 'Rania Saleh'),
+    ('Ali Hassan', 'Ala Hassan'),
+    ('Sara Khan', 'Sarah Khan'),
+    ('John A. Smith', 'John B. Smith'),
+    ('Duke Ellington', 'Duke Allington'),
+    ('Maria Elena Rossi', 'Maria Alena Rossi'),
+])
+def test_keeps_different_people_apart(first, second):
+    index = ExecutiveIndex()
+    assert index.add(executive(first))
+    assert index.add(executive(second))
+    assert len(index) == 2
+    assert normalize_executive_name(first) != normalize_executive_name(second)
+
+
+def test_same_name_at_different_companies():
+    index = ExecutiveIndex()
+    index.add(executive('Mohammed Ali', company='Emirates NBD PJSC'))
+    index.add(executive('Mohammed Ali', company='First Abu Dhabi Bank'))
+    assert len(index) == 2
+
+
+def test_initials_learned_from_a_merge():
+    index = ExecutiveIndex()
+    index.add(executive('John Smith'))
+    index.add(executive('John A. Smith'))
+    assert index.add(executive('John B. Smith'))
+    assert [e['name'] for e in index.values()] == ['John Smith', 'John B. Smith']
+
+
+def test_merge_keeps_higher_confidence_and_fills_fields():
+    index = ExecutiveIndex()
+    index.add(executive('Mohamed Ali', title='CEO', confidence=0.6, email='m.ali@example.com'))
+    index.add(executive('Muhammad Ali', title='Chief Executive Officer', confidence=0.9, linkedin='in/mali'))
+    [merged] = index.values()
+    assert merged['title'] == 'Chief Executive Officer'
+    assert merged['email'] == 'm.ali@example.com'
+    assert merged['linkedin'] == 'in/mali'
+    assert executive('Mohammad Ali') in index
+
+
+def test_el_inside_a_word_is_not_a_particle():
+    assert normalize_executive_name('Maria Elena Rossi') == 'maria elena rossi'
+    assert normalize_executive_name('Duke Ellington') == 'duke ellington'
@@ -0,0 +1,42 @@
+import os
+import stat
+
+from file_utils import atomic_write
+
+
+def mode_of(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_rewrite_keeps_existing_permissions(tmp_path):
+    path = tmp_path / 'executives.csv'
+    path.write_text('Name\n')
+    os.chmod(path, 0o644)
+
+    with atomic_write(str(path)) as f:
+        f.write('Name\nSarah\n')
+
+    assert path.read_text() == 'Name\nSarah\n'
+    assert mode_of(path) == 0o644
+
+
+def test_new_file_gets_umask_default(tmp_path):
+    umask = os.umask(0)
+    os.umask(umask)
+    path = tmp_path / 'batch_progress.json'
+    with atomic_write(str(path)) as f:
+        f.write('{}')
+    assert mode_of(path) == 0o666 & ~umask
+
+
+def test_failed_write_leaves_original(tmp_path):
+    path = tmp_path / 'executives.csv'
+    path.write_text('old')
+    try:
+        with atomic_write(str(path)) as f:
+            f.write('new')
+            raise RuntimeError('boom')
+    except RuntimeError:
+        pass
+    assert path.read_text() == 'old'
+    assert os.listdir(tmp_path) == ['executives.csv']
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from html_extractor import BeautifulSoupExtractor, get_extractor
+
+pytest.importorskip('lxml')
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'benchmarks', 'fixtures', 'pages')
+FIXTURE_PAGES = sorted(name for name in os.listdir(PAGES_DIR) if name.endswith('.html'))
+
+EDGE_CASES = [
+    # First <article> sits inside a stripped <header>: the second one is the content
+    b'<html><body><header><article>Teaser</article></header><p>x</p>'
+    b'<article>Real article body with CEO John</article></body></html>',
+    # A matching class inside <nav> falls through to the next match, not to <body>
+    b'<html><body><nav><div class="content">Menu</div></nav><p>y</p>'
+    b'<div class="content">Leadership team</div></body></html>',
+    # meta[name="twitter:title"] does not match a property attribute
+    b'<html><head><meta property="twitter:title" content="Wrong source title">'
+    b'<meta name="og:title" content="Also wrong title"></head><body><p>Body</p></body></html>',
+    b'<html><head><meta property="og:title" content="Open Graph Title"></head><body><p>Body</p></body></html>',
+]
+
+
+def read_page(name):
+    with open(os.path.join(PAGES_DIR, name), 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('content', [read_page(name) for name in FIXTURE_PAGES] + EDGE_CASES,
+                         ids=FIXTURE_PAGES + [f'edge{i}' for i in range(len(EDGE_CASES))])
+def test_lxml_matches_beautifulsoup(content):
+    assert get_extractor('lxml').extract(content) == BeautifulSoupExtractor().extract(content)
+
+
+def test_nested_noise_candidate_is_skipped():
+    result = get_extractor('lxml').extract(EDGE_CASES[0])
+    assert result['text'] == 'Real article body with CEO John'
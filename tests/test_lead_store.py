@@ -0,0 +1,61 @@
+from lead_store import LeadStore
+
+
+def executive(name, company='Emirates NBD', **fields):
+    return dict({'name': name, 'company': company, 'title': 'CEO', 'confidence': 0.8}, **fields)
+
+
+def test_similar_names_stay_separate_records(tmp_path):
+    store = LeadStore(str(tmp_path / 'leads.db'))
+    store.upsert_executives([
+        executive('Dan Smith', email='dan@example.com'),
+        executive('Don Smith', email='don@example.com'),
+        executive('Hamad Ahmed'),
+        executive('Hamid Ahmed'),
+    ])
+    assert store.count() == 4
+
+
+def test_case_accents_and_spacing_merge(tmp_path):
+    store = LeadStore(str(tmp_path / 'leads.db'))
+    store.upsert_executives([executive('José  Álvarez'), executive('jose alvarez', email='ja@example.com')])
+    assert store.count() == 1
+
+
+def test_cursor_stops_at_the_last_page(tmp_path):
+    store = LeadStore(str(tmp_path / 'leads.db'))
+    store.upsert_executives([executive(f"Executive {i}") for i in range(6)])
+
+    first = store.query_records(limit=3)
+    assert len(first['records']) == 3 and first['next_cursor'] is not None
+    second = store.query_records(limit=3, cursor=first['next_cursor'])
+    assert [r['Name'] for r in second['records']] == ['Executive 3', 'Executive 4', 'Executive 5']
+    assert second['next_cursor'] is None
+
+
+def search_names(store, text):
+    return sorted(record['Name'] for record in store.search(text)['records'])
+
+
+def test_search_matches_plurals_and_cxo_synonyms(tmp_path):
+    store = LeadStore(str(tmp_path / 'leads.db'))
+    store.upsert_executives([
+        executive('Sara Haddad', title='Chief Executive Officer'),
+        executive('Omar Nasser', title='CEO'),
+        executive('Lina Farouk', title='Board Directors Liaison'),
+        executive('Karim Saleh', title='Chief Financial Officer'),
+    ])
+
+    assert search_names(store, 'CEOs') == ['Omar Nasser', 'Sara Haddad']
+    assert search_names(store, 'chief executive officers') == ['Omar Nasser', 'Sara Haddad']
+    assert search_names(store, 'director liaison') == ['Lina Farouk']
+    assert search_names(store, 'CFO') == ['Karim Saleh']
+
+
+def test_single_letter_is_not_a_prefix(tmp_path):
+    store = LeadStore(str(tmp_path / 'leads.db'))
+    store.upsert_executives([executive('Karim Saleh'), executive('Sara K Haddad')])
+
+    assert store.search('k')['query'] == '"k"'
+    assert search_names(store, 'k') == ['Sara K Haddad']
+    assert search_names(store, 'ka') == ['Karim Saleh']
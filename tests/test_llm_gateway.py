@@ -0,0 +1,34 @@
+import asyncio
+from types import SimpleNamespace
+
+from llm_gateway import LLMGateway
+
+
+def test_throttled_request_does_not_hold_a_slot():
+    gateway = LLMGateway(api_key='test', max_concurrency=1)
+    released = asyncio.Event()
+    completed = []
+
+    async def acquire(tokens=1):
+        # The first request stays throttled until the second one finishes
+        if not completed and not released.is_set():
+            released.set()
+            while not completed:
+                await asyncio.sleep(0.01)
+
+    async def create(**params):
+        completed.append(params['model'])
+        return params['model']
+
+    gateway.request_limiter.acquire_async = acquire
+    gateway._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    async def run():
+        gateway._semaphore = asyncio.Semaphore(1)
+        first = asyncio.create_task(gateway._complete({'model': 'first'}))
+        await released.wait()
+        second = await asyncio.wait_for(gateway._complete({'model': 'second'}), timeout=2)
+        return second, await first
+
+    assert asyncio.run(run()) == ('second', 'first')
+    assert completed == ['second', 'first']
@@ -0,0 +1,45 @@
+import asyncio
+
+from ws_broadcaster import Broadcaster
+
+
+class StuckSocket:
+    """A browser that stopped reading: sends never complete"""
+
+    def __init__(self):
+        self.close_code = None
+
+    async def send_text(self, text):
+        await asyncio.Event().wait()
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+
+def test_pruned_client_socket_is_closed():
+    async def scenario():
+        broadcaster = Broadcaster(max_queue=2, send_timeout=5)
+        socket = StuckSocket()
+        broadcaster.connect(socket)
+        await asyncio.sleep(0)
+        for i in range(10):
+            broadcaster.publish({'type': 'results', 'count': i})
+        await asyncio.sleep(0.01)
+        return broadcaster, socket
+
+    broadcaster, socket = asyncio.run(scenario())
+    assert broadcaster.client_count == 0
+    assert broadcaster.pruned == 1
+    assert socket.close_code == 1008
+
+
+def test_plain_disconnect_leaves_socket_to_the_handler():
+    async def scenario():
+        broadcaster = Broadcaster()
+        socket = StuckSocket()
+        client = broadcaster.connect(socket)
+        broadcaster.disconnect(client)
+        await asyncio.sleep(0.01)
+        return socket
+
+    assert asyncio.run(scenario()).close_code is None
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Title Matcher Module
+Compiled multi-keyword matchers for CXO titles and executive-related
+keywords, built once at import and shared by search result filtering, page
+parsing and executive extraction
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+from config import CXO_POSITIONS
+
+# Keywords marking text about executives (matched as word prefixes, so plurals count)
+PAGE_KEYWORDS = ['ceo', 'cfo', 'cmo', 'cto', 'coo', 'cio', 'chief', 'executive', 'president', 'director']
+
+ARTICLE_KEYWORDS = PAGE_KEYWORDS + [
+    'manager', 'officer', 'leadership', 'management', 'board',
+    'appointed', 'named', 'joins', 'leaves', 'retires', 'promoted'
+]
+
+RESULT_KEYWORDS = PAGE_KEYWORDS + ['manager', 'officer', 'leadership', 'management', 'board']
+
+
+def _is_boundary(text: str, i: int) -> bool:
+    """
+    True at the start or end of a word
+
+    Extracted page text often glues neighbouring elements together
+    ("WhitfieldChief Financial Officer"), so a lower-to-upper case change
+    counts as a boundary too.
+    """
+    if i == 0 or i >= len(text):
+        return True
+    before, after = text[i - 1], text[i]
+    return not (before.isalnum() and after.isalnum()) or (before.islower() and after.isupper())
+
+
+class KeywordMatcher:
+    """
+    One compiled regex over a list of keywords, matched case-insensitively
+
+    Alternatives are tried longest first, so at any position the most
+    specific keyword wins ("Chief Executive Officer" over "Chief Executive").
+    Whole words may carry a plural "s" ("CEOs"); with whole_words=False a
+    keyword only has to start a word.
+
+    The regex runs case-sensitively over the lowercased text, which re does
+    several times faster than with IGNORECASE; word boundaries are then
+    checked on the original text.
+    """
+
+    def __init__(self, keywords: List[str], whole_words: bool = True):
+        self.keywords = list(keywords)
+        self.whole_words = whole_words
+        self._canonical = {}
+        for keyword in self.keywords:
+            self._canonical.setdefault(keyword.lower(), keyword)
+
+        ordered = sorted(self._canonical, key=len, reverse=True)
+        alternatives = '|'.join(re.escape(keyword) for keyword in ordered)
+        self.pattern = re.compile(alternatives)
+        # For text whose lowercase form has a different length (spans would not line up)
+        self._ignorecase_pattern = re.compile(alternatives, re.IGNORECASE)
+        # Shorter keywords a match falls back to when it does not end a word
+        self._fallbacks = {keyword: [keyword] + [other for other in ordered
+                                                 if other != keyword and keyword.startswith(other)]
+                           for keyword in ordered}
+
+    def search(self, text: str) -> bool:
+        """True when any keyword occurs in text"""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            # Fast path: most texts either have no candidate at all or a valid first one
+            match = self.pattern.search(lowered)
+            if match is None:
+                return False
+            if not self.whole_words and _is_boundary(text, match.start()):
+                return True
+        return next(self.finditer(text), None) is not None
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """(keyword, start, end) of every non-overlapping match, keyword spelled as configured"""
+        lowered = text.lower()
+        pattern = self.pattern
+        if len(lowered) != len(text):
+            lowered, pattern = text, self._ignorecase_pattern
+
+        pos = 0
+        while True:
+            match = pattern.search(lowered, pos)
+            if match is None:
+                return
+            start = match.start()
+            found = _is_boundary(text, start) and self._match_word(text, lowered, start, match.group().lower())
+            if not found:
+                pos = start + 1
+                continue
+            keyword, end = found
+            yield self._canonical[keyword], start, end
+            pos = end
+
+    def _match_word(self, text: str, lowered: str, start: int, keyword: str) -> Optional[Tuple[str, int]]:
+        """(keyword, end) of the longest keyword at start that ends a word, plural included"""
+        if not self.whole_words:
+            return keyword, start + len(keyword)
+        for candidate in self._fallbacks[keyword]:
+            end = start + len(candidate)
+            if _is_boundary(text, end):
+                return candidate, end
+            if lowered[end] == 's' and _is_boundary(text, end + 1):
+                return candidate, end + 1
+        return None
+
+    def best(self, text: str) -> Optional[Tuple[str, int, int]]:
+        """The longest match (the earliest one on ties), or None"""
+        best = None
+        for found in self.finditer(text):
+            if best is None or found[2] - found[1] > best[2] - best[1]:
+                best = found
+        return best
+
+
+# Shared matchers, compiled once
+cxo_titles = KeywordMatcher(CXO_POSITIONS)
+page_keywords = KeywordMatcher(PAGE_KEYWORDS, whole_words=False)
+article_keywords = KeywordMatcher(ARTICLE_KEYWORDS, whole_words=False)
+result_keywords = KeywordMatcher(RESULT_KEYWORDS, whole_words=False)
@@ -8,22 +8,31 @@ import asyncio
 import json
 import os
 import time
+import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-import pandas as pd
 from fastapi import FastAPI, Request, Form, UploadFile, File, WebSocket, WebSocketDisconnect, Body
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
-from main import ProfessionalInvestorLeadsGenerator
+import cassette
 from batch_extractor import BatchExtractor
 from chat_agent import ProfessionalInvestorAgent
-from config import BATCH_CONFIG
+from concurrency import run_blocking
+from config import BATCH_CONFIG, STORE_CONFIG
 from data_exporter import DataExporter
+from job_manager import Job, JobManager, current_job
+from lead_store import get_lead_store
+from metrics import metrics
+from records_service import get_records_service
+from ws_broadcaster import Broadcaster
+
+# Record/replay external traffic when LEADS_CASSETTE_MODE is set
+cassette.configure()
 
 # Initialize FastAPI app
 app = FastAPI(title="CXO Executive Scraper", version="1.0.0")
@@ -32,11 +41,15 @@ app = FastAPI(title="CXO Executive Scraper", version="1.0.0")
 templates = Jinja2Templates(directory="templates")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Global variables for real-time updates
-active_connections: List[WebSocket] = []
-scraper_instance = None
-batch_instance = None
-chat_agent_instance = None
+# Real-time updates to WebSocket clients (one channel per job)
+broadcaster = Broadcaster()
+
+def publish_job_update(job: Job):
+    """Send a job's status and progress to its channel"""
+    broadcaster.publish({"type": "job", "job": job.to_dict()}, job.id)
+
+# Background jobs (search, chat agent, batch, upload)
+job_manager = JobManager(on_update=publish_job_update)
 
 class SearchRequest(BaseModel):
     query: str
@@ -72,76 +85,43 @@ async def config_page(request: Request):
     return templates.TemplateResponse("config.html", {"request": request})
 
 @app.get("/api/records")
-async def get_records(
+def get_records(
     company: Optional[str] = None,
     position: Optional[str] = None,
     has_email: Optional[bool] = None,
     has_linkedin: Optional[bool] = None,
-    limit: int = 100
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[int] = None
 ):
-    """Get executives records with filters"""
+    """
+    Get executives records with filters (offset or cursor paging, true filtered total)
+    
+    Declared without async so FastAPI runs it in its threadpool: SQLite and
+    CSV reads never block the event loop, and they do not queue behind
+    pipeline steps on the separate pipeline executor.
+    """
     try:
-        if not os.path.exists("executives.csv"):
-            return {"records": [], "total": 0}
+        filters = dict(company=company, position=position, has_email=has_email, has_linkedin=has_linkedin,
+                       limit=limit, offset=offset, cursor=cursor)
         
-        # Read CSV with error handling
-        try:
-            df = pd.read_csv("executives.csv", encoding='utf-8')
-        except UnicodeDecodeError:
-            df = pd.read_csv("executives.csv", encoding='latin-1')
-        except Exception as e:
-            print(f"Error reading CSV: {e}")
-            return {"error": f"Error reading CSV file: {str(e)}", "records": [], "total": 0}
+        if STORE_CONFIG.get('enabled', True):
+            return get_lead_store().query_records(**filters)
         
-        # Clean the dataframe to handle JSON serialization issues
-        df = df.replace([float('inf'), float('-inf')], None)
-        df = df.fillna('')
+        # CSV-backed view, cached in memory until executives.csv changes
+        return get_records_service().query(**filters)
         
-        # Apply filters with error handling
-        if company:
-            try:
-                df = df[df['Company'].str.contains(company, case=False, na=False)]
-            except:
-                pass  # Skip filter if column doesn't exist or has issues
-        if position:
-            try:
-                df = df[df['Title'].str.contains(position, case=False, na=False)]
-            except:
-                pass  # Skip filter if column doesn't exist or has issues
-        if has_email is not None:
-            try:
-                if has_email:
-                    df = df[df['Email'].notna() & (df['Email'] != '')]
-                else:
-                    df = df[df['Email'].isna() | (df['Email'] == '')]
-            except:
-                pass  # Skip filter if column doesn't exist or has issues
-        if has_linkedin is not None:
-            try:
-                if has_linkedin:
-                    df = df[df['LinkedIn'].notna() & (df['LinkedIn'] != '')]
-                else:
-                    df = df[df['LinkedIn'].isna() | (df['LinkedIn'] == '')]
-            except:
-                pass  # Skip filter if column doesn't exist or has issues
-        
-        # Limit results
-        df = df.head(limit)
-        
-        # Convert to records with proper JSON serialization
-        records = []
-        for _, row in df.iterrows():
-            record = {}
-            for col in df.columns:
-                value = row[col]
-                # Handle NaN and infinite values
-                if pd.isna(value) or (isinstance(value, float) and (value == float('inf') or value == float('-inf'))):
-                    record[col] = None
-                else:
-                    record[col] = value
-            records.append(record)
+    except Exception as e:
+        return {"error": str(e), "records": [], "total": 0}
+
+@app.get("/api/records/search")
+def search_records(q: str, limit: int = 50, offset: int = 0):
+    """Ranked full-text search over names, titles, companies, industries and source titles"""
+    try:
+        if not STORE_CONFIG.get('enabled', True):
+            return {"error": "Full-text search requires the lead store (STORE_CONFIG['enabled'])", "records": [], "total": 0}
         
-        return {"records": records, "total": len(records)}
+        return get_lead_store().search(q, limit=limit, offset=offset)
         
     except Exception as e:
         return {"error": str(e), "records": [], "total": 0}
@@ -182,15 +162,9 @@ async def update_config(config: ConfigUpdate):
 @app.post("/api/search")
 async def start_search(request: SearchRequest):
     """Start a search operation using chat agent"""
-    global scraper_instance
-    
     try:
-        scraper_instance = ProfessionalInvestorLeadsGenerator()
-        
-        # Start search in background
-        asyncio.create_task(run_search(request.query))
-        
-        return {"success": True, "message": "Search started", "task_id": "search_1"}
+        job = job_manager.submit('search', lambda job: run_search(job, request.query), description=request.query)
+        return {"success": True, "message": "Search started", "task_id": job.id, "job": job.to_dict()}
         
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -198,15 +172,10 @@ async def start_search(request: SearchRequest):
 @app.post("/api/chat-agent")
 async def start_chat_agent(request: ChatAgentRequest):
     """Start a chat agent operation"""
-    global chat_agent_instance
-    
     try:
-        chat_agent_instance = ProfessionalInvestorAgent()
-        
-        # Start chat agent processing in background
-        asyncio.create_task(run_chat_agent_processing(request.query))
-        
-        return {"success": True, "message": "Chat agent started", "task_id": "chat_1"}
+        job = job_manager.submit('chat_agent', lambda job: run_chat_agent_processing(job, request.query),
+                                 description=request.query)
+        return {"success": True, "message": "Chat agent started", "task_id": job.id, "job": job.to_dict()}
         
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -214,15 +183,10 @@ async def start_chat_agent(request: ChatAgentRequest):
 @app.post("/api/batch")
 async def start_batch(request: BatchRequest):
     """Start a batch processing operation"""
-    global batch_instance
-    
     try:
-        batch_instance = BatchExtractor()
-        
-        # Start batch processing in background
-        asyncio.create_task(run_batch_processing_json(request.source, request.json_data))
-        
-        return {"success": True, "message": "Batch processing started", "task_id": "batch_1"}
+        job = job_manager.submit('batch', lambda job: run_batch_processing_json(job, request.source, request.json_data),
+                                 description=f"{request.source} source")
+        return {"success": True, "message": "Batch processing started", "task_id": job.id, "job": job.to_dict()}
         
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -231,8 +195,9 @@ async def start_batch(request: BatchRequest):
 async def upload_file(file: UploadFile = File(...)):
     """Upload CSV file for batch processing"""
     try:
-        # Save uploaded file
-        file_path = f"uploads/{file.filename}"
+        # Save uploaded file (unique name, so concurrent uploads of the same file do not clobber each other)
+        filename = os.path.basename(file.filename)
+        file_path = f"uploads/{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}_{filename}"
         os.makedirs("uploads", exist_ok=True)
         
         with open(file_path, "wb") as buffer:
@@ -240,60 +205,100 @@ async def upload_file(file: UploadFile = File(...)):
             buffer.write(content)
         
         # Start batch processing with CSV source
-        asyncio.create_task(run_batch_processing_csv(file_path))
+        job = job_manager.submit('upload', lambda job: run_batch_processing_csv(job, file_path), description=filename)
         
-        return {"success": True, "message": f"File uploaded and batch processing started: {file.filename}"}
+        return {"success": True, "message": f"File uploaded and batch processing started: {filename}",
+                "task_id": job.id, "job": job.to_dict()}
         
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+@app.get("/api/jobs")
+async def list_jobs(status: Optional[str] = None):
+    """List tracked jobs (newest first) with status and per-company progress"""
+    return {
+        "jobs": [job.to_dict() for job in job_manager.list(status)],
+        "counts": job_manager.counts(),
+        "max_concurrent_jobs": job_manager.max_concurrent_jobs
+    }
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get one job's status and progress"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return {"success": False, "error": f"Job not found: {job_id}"}
+    return {"success": True, "job": job.to_dict()}
+
+@app.post("/api/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job (a running job stops after its current pipeline step)"""
+    if not job_manager.cancel(job_id):
+        return {"success": False, "error": f"Job not found or already finished: {job_id}"}
+    await broadcast_log(f"🛑 Cancelling job {job_id}...", "warning", channel=job_id)
+    return {"success": True, "message": f"Job {job_id} cancellation requested"}
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Per-stage latency histograms, call/error counts and byte/token counters in Prometheus text format"""
+    lines = [metrics.prometheus()]
+    lines.append("# TYPE leads_jobs gauge")
+    for status, job_count in job_manager.counts().items():
+        lines.append(f'leads_jobs{{status="{status}"}} {job_count}')
+    ws_stats = broadcaster.stats()
+    lines.append("# TYPE leads_websocket_clients gauge")
+    lines.append(f"leads_websocket_clients {ws_stats['clients']}")
+    lines.append("# TYPE leads_websocket_dropped_logs_total counter")
+    lines.append(f"leads_websocket_dropped_logs_total {ws_stats['dropped_logs']}")
+    return PlainTextResponse('\n'.join(lines) + '\n', media_type="text/plain; version=0.0.4")
+
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket for real-time updates"""
+async def websocket_endpoint(websocket: WebSocket, job: Optional[str] = None):
+    """
+    WebSocket for real-time updates
+    
+    Without ?job=<id> the client receives every message. With it (or after
+    sending {"subscribe": "<id>"}) it receives only that job's messages plus
+    global ones. Sends go through a bounded per-client queue.
+    """
     await websocket.accept()
-    active_connections.append(websocket)
-    print(f"[WebSocket Debug] New connection added. Total connections: {len(active_connections)}")
+    client = broadcaster.connect(websocket, channels=[job] if job else None)
     
     try:
         while True:
-            await websocket.receive_text()
+            text = await websocket.receive_text()
+            try:
+                command = json.loads(text)
+            except ValueError:
+                continue
+            if isinstance(command, dict):
+                if command.get('subscribe'):
+                    client.subscribe(str(command['subscribe']))
+                if command.get('unsubscribe'):
+                    client.unsubscribe(str(command['unsubscribe']))
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
-        print(f"[WebSocket Debug] Connection removed. Total connections: {len(active_connections)}")
+        pass
+    finally:
+        broadcaster.disconnect(client)
 
 @app.get("/api/test-websocket")
 async def test_websocket():
     """Test endpoint to verify WebSocket functionality"""
     await broadcast_log("🧪 WebSocket test message", "info")
-    return {"success": True, "message": "WebSocket test sent", "connections": len(active_connections)}
+    return {"success": True, "message": "WebSocket test sent", "connections": broadcaster.client_count,
+            "stats": broadcaster.stats()}
 
-async def broadcast_log(message: str, log_type: str = "info"):
-    """Broadcast log message to all connected WebSocket clients"""
-    print(f"[WebSocket Debug] Broadcasting: {message} (type: {log_type})")
-    print(f"[WebSocket Debug] Active connections: {len(active_connections)}")
-    
-    if active_connections:
-        message_data = {
-            "type": "log",
-            "log_type": log_type,
-            "message": message,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        for connection in active_connections:
-            try:
-                await connection.send_text(json.dumps(message_data))
-                print(f"[WebSocket Debug] Message sent successfully")
-            except Exception as e:
-                print(f"[WebSocket Debug] Failed to send message: {e}")
-                continue
-    else:
-        print(f"[WebSocket Debug] No active connections to broadcast to")
+def job_channel() -> Optional[str]:
+    """Channel of the job running in the current task, if any"""
+    job = current_job.get()
+    return job.id if job else None
+
+async def broadcast_log(message: str, log_type: str = "info", channel: Optional[str] = None):
+    """Broadcast log message to WebSocket clients (the current job's channel by default)"""
+    broadcaster.publish_log(message, log_type, channel or job_channel())
 
-async def run_search(query: str):
+async def run_search(job: Job, query: str) -> Dict[str, Any]:
     """Run search using chat agent with real-time logging"""
-    global scraper_instance
-    
     try:
         await broadcast_log("🚀 Starting Professional Investor Leads Generator...", "info")
         await broadcast_log(f"📝 Processing query: {query}", "info")
@@ -302,12 +307,12 @@ async def run_search(query: str):
         await broadcast_log("🤖 Using AI Chat Agent...", "info")
         
         # Initialize chat agent
-        chat_agent = ProfessionalInvestorAgent()
-        agent_response = chat_agent.process_user_query(query)
+        chat_agent = await run_blocking(ProfessionalInvestorAgent)
+        agent_response = await run_blocking(chat_agent.process_user_query, query)
         
         if not agent_response['success']:
             await broadcast_log(f"❌ {agent_response['message']}", "error")
-            return
+            raise RuntimeError(agent_response['message'])
         
         # Display agent's response
         await broadcast_log(agent_response['message'], "success")
@@ -332,176 +337,149 @@ async def run_search(query: str):
         # Process with batch extractor
         await broadcast_log(f"🔄 Starting executive extraction for {agent_response['companies_found']} companies...", "info")
         
-        # Use the JSON data from chat agent
-        json_data = agent_response['json_data']
-        
-        # Initialize batch extractor and process
-        batch_instance = BatchExtractor()
-        batch_instance.run(source='json', json_data=json_data)
+        batch_extractor = await run_blocking(BatchExtractor)
+        result = await process_companies(job, batch_extractor, companies)
         
         await broadcast_log("🎉 Processing completed!", "success")
         await broadcast_log("📁 Check executives.csv and executives_detailed.csv for results", "info")
+        return result
         
     except Exception as e:
         await broadcast_log(f"❌ Error during processing: {str(e)}", "error")
+        raise
 
+async def process_companies(job: Job, batch_extractor: BatchExtractor, companies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extract executives company by company, recording progress on the job, then export them"""
+    job.companies_total = len(companies)
+    all_executives = []
+    
+    for i, company in enumerate(companies):
+        try:
+            job.start_company(company['name'])
+            await broadcast_log(f"Processing company {i+1}/{len(companies)}: {company['name']}", "info")
+            
+            # Process company
+            company_executives = await run_blocking(batch_extractor.process_single_company, company)
+            all_executives.extend(company_executives)
+            
+            job.company_done(len(company_executives))
+            publish_job_update(job)
+            await broadcast_log(f"✅ Processed {company['name']}: {len(company_executives)} executives found", "success")
+            
+            # Delay between companies
+            if i < len(companies) - 1:
+                await asyncio.sleep(BATCH_CONFIG['delay_between_companies'])
+            
+        except Exception as e:
+            job.company_done(failed=True)
+            publish_job_update(job)
+            await broadcast_log(f"❌ Error processing {company['name']}: {e}", "error")
+            continue
+    
+    result = {"executives_found": len(all_executives), "csv_file": None, "detailed_csv": None}
+    
+    # Export results
+    if all_executives:
+        await broadcast_log(f"💾 Exporting {len(all_executives)} executives...", "info")
+        
+        # Export to CSV
+        exporter = batch_extractor.data_exporter
+        result["csv_file"] = await run_blocking(exporter.export_to_csv, all_executives, append_mode=True, batch_mode=True)
+        result["detailed_csv"] = await run_blocking(exporter.export_detailed_csv, all_executives, append_mode=True, batch_mode=True)
+        
+        # Generate summary
+        result["summary"] = exporter.generate_summary_report(all_executives)
+        
+        await broadcast_log(f"📁 Files created: {result['csv_file']}, {result['detailed_csv']}", "info")
+        
+        # Broadcast results
+        await broadcast_results(all_executives)
+    
+    return result
 
-
-async def run_batch_processing_json(source: str, json_data: str = None):
+async def run_batch_processing_json(job: Job, source: str, json_data: str = None) -> Dict[str, Any]:
     """Run batch processing for JSON input (chat agent) or CSV"""
-    global batch_instance
-    
     try:
         await broadcast_log("🚀 Starting enhanced batch processing...", "info")
         
         # Initialize batch extractor
-        batch_instance = BatchExtractor()
+        batch_extractor = await run_blocking(BatchExtractor)
         
         # Load companies from specified source
         if source == 'json' and json_data:
-            companies = batch_instance.load_companies_from_json(json_data)
+            companies = await run_blocking(batch_extractor.load_companies_from_json, json_data)
             await broadcast_log(f"📊 Loaded {len(companies)} companies from JSON (chat agent)", "info")
         else:
-            companies = batch_instance.load_companies_from_csv()
+            companies = await run_blocking(batch_extractor.load_companies_from_csv)
             await broadcast_log(f"📊 Loaded {len(companies)} companies from CSV", "info")
         
         if not companies:
             await broadcast_log("❌ No companies found", "error")
-            return
+            raise RuntimeError("No companies found")
         
-        # Process companies
-        all_executives = []
-        processed_count = 0
+        result = await process_companies(job, batch_extractor, companies)
         
-        for i, company in enumerate(companies):
-            try:
-                await broadcast_log(f"Processing company {i+1}/{len(companies)}: {company['name']}", "info")
-                
-                # Process company
-                company_executives = batch_instance.process_single_company(company)
-                all_executives.extend(company_executives)
-                
-                processed_count += 1
-                await broadcast_log(f"✅ Processed {company['name']}: {len(company_executives)} executives found", "success")
-                
-                # Delay between companies
-                if i < len(companies) - 1:
-                    await asyncio.sleep(BATCH_CONFIG['delay_between_companies'])
-                
-            except Exception as e:
-                await broadcast_log(f"❌ Error processing {company['name']}: {e}", "error")
-                continue
-        
-        # Export results
-        if all_executives:
-            await broadcast_log(f"💾 Exporting {len(all_executives)} executives...", "info")
-            
-            # Export to CSV
-            csv_file = batch_instance.data_exporter.export_to_csv(all_executives, append_mode=True, batch_mode=True)
-            detailed_csv = batch_instance.data_exporter.export_detailed_csv(all_executives, append_mode=True, batch_mode=True)
-            
-            # Generate summary
-            summary = batch_instance.data_exporter.generate_summary_report(all_executives)
-            
+        if result["executives_found"]:
             await broadcast_log(f"🎉 Enhanced batch processing completed!", "success")
-            await broadcast_log(f"📁 Files created: {csv_file}, {detailed_csv}", "info")
-            
-            # Broadcast results
-            await broadcast_results(all_executives)
         else:
             await broadcast_log("❌ No executives found during batch processing", "warning")
+        return result
             
     except Exception as e:
         await broadcast_log(f"❌ Enhanced batch processing error: {e}", "error")
+        raise
 
-async def run_batch_processing_csv(file_path: str):
+async def run_batch_processing_csv(job: Job, file_path: str) -> Dict[str, Any]:
     """Run batch processing for uploaded CSV file"""
-    global batch_instance
-    
     try:
         await broadcast_log("🚀 Starting CSV batch processing...", "info")
         await broadcast_log(f"📁 Processing file: {file_path}", "info")
         
         # Initialize batch extractor
-        batch_instance = BatchExtractor()
+        batch_extractor = await run_blocking(BatchExtractor)
         
         # Load companies from the uploaded CSV file using data loader
-        data_loader = batch_instance.data_loader
+        data_loader = batch_extractor.data_loader
         try:
-            data = data_loader.load_from_csv(file_path)
+            data = await run_blocking(data_loader.load_from_csv, file_path)
             companies = data['companies']
             await broadcast_log(f"📊 Loaded {len(companies)} companies from uploaded CSV", "info")
         except Exception as e:
             await broadcast_log(f"❌ Error loading CSV file: {e}", "error")
-            return
+            raise
         
         if not companies:
             await broadcast_log("❌ No companies found in CSV file", "error")
-            return
-        
-        # Process companies
-        all_executives = []
-        processed_count = 0
+            raise RuntimeError("No companies found in CSV file")
         
-        for i, company in enumerate(companies):
-            try:
-                await broadcast_log(f"Processing company {i+1}/{len(companies)}: {company['name']}", "info")
-                
-                # Process company
-                company_executives = batch_instance.process_single_company(company)
-                all_executives.extend(company_executives)
-                
-                processed_count += 1
-                await broadcast_log(f"✅ Processed {company['name']}: {len(company_executives)} executives found", "success")
-                
-                # Delay between companies
-                if i < len(companies) - 1:
-                    await asyncio.sleep(BATCH_CONFIG['delay_between_companies'])
-                
-            except Exception as e:
-                await broadcast_log(f"❌ Error processing {company['name']}: {e}", "error")
-                continue
+        result = await process_companies(job, batch_extractor, companies)
         
-        # Export results
-        if all_executives:
-            await broadcast_log(f"💾 Exporting {len(all_executives)} executives...", "info")
-            
-            # Export to CSV
-            csv_file = batch_instance.data_exporter.export_to_csv(all_executives, append_mode=True, batch_mode=True)
-            detailed_csv = batch_instance.data_exporter.export_detailed_csv(all_executives, append_mode=True, batch_mode=True)
-            
-            # Generate summary
-            summary = batch_instance.data_exporter.generate_summary_report(all_executives)
-            
+        if result["executives_found"]:
             await broadcast_log(f"🎉 CSV batch processing completed!", "success")
-            await broadcast_log(f"📁 Files created: {csv_file}, {detailed_csv}", "info")
-            
-            # Broadcast results
-            await broadcast_results(all_executives)
         else:
             await broadcast_log("❌ No executives found during CSV batch processing", "warning")
+        return result
             
     except Exception as e:
         await broadcast_log(f"❌ CSV batch processing error: {e}", "error")
+        raise
 
-async def run_chat_agent_processing(user_query: str):
+async def run_chat_agent_processing(job: Job, user_query: str) -> Dict[str, Any]:
     """Run chat agent processing with real-time updates"""
-    global chat_agent_instance, batch_instance
-    
     try:
         await broadcast_log("🤖 Starting Professional Investor Leads Generator...", "info")
         await broadcast_log(f"📝 Processing your request: {user_query}", "info")
         
         # Initialize chat agent
-        chat_agent_instance = ProfessionalInvestorAgent()
+        chat_agent = await run_blocking(ProfessionalInvestorAgent)
         
         # Step 1: Analyze query and find companies
         await broadcast_log("🔍 Step 1: AI Agent analyzing your query and researching companies...", "info")
-        agent_response = chat_agent_instance.process_user_query(user_query)
+        agent_response = await run_blocking(chat_agent.process_user_query, user_query)
         
         if not agent_response['success']:
             await broadcast_log(f"❌ {agent_response['message']}", "error")
-            return
+            raise RuntimeError(agent_response['message'])
         
         # Display agent's response
         await broadcast_log(agent_response['message'], "success")
@@ -510,94 +488,82 @@ async def run_chat_agent_processing(user_query: str):
         await broadcast_log(f"🔄 Step 2: Starting executive extraction for {agent_response['companies_found']} companies...", "info")
         
         # Use the JSON data from chat agent
-        json_data = agent_response['json_data']
-        
-        # Initialize batch extractor and process
-        batch_instance = BatchExtractor()
-        batch_instance.run(source='json', json_data=json_data)
+        batch_extractor = await run_blocking(BatchExtractor)
+        companies = await run_blocking(batch_extractor.load_companies_from_json, agent_response['json_data'])
+        result = await process_companies(job, batch_extractor, companies)
         
         await broadcast_log("🎉 Chat agent processing completed successfully!", "success")
         await broadcast_log("📁 Check executives.csv and executives_detailed.csv for results", "info")
+        return result
         
     except Exception as e:
         await broadcast_log(f"❌ Chat agent processing error: {e}", "error")
+        raise
 
 async def save_companies_to_csv(companies: List[Dict[str, Any]]) -> None:
     """Save identified companies to companies_in_uae.csv file"""
     try:
-        import csv
-        import os
-        from datetime import datetime
-        
-        filename = "companies_in_uae.csv"
-        
-        # Check if file exists to determine if we need headers
-        file_exists = os.path.exists(filename)
-        
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'city', 'country', 'industry', 'source', 'date_added']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write headers if file is new
-            if not file_exists:
-                writer.writeheader()
-            
-            # Add companies with metadata
-            for company in companies:
-                company_data = {
-                    'name': company.get('name', ''),
-                    'city': company.get('city', ''),
-                    'country': company.get('country', ''),
-                    'industry': company.get('industry', ''),
-                    'source': 'chat_agent',
-                    'date_added': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                writer.writerow(company_data)
+        await run_blocking(append_companies_to_csv, companies)
         
         # Save silently without logging
         
     except Exception as e:
         await broadcast_log(f"❌ Error saving companies to CSV: {e}", "error")
 
+def append_companies_to_csv(companies: List[Dict[str, Any]]) -> None:
+    """Append companies with metadata to companies_in_uae.csv (blocking file I/O)"""
+    import csv
+    
+    filename = "companies_in_uae.csv"
+    
+    # Check if file exists to determine if we need headers
+    file_exists = os.path.exists(filename)
+    
+    with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['name', 'city', 'country', 'industry', 'source', 'date_added']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        
+        # Write headers if file is new
+        if not file_exists:
+            writer.writeheader()
+        
+        # Add companies with metadata
+        for company in companies:
+            company_data = {
+                'name': company.get('name', ''),
+                'city': company.get('city', ''),
+                'country': company.get('country', ''),
+                'industry': company.get('industry', ''),
+                'source': 'chat_agent',
+                'date_added': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            writer.writerow(company_data)
+
 async def broadcast_results(executives: List[Dict[str, Any]]):
     """Broadcast search results to WebSocket clients"""
-    if active_connections:
-        results_data = {
-            "type": "results",
-            "executives": executives,
-            "count": len(executives),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        for connection in active_connections:
-            try:
-                await connection.send_text(json.dumps(results_data))
-            except:
-                continue
+    broadcaster.publish({
+        "type": "results",
+        "executives": executives,
+        "count": len(executives),
+        "timestamp": datetime.now().isoformat()
+    }, job_channel())
 
 async def broadcast_companies(companies: List[Dict[str, Any]]):
     """Broadcast companies to WebSocket clients"""
-    if active_connections:
-        companies_data = {
-            "type": "companies",
-            "companies": companies,
-            "count": len(companies),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        for connection in active_connections:
-            try:
-                await connection.send_text(json.dumps(companies_data))
-            except:
-                continue
+    broadcaster.publish({
+        "type": "companies",
+        "companies": companies,
+        "count": len(companies),
+        "timestamp": datetime.now().isoformat()
+    }, job_channel())
 
 @app.post("/api/extract-basic")
 async def extract_basic_contacts(request: SearchRequest):
     """Extract companies and basic executive info (no enrichment)"""
     try:
         await broadcast_log("🚀 Starting search...", "info")
-        chat_agent = ProfessionalInvestorAgent()
-        agent_response = chat_agent.process_user_query(request.query)
+        chat_agent = await run_blocking(ProfessionalInvestorAgent)
+        agent_response = await run_blocking(chat_agent.process_user_query, request.query)
         if not agent_response['success']:
             await broadcast_log(f"❌ {agent_response['message']}", "error")
             return {"success": False, "error": agent_response['message']}
@@ -623,10 +589,10 @@ async def extract_basic_contacts(request: SearchRequest):
         from content_scraper import ContentScraper
         from batch_extractor import BatchExtractor
         
-        searcher = SerpAPISearcher()
-        scraper = ContentScraper()
-        extractor = ExecutiveExtractor()
-        batch_extractor = BatchExtractor()  # Use BatchExtractor for query generation
+        searcher = await run_blocking(SerpAPISearcher)
+        scraper = await run_blocking(ContentScraper)
+        extractor = await run_blocking(ExecutiveExtractor)
+        batch_extractor = await run_blocking(BatchExtractor)  # Use BatchExtractor for query generation
         
         all_executives = []
         
@@ -636,7 +602,7 @@ async def extract_basic_contacts(request: SearchRequest):
             
             # Generate search queries for this company using BatchExtractor
             await broadcast_log(f"🔍 Generating search queries for {company_name}...", "info")
-            queries = batch_extractor.generate_company_queries(company)
+            queries = await run_blocking(batch_extractor.generate_company_queries, company)
             
             company_executives = []
             max_retries = config.BATCH_CONFIG.get('max_retry_attempts', 3)
@@ -650,7 +616,7 @@ async def extract_basic_contacts(request: SearchRequest):
                 await broadcast_log(f"🎯 Attempt {query_index + 1}/{max_retries}: {query[:60]}...", "info")
                 
                 # Search for articles with limited results
-                search_results = searcher.search_google(query, max_results=5)  # Increased to 5 for better coverage
+                search_results = await run_blocking(searcher.search_google, query, max_results=5, query_class='executive_team')  # Increased to 5 for better coverage
                 
                 # Broadcast found results to show progress
                 for result in search_results:
@@ -667,7 +633,7 @@ async def extract_basic_contacts(request: SearchRequest):
                 for i, result in enumerate(search_results):
                     try:
                         await broadcast_log(f"📄 Processing source {i+1}/{len(search_results)}...", "info")
-                        article = scraper.process_single_article(result['url'])
+                        article = await run_blocking(scraper.process_single_article, result['url'])
                         if article and len(article.get('text', '')) < 50000:  # Skip very large content
                             articles.append(article)
                             await broadcast_log(f"✅ Source {i+1} processed successfully", "success")
@@ -683,14 +649,9 @@ async def extract_basic_contacts(request: SearchRequest):
                 
                 # Extract basic executives from articles with reduced target
                 await broadcast_log(f"🤖 Analyzing executive information from {len(articles)} sources...", "info")
-                # Temporarily override target for basic extraction
-                original_target = config.BATCH_CONFIG.get('target_executives_per_company', 5)
-                config.BATCH_CONFIG['target_executives_per_company'] = 3  # Reduce target for speed
-                
-                executives = extractor.extract_executives_basic_from_articles(articles)
-                
-                # Restore original target
-                config.BATCH_CONFIG['target_executives_per_company'] = original_target
+                # Reduced target for speed, passed per call so concurrent jobs keep the configured one
+                executives = await run_blocking(extractor.extract_executives_basic_from_articles, articles,
+                                                target_executive_count=3)
                 
                 if executives:
                     company_executives.extend(executives)
@@ -720,11 +681,11 @@ async def enrich_contacts(executives: list = Body(...)):
     """Enrich basic contacts with LinkedIn/email and save to CSV"""
     try:
         await broadcast_log("🔍 Starting enrichment of contacts...", "info")
-        batch = BatchExtractor()
-        enriched = batch.executive_extractor._enrich_executives(executives)
+        batch = await run_blocking(BatchExtractor)
+        enriched = await run_blocking(batch.executive_extractor._enrich_executives, executives)
         # Save to CSV
         exporter = DataExporter()
-        exporter.export_to_csv(enriched, append_mode=True, batch_mode=True)
+        await run_blocking(exporter.export_to_csv, enriched, append_mode=True, batch_mode=True)
         await broadcast_log(f"✅ Enriched and saved {len(enriched)} contacts.", "success")
         await broadcast_results(enriched)
         return {"success": True, "executives": enriched}
@@ -737,7 +698,7 @@ async def save_basic_contacts(executives: list = Body(...)):
     """Save basic contacts to CSV (no enrichment)"""
     try:
         exporter = DataExporter()
-        exporter.export_to_csv(executives, append_mode=True, batch_mode=True)
+        await run_blocking(exporter.export_to_csv, executives, append_mode=True, batch_mode=True)
         await broadcast_log(f"✅ Saved {len(executives)} basic contacts to CSV.", "success")
         return {"success": True}
     except Exception as e:
@@ -782,6 +743,14 @@ SCRAPING_CONFIG = {{
     'delay_between_requests': 2,
     'timeout': 30,
     'max_retries': 3,
+    'connect_timeout': 5,
+    'read_timeout': 15,
+    'max_concurrent_fetches': 8,  # Pages in flight across all domains
+    'per_domain_concurrency': 2,  # Pages in flight per domain (also the per-host pool size)
+    'per_domain_delay': 0.5,  # Minimum seconds between request starts to one domain
+    'max_page_bytes': 2 * 1024 * 1024,  # Downloads are aborted beyond this size
+    'allowed_content_types': ['text/html', 'application/xhtml+xml', 'text/plain'],
+    'html_backend': 'auto',  # 'lxml', 'bs4' or 'auto' (lxml when installed)
     'user_agents': [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -789,6 +758,15 @@ SCRAPING_CONFIG = {{
     ]
 }}
 
+# Search Configuration
+SEARCH_CONFIG = {{
+    'backend_url': os.getenv('SERPAPI_BACKEND_URL'),  # Override SerpAPI host (e.g. a local fake server)
+    'max_concurrent_searches': 4,
+    'requests_per_minute': 60,  # Shared token bucket sized to the SerpAPI plan
+    'burst': 5,
+    'concurrent_multi_query': True
+}}
+
 # Output Configuration
 OUTPUT_CONFIG = {{
     'csv_filename': 'executives.csv',
@@ -799,11 +777,13 @@ OUTPUT_CONFIG = {{
 BATCH_CONFIG = {{
     'companies_csv_file': 'companies_in_uae.csv',
     'progress_file': 'batch_progress.json',
+    'metrics_report_file': 'batch_metrics.json',  # Per-run stage timings, written next to progress_file
     'log_file': 'batch_logs.txt',
     'country_filter': 'UAE',
     'max_results_per_company': 5,
     'delay_between_companies': {BATCH_CONFIG.get('delay_between_companies', 3)},
     'delay_between_queries': {BATCH_CONFIG.get('delay_between_queries', 2)},
+    'delay_between_executives': {BATCH_CONFIG.get('delay_between_executives', 2)},  # Pause between enrichment searches of one company's executives
     'max_retries_per_company': 2,
     'recent_days_threshold': 7,
     'batch_mode_flag': 'Yes',
@@ -816,7 +796,88 @@ BATCH_CONFIG = {{
     'max_results_per_query': {BATCH_CONFIG.get('max_results_per_query', 5)},
     'enable_early_termination': {BATCH_CONFIG.get('enable_early_termination', True)},
     'enable_duplicate_prevention': {BATCH_CONFIG.get('enable_duplicate_prevention', True)},
-    'quality_threshold': {BATCH_CONFIG.get('quality_threshold', 0.7)}
+    'quality_threshold': {BATCH_CONFIG.get('quality_threshold', 0.7)},
+    
+    # Parallel processing settings
+    'max_workers': {BATCH_CONFIG.get('max_workers', 1)},  # Companies processed concurrently (overridden by --workers)
+    'web_pipeline_threads': {BATCH_CONFIG.get('web_pipeline_threads', 4)},  # Threads running blocking pipeline steps for the web app
+    'max_concurrent_jobs': {BATCH_CONFIG.get('max_concurrent_jobs', 2)},  # Web app jobs running at once; later submissions queue
+    'max_finished_jobs': {BATCH_CONFIG.get('max_finished_jobs', 100)},  # Finished jobs kept for /api/jobs
+    'ws_max_queue': {BATCH_CONFIG.get('ws_max_queue', 1000)},  # Messages queued per WebSocket client before logs are dropped
+    'ws_send_timeout': {BATCH_CONFIG.get('ws_send_timeout', 10)},  # Seconds before a stalled client is disconnected
+    'service_concurrency': {BATCH_CONFIG.get('service_concurrency', {'serpapi': 4, 'http': 8, 'openai': 4})}
+}}
+
+# spaCy NER Configuration (rule-based extraction next to OpenAI)
+NER_CONFIG = {{
+    'model': 'en_core_web_sm',
+    'keep_components': ['ner'],  # Every other pipe is disabled, except embedding layers these listen to
+    'batch_size': 16,  # Articles per nlp.pipe batch
+    'n_process': 1,  # Worker processes for nlp.pipe (only pays off for large batches)
+    'window_chars': 200  # NER runs only on text this close to a CXO title mention
+}}
+
+# LLM Extraction Input Configuration (what part of a page the extraction prompt contains)
+LLM_INPUT_CONFIG = {{
+    'token_budget': 1000,  # Approximate article tokens per extraction prompt
+    'chars_per_token': 4,  # Rough estimate for English text
+    'window_chars': 150,  # Text kept on each side of a CXO title or person mention
+    'request_token_budget': 4000,  # Article tokens packed into one extraction request
+    'max_articles_per_request': 8,
+    'parallel_requests': 2  # Packed requests of one company sent at once
+}}
+
+# OpenAI Gateway Configuration (every LLM call; concurrency cap is BATCH_CONFIG['service_concurrency']['openai'])
+LLM_GATEWAY_CONFIG = {{
+    'requests_per_minute': 500,  # Size to the account's rate limits
+    'tokens_per_minute': 200000,  # Prompt estimate plus max_tokens per request
+    'burst_seconds': 10,  # Limiter capacity in seconds of rate
+    'timeout_seconds': 60,
+    'max_retries': 5,  # On 429, 5xx, timeouts and connection errors
+    'backoff_base_seconds': 1,  # Doubles per retry, with jitter; a longer Retry-After wins
+    'backoff_max_seconds': 30
+}}
+
+# Cache Configuration
+CACHE_CONFIG = {{
+    'enabled': True,
+    'db_path': 'cache/cache.sqlite3',
+
+    # SerpAPI result cache, TTL in seconds per query class
+    'search_ttl_seconds': {{
+        'executive_team': 7 * 24 * 3600,
+        'enrichment': 30 * 24 * 3600,
+        'default': 7 * 24 * 3600
+    }},
+    'search_max_entries': 50000,
+    'search_max_bytes': 200 * 1024 * 1024,
+    
+    # Page cache (compressed HTML + extracted article), revalidated with ETag/Last-Modified
+    'page_fresh_seconds': 6 * 3600,  # Reuse without any request while younger than this
+    'page_ttl_seconds': 30 * 24 * 3600,
+    'page_max_entries': 20000,
+    'page_max_bytes': 500 * 1024 * 1024,
+    
+    # OpenAI response cache, keyed on (model, messages, params)
+    'llm_ttl_seconds': 30 * 24 * 3600,
+    'llm_max_entries': 100000,
+    'llm_max_bytes': 200 * 1024 * 1024
+}}
+
+# Lead Store Configuration (SQLite system of record; CSV files remain export formats)
+STORE_CONFIG = {{
+    'enabled': True,
+    'db_path': 'leads.sqlite3',
+    'import_csv_on_first_use': True,  # Load executives.csv into an empty store
+    'search_candidate_limit': 1000  # Full-text matches ranked per query (newest first)
+}}
+
+# Record/replay of external traffic (SerpAPI, page downloads, OpenAI) for deterministic re-runs
+CASSETTE_CONFIG = {{
+    'mode': os.getenv('LEADS_CASSETTE_MODE'),  # 'record', 'replay' or None for live traffic
+    'path': os.getenv('LEADS_CASSETTE', 'cassettes/cassette.sqlite3'),
+    'replay_latency': os.getenv('LEADS_CASSETTE_LATENCY', 'recorded'),  # 'recorded' timings or fixed seconds per exchange
+    'latency_scale': 1.0  # Multiplier applied to recorded timings on replay
 }}
 '''
     
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+WebSocket Broadcaster Module
+Fans messages out to WebSocket clients through bounded per-client queues,
+so one slow or dead browser tab never slows the pipeline or other clients
+"""
+
+import json
+import time
+import asyncio
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+
+from config import BATCH_CONFIG
+
+# Close codes sent to pruned clients: too slow to keep up (policy) or a failed send (server error)
+CLOSE_TOO_SLOW = 1008
+CLOSE_SEND_FAILED = 1011
+
+
+class ClientConnection:
+    """
+    One connected client: its channel subscriptions, send queue and sender task
+
+    channels=None subscribes to everything. Log messages beyond max_queue are
+    dropped and later replaced by a single "N log messages skipped" line;
+    other message types (results, companies, job updates) are always queued.
+    A client whose queue still grows past twice the limit, or whose current
+    send has been pending longer than send_timeout, is disconnected on the
+    next publish.
+    """
+
+    def __init__(self, broadcaster: 'Broadcaster', websocket, channels: Optional[Iterable[str]] = None):
+        self.broadcaster = broadcaster
+        self.websocket = websocket
+        self.channels: Optional[Set[str]] = set(channels) if channels else None
+        self.queue: deque = deque()
+        self.skipped_logs = 0
+        self.sent = 0
+        self.closed = False
+        self._sending_since: Optional[float] = None
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._sender())
+
+    def wants(self, channel: Optional[str]) -> bool:
+        return channel is None or self.channels is None or channel in self.channels
+
+    def subscribe(self, channel: str):
+        if self.channels is None:
+            self.channels = set()
+        self.channels.add(channel)
+
+    def unsubscribe(self, channel: str):
+        if self.channels is not None:
+            self.channels.discard(channel)
+
+    def enqueue(self, text: str, is_log: bool) -> bool:
+        """Queue a serialized message; returns False if it was dropped"""
+        if self._sending_since is not None and time.monotonic() - self._sending_since > self.broadcaster.send_timeout:
+            self.broadcaster.disconnect(self, reason='send timed out', code=CLOSE_TOO_SLOW)
+            return False
+
+        max_queue = self.broadcaster.max_queue
+        if is_log and len(self.queue) >= max_queue:
+            self.skipped_logs += 1
+            self.broadcaster.dropped += 1
+            return False
+
+        if len(self.queue) >= 2 * max_queue:
+            self.broadcaster.disconnect(self, reason='send queue overflow', code=CLOSE_TOO_SLOW)
+            return False
+
+        if self.skipped_logs:
+            self._append_skipped_notice()
+        self.queue.append(text)
+        self._ready.set()
+        return True
+
+    async def _sender(self):
+        try:
+            while True:
+                await self._ready.wait()
+                while self.queue:
+                    text = self.queue.popleft()
+                    self._sending_since = time.monotonic()
+                    await self.websocket.send_text(text)
+                    self._sending_since = None
+                    self.sent += 1
+                    if not self.queue and self.skipped_logs:
+                        self._append_skipped_notice()
+                self._ready.clear()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.broadcaster.disconnect(self, reason=f"send failed: {e.__class__.__name__}", code=CLOSE_SEND_FAILED)
+
+    def _append_skipped_notice(self):
+        """Replace the log lines dropped while the queue was full with one summary line"""
+        notice = log_message(f"⚠️ {self.skipped_logs} log messages skipped (client too slow)", "warning")
+        self.queue.append(json.dumps(notice))
+        self.skipped_logs = 0
+
+    def close(self):
+        self.closed = True
+        self.queue.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    async def close_socket(self, code: int, timeout: float):
+        """End the WebSocket so the browser sees the close and can reconnect"""
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code), timeout)
+        except Exception:
+            pass  # Already closed or the transport is gone
+
+
+class Broadcaster:
+    """
+    Non-blocking publish/subscribe over WebSocket connections
+
+    publish() serializes a message once and appends it to every matching
+    client's queue without awaiting anything; each client drains its own
+    queue in a sender task, so fan-out is concurrent and a slow client only
+    delays itself. All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, max_queue: int = None, send_timeout: float = None):
+        self.max_queue = max_queue or BATCH_CONFIG.get('ws_max_queue', 1000)
+        self.send_timeout = send_timeout or BATCH_CONFIG.get('ws_send_timeout', 10)
+        self.clients: Set[ClientConnection] = set()
+        self._closing: Set[asyncio.Task] = set()
+        self.published = 0
+        self.dropped = 0
+        self.pruned = 0
+
+    def connect(self, websocket, channels: Optional[Iterable[str]] = None) -> ClientConnection:
+        """Register an accepted WebSocket; must be called from the event loop"""
+        client = ClientConnection(self, websocket, channels)
+        self.clients.add(client)
+        print(f"🔌 WebSocket connected ({len(self.clients)} clients)")
+        return client
+
+    def disconnect(self, client: ClientConnection, reason: Optional[str] = None, code: int = CLOSE_TOO_SLOW):
+        """
+        Remove a client and stop its sender; safe to call more than once
+
+        A client pruned with a reason also has its WebSocket closed with
+        code, which ends the /ws handler's receive loop.
+        """
+        if client.closed:
+            return
+        client.close()
+        self.clients.discard(client)
+        if reason:
+            self.pruned += 1
+            task = asyncio.create_task(client.close_socket(code, self.send_timeout))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            print(f"🔌 WebSocket dropped: {reason} ({len(self.clients)} clients)")
+        else:
+            print(f"🔌 WebSocket disconnected ({len(self.clients)} clients)")
+
+    def publish(self, message: Dict[str, Any], channel: Optional[str] = None) -> int:
+        """
+        Queue a message for every client subscribed to channel
+
+        Messages without a channel go to all clients. Returns how many
+        clients accepted the message.
+        """
+        if not self.clients:
+            return 0
+
+        if channel is not None:
+            message = {**message, 'channel': channel}
+        text = json.dumps(message)
+        is_log = message.get('type') == 'log'
+        self.published += 1
+
+        delivered = 0
+        for client in list(self.clients):
+            if client.wants(channel) and client.enqueue(text, is_log):
+                delivered += 1
+        return delivered
+
+    def publish_log(self, message: str, log_type: str = "info", channel: Optional[str] = None) -> int:
+        return self.publish(log_message(message, log_type), channel)
+
+    @property
+    def client_count(self) -> int:
+        return len(self.clients)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'clients': len(self.clients),
+            'published': self.published,
+            'dropped_logs': self.dropped,
+            'pruned_clients': self.pruned,
+            'queued': sum(len(client.queue) for client in self.clients)
+        }
+
+
+def log_message(message: str, log_type: str = "info") -> Dict[str, Any]:
+    """The log message shape the web UI renders"""
+    return {
+        "type": "log",
+        "log_type": log_type,
+        "message": message,
+        "timestamp": datetime.now().isoformat()
+    }